@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Asset Build
+증분 빌드 - 입력 지문 + 매니페스트로 변경 없는 에셋은 다시 렌더링하지 않음
+"""
+
+import hashlib
+import inspect
+import io
+import json
+import os
+import types
+
+MANIFEST_PATH = ".asset_manifest.json"
+
+# 결정적 PNG 인코딩 설정 (타임스탬프/메타데이터 없음, 압축 고정)
+PNG_PARAMS = {"compress_level": 9, "optimize": False}
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _part_digest(part):
+    """지문 구성 요소 하나를 안정적인 문자열로 변환"""
+    if isinstance(part, (types.FunctionType, types.ModuleType, type)):
+        return "src:" + sha256_bytes(inspect.getsource(part).encode('utf-8'))
+    if isinstance(part, bytes):
+        return "bytes:" + sha256_bytes(part)
+    if isinstance(part, FileInput):
+        if os.path.exists(part.path):
+            return f"file:{part.path}:{sha256_file(part.path)}"
+        return f"file:{part.path}:missing"
+    return "repr:" + repr(part)
+
+
+class FileInput:
+    """내용으로 지문을 계산할 입력 파일 (폰트 등)"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __repr__(self):
+        return f"FileInput({self.path!r})"
+
+
+def fingerprint(*parts):
+    """함수 소스, 팔레트 상수, 사이즈 테이블, 폰트 파일 등으로 입력 지문 계산"""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(_part_digest(part).encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def encode_png(img, params=PNG_PARAMS):
+    """결정적 PNG 인코딩 - 같은 픽셀이면 항상 같은 바이트"""
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', **params)
+    return buf.getvalue()
+
+
+def atomic_write(path, data):
+    """임시 파일에 쓰고 rename - 중단돼도 반쯤 쓴 파일이 남지 않음"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def encode_json(obj):
+    return (json.dumps(obj, indent=2) + "\n").encode('utf-8')
+
+
+class AssetBuild:
+    """출력 경로별 지문/해시를 매니페스트에 기록하고 변경된 출력만 기록
+
+    store (blob_store.BlobStore) 가 있으면 출력 바이트는 저장소에 한 번만 두고 경로는 링크로 연결한다.
+    """
+
+    def __init__(self, incremental=False, manifest_path=MANIFEST_PATH, store=None):
+        self.incremental = incremental
+        self.manifest_path = manifest_path
+        self.store = store
+        self.entries = {}
+        self.skipped = 0
+        self.written = 0
+        self.written_paths = []
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.entries = json.load(f).get("outputs", {})
+
+    @staticmethod
+    def _key(path):
+        return os.path.normpath(path).replace(os.sep, '/')
+
+    def _on_disk(self, path, digest):
+        """디스크 파일 해시 - 저장소 링크가 그대로면 읽지 않고 digest"""
+        if self.store and self.store.holds(path, digest):
+            return digest
+        return sha256_file(path) if os.path.exists(path) else None
+
+    def is_fresh(self, path, fp):
+        """지문과 디스크 바이트가 모두 매니페스트와 일치하면 True"""
+        if not self.incremental:
+            return False
+        entry = self.entries.get(self._key(path))
+        if not entry or entry["fingerprint"] != fp or not os.path.exists(path):
+            return False
+        return self._on_disk(path, entry["sha256"]) == entry["sha256"]
+
+    def all_fresh(self, paths_and_fps):
+        return all(self.is_fresh(path, fp) for path, fp in paths_and_fps)
+
+    def skip(self, path):
+        """is_fresh 로 확인한 출력을 건너뜀 - 매니페스트 항목은 그대로 유지"""
+        if self._key(path) not in self.entries:
+            raise KeyError(f"매니페스트에 없는 출력은 건너뛸 수 없음: {path}")
+        self.skipped += 1
+
+    def remove(self, path):
+        """더 이상 만들지 않는 출력 삭제 + 매니페스트 항목 제거 (저장소 blob 은 gc 대상)"""
+        if os.path.exists(path):
+            os.remove(path)
+        self.entries.pop(self._key(path), None)
+        if self.store:
+            self.store.forget(path)
+
+    def encode(self, img, params=PNG_PARAMS):
+        """PNG 인코딩 - 저장소가 있으면 같은 픽셀 + 설정의 이전 결과를 재사용"""
+        return self.store.encode_png(img, params) if self.store else encode_png(img, params)
+
+    def write_bytes(self, path, data, fp):
+        """바이트가 달라졌을 때만 디스크에 쓰고 매니페스트 갱신. 썼으면 True
+
+        디스크 파일이 같은 바이트를 최적화한 결과이면 (png_optimize) 변경 없음으로 본다.
+        저장소 모드에서는 내용이 같아도 아직 링크가 아닌 파일은 blob 에 연결한다 (변경 없음).
+        """
+        digest = sha256_bytes(data)
+        entry = self.entries.get(self._key(path), {})
+        on_disk = self._on_disk(path, entry.get("sha256") or digest)
+        if on_disk and entry.get("source") == digest and entry.get("sha256") == on_disk:
+            self.skipped += 1
+            self.entries[self._key(path)] = {**entry, "fingerprint": fp}
+            return False
+        changed = on_disk != digest
+        if self.store:
+            if changed or not self.store.holds(path, digest):
+                self.store.put(data, digest)
+                self.store.materialize(digest, path)
+        elif changed:
+            atomic_write(path, data)
+        if changed:
+            self.written += 1
+            self.written_paths.append(path)
+        else:
+            self.skipped += 1
+        self.entries[self._key(path)] = {"fingerprint": fp, "sha256": digest}
+        return changed
+
+    def optimized(self, path, source, digest):
+        """후처리로 다시 쓴 파일 기록 - source 는 원래 인코딩 바이트의 해시"""
+        entry = self.entries[self._key(path)]
+        if digest != entry["sha256"]:
+            entry.update(source=source, sha256=digest)
+            if self.store:
+                self.store.adopt(path, digest)
+
+    def write_png(self, path, img, fp):
+        return self.write_bytes(path, self.encode(img), fp)
+
+    def write_json(self, path, obj, fp):
+        return self.write_bytes(path, encode_json(obj), fp)
+
+    def save(self):
+        """매니페스트는 --incremental 실행에서만 기록 (전체 재생성은 이전 매니페스트를 건드리지 않음)"""
+        if self.incremental:
+            data = {"version": 1, "outputs": dict(sorted(self.entries.items()))}
+            with open(self.manifest_path, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.write("\n")
+        if self.store:
+            self.store.save()
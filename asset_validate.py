@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Asset Validate
+App Store 제출 전 PNG 검사 - IHDR 와 청크 헤더만 읽고 (픽셀 디코딩 없음) 규칙 표와 대조
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+import json
+import os
+import struct
+import sys
+import time
+
+from png_optimize import COLOR_TYPES, PNG_SIGNATURE
+from screenshot_templates import DEVICES
+
+# 기본 검사 대상 - 스크린샷 (커밋된 것 + 생성 출력), 아이콘/스플래시 에셋
+DEFAULT_ROOTS = [
+    "AppStore/Screenshots",
+    "AppStore/screenshots",
+    "VoiceScheduler/Assets.xcassets",
+]
+
+COLOR_NAMES = {v: k for k, v in COLOR_TYPES.items()}
+ALPHA_COLOR_TYPES = (4, 6)
+
+
+# === 규칙 ===
+
+class Rule:
+    """PNG 규칙 - 허용 픽셀 크기 (None = 무관), 알파 채널 허용, 색상 타입, 비트 깊이"""
+
+    def __init__(self, name, sizes=None, alpha=False, color_types=(0, 2, 3, 4, 6), bit_depths=(8,)):
+        self.name = name
+        self.sizes = None if sizes is None else set(sizes)
+        self.alpha = alpha
+        self.color_types = color_types
+        self.bit_depths = bit_depths
+
+    def __repr__(self):
+        return f"Rule({self.name!r})"
+
+
+def screenshot_sizes(devices):
+    """세로 + 가로 (App Store 는 두 방향 모두 받음)"""
+    return [size for name in devices for size in (DEVICES[name], DEVICES[name][::-1])]
+
+
+# 스크린샷 규칙 표 - 위에서부터 처음 맞는 패턴 (상대 경로, '/' 구분)
+# 기기 디렉터리 (<device>/ 또는 <locale>/<device>/) 는 그 기기 크기만, 나머지는 아무 기기 크기
+# 제출 스크린샷은 알파 채널 금지, 기기 캡처는 16비트일 수 있음
+SCREENSHOT_DEPTHS = (8, 16)
+SCREENSHOT_RULES = [
+    (f"*/{name}/*", Rule(f"screenshot {name}", screenshot_sizes([name]), bit_depths=SCREENSHOT_DEPTHS))
+    for name in DEVICES
+] + [
+    ("*/appstore_ready/*", Rule("screenshot", screenshot_sizes(DEVICES), bit_depths=SCREENSHOT_DEPTHS)),
+    ("*AppStore/[Ss]creenshots/*", Rule("screenshot", screenshot_sizes(DEVICES), bit_depths=SCREENSHOT_DEPTHS)),
+]
+
+
+def contents_rules(directory):
+    """에셋 카탈로그 Contents.json -> ({파일명: [Rule]}, 문제 목록)
+
+    아이콘 항목 (size + scale) 은 그 픽셀 크기, 기본 외관은 알파 금지 (create_app_icon 이
+    deep_navy 위로 평탄화하는 이유), 다크/틴트 외관은 알파 허용. 크기가 없는 이미지셋 항목은
+    존재 여부만 본다. 여러 항목이 같은 파일을 가리키면 모든 항목의 규칙을 만족해야 한다.
+    """
+    path = os.path.join(directory, "Contents.json")
+    with open(path, encoding='utf-8') as f:
+        contents = json.load(f)
+    rules, problems = {}, []
+    for entry in contents.get("images", []):
+        filename = entry.get("filename")
+        if not filename:
+            continue
+        if not os.path.exists(os.path.join(directory, filename)):
+            problems.append(f"{path}: {filename} 없음")
+            continue
+        if "size" in entry and filename.lower().endswith(".png"):
+            points = float(entry["size"].split("x")[0])
+            scale = int(entry.get("scale", "1x").rstrip("x"))
+            px = round(points * scale)
+            rule = Rule(f"icon {entry['size']}@{scale}x {entry.get('idiom', '')}".strip(),
+                        [(px, px)], alpha="appearances" in entry)
+        else:
+            rule = Rule("imageset", alpha=True)
+        rules.setdefault(filename, []).append(rule)
+    return rules, problems
+
+
+# === PNG 헤더 ===
+
+def read_png_header(path):
+    """시그니처, IHDR, 청크 헤더 (길이 + 타입) 만 읽음 - 데이터는 건너뜀
+
+    -> {"width", "height", "bit_depth", "color_type", "interlace", "alpha", "chunks", "errors"}
+    """
+    info = {"path": path, "chunks": [], "errors": []}
+    with open(path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if f.read(8) != PNG_SIGNATURE:
+            info["errors"].append("PNG 아님 (시그니처)")
+            return info
+        pos = 8
+        while True:
+            head = f.read(8)
+            if len(head) < 8:
+                info["errors"].append("IEND 없이 끝남")
+                break
+            length, ctype = struct.unpack('>I4s', head)
+            if pos + 12 + length > file_size:
+                info["errors"].append(f"{ctype.decode('latin-1')} 청크 잘림")
+                break
+            if ctype == b'IHDR':
+                w, h, depth, color, _, _, interlace = struct.unpack('>IIBBBBB', f.read(13))
+                info.update(width=w, height=h, bit_depth=depth, color_type=color, interlace=interlace)
+                f.seek(4, 1)
+            else:
+                if not info["chunks"] and ctype != b'CgBI':
+                    info["errors"].append("첫 청크가 IHDR 아님")
+                f.seek(length + 4, 1)
+            info["chunks"].append(ctype.decode('latin-1'))
+            pos += 12 + length
+            if ctype == b'IEND':
+                break
+    if "color_type" in info:
+        info["alpha"] = info["color_type"] in ALPHA_COLOR_TYPES or "tRNS" in info["chunks"]
+    return info
+
+
+def check(info, rule):
+    """헤더 정보를 규칙과 대조 -> 문제 목록"""
+    problems = list(info["errors"])
+    if "width" not in info:
+        return problems or ["IHDR 없음"]
+    size = (info["width"], info["height"])
+    if rule.sizes is not None and size not in rule.sizes:
+        expected = ", ".join(f"{w}x{h}" for w, h in sorted(rule.sizes))
+        problems.append(f"크기 {size[0]}x{size[1]} (허용: {expected})")
+    if info["alpha"] and not rule.alpha:
+        kind = "tRNS" if info["color_type"] not in ALPHA_COLOR_TYPES else COLOR_NAMES[info["color_type"]]
+        problems.append(f"알파 채널 금지 ({kind})")
+    if info["color_type"] not in rule.color_types:
+        problems.append(f"색상 타입 {info['color_type']}")
+    if info["bit_depth"] not in rule.bit_depths:
+        problems.append(f"비트 깊이 {info['bit_depth']}")
+    if "acTL" in info["chunks"]:
+        problems.append("애니메이션 PNG")
+    if "CgBI" in info["chunks"]:
+        problems.append("Xcode 압축 PNG (CgBI)")
+    return problems
+
+
+# === 스캔 ===
+
+def _key(path):
+    return os.path.normpath(path).replace(os.sep, '/')
+
+
+def collect(roots):
+    """검사할 (경로, 규칙) 목록 + Contents.json 문제 - 규칙 없는 PNG 는 형식만 검사"""
+    targets, problems = [], []
+    for root in roots:
+        if os.path.isfile(root):
+            targets.append((root, rule_for(root)))
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            icon_rules = {}
+            if "Contents.json" in filenames:
+                icon_rules, missing = contents_rules(dirpath)
+                problems += missing
+                for name in filenames:
+                    if name.lower().endswith(".png") and name not in icon_rules:
+                        problems.append(f"{_key(os.path.join(dirpath, name))}: Contents.json 에 없는 파일")
+            for name in sorted(filenames):
+                if name.lower().endswith(".png"):
+                    path = os.path.join(dirpath, name)
+                    targets += [(path, rule) for rule in icon_rules.get(name) or [rule_for(path)]]
+    # 대소문자 구분 없는 파일시스템 (macOS) 에서 Screenshots/screenshots 가 같은 디렉터리
+    seen, unique = set(), []
+    for path, rule in targets:
+        real = os.path.realpath(path).lower() if sys.platform == 'darwin' else os.path.realpath(path)
+        if (real, rule.name) not in seen:
+            seen.add((real, rule.name))
+            unique.append((path, rule))
+    return unique, problems
+
+
+def rule_for(path):
+    """스크린샷 규칙 표에서 첫 번째로 맞는 규칙 (없으면 형식만)"""
+    key = _key(path)
+    for pattern, rule in SCREENSHOT_RULES:
+        if fnmatch(key, pattern):
+            return rule
+    return Rule("png", alpha=True)
+
+
+def _check_task(target):
+    path, rule = target
+    try:
+        return path, rule, check(read_png_header(path), rule)
+    except OSError as e:
+        return path, rule, [str(e)]
+
+
+def validate(roots=DEFAULT_ROOTS, jobs=8):
+    """-> ([(경로, 규칙, 문제 목록)], Contents.json 문제 목록) - 파일 헤더는 스레드 풀에서 병렬로"""
+    targets, problems = collect([r for r in roots if os.path.exists(r)])
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        results = list(pool.map(_check_task, targets))
+    return results, problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler App Store PNG 검사 (헤더만)")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_ROOTS, help="검사할 파일/디렉터리")
+    parser.add_argument("--jobs", type=int, default=8, help="헤더 읽기 스레드 수")
+    parser.add_argument("--quiet", action="store_true", help="문제 있는 파일만 출력")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results, problems = validate(args.paths, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    failed = 0
+    for path, rule, issues in results:
+        if issues:
+            failed += 1
+            print(f"  ❌ {_key(path)} [{rule.name}]: {'; '.join(issues)}")
+        elif not args.quiet:
+            print(f"  ✓ {_key(path)} [{rule.name}]")
+    for problem in problems:
+        print(f"  ❌ {problem}")
+    print(f"{len(results)} PNG 검사 ({elapsed * 1000:.0f} ms) - {failed + len(problems)} 문제")
+    sys.exit(1 if failed or problems else 0)
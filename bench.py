@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Benchmarks
+생성기별 시간/메모리 측정 - JSON 기준선과 비교해 회귀 시 실패
+"""
+
+import argparse
+import ctypes
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+
+import PIL
+
+import display_list
+import fonts
+import gradient
+import screenshot_templates
+from generate_app_icon import ICON_REF, ICON_SIZES, create_app_icon, icon_display_list
+from generate_screenshots import SCREENS
+from generate_splash import create_splash_image
+from resize_plan import ResizePlan, render_plan
+from screenshot_templates import DEVICES
+from strip_render import current_rss_mb, peak_rss_mb
+
+BASELINE_PATH = "bench_baseline.json"
+
+# 회귀 판정: 기준선 대비 (1 + threshold) 배를 넘으면 실패
+DEFAULT_THRESHOLD = 0.25
+
+# 이 시간보다 짧은 측정은 잡음이 커서 시간 회귀 판정에서 제외
+MIN_SECONDS = 0.005
+
+
+def reset_caches():
+    """그라데이션/폰트 레이아웃/컴파일된 템플릿 캐시 비우기 (콜드 측정)"""
+    gradient.clear_cache()
+    fonts.clear_cache()
+    screenshot_templates.compile_screen.cache_clear()
+    screenshot_templates.load_spec.cache_clear()
+
+
+# === 측정 대상 ===
+
+def icon_case(size):
+    return lambda: create_app_icon(size)
+
+
+def splash_case(size):
+    return lambda: create_splash_image(size, size)
+
+
+def replay_case(dl, size):
+    """디스플레이 리스트 재생만 (기록/캐시 읽기는 제외) - 1024 = 아이콘 마스터, 그 아래는 --direct-below 경로"""
+    return lambda: display_list.replay(dl, size)
+
+
+def icon_set_case(dl):
+    """생성기의 아이콘 세트 경로 - 1024 마스터 재생 + 피라미드 축소/인코딩 (디스크 쓰기 제외)"""
+    return lambda: render_plan(display_list.replay(dl, ICON_REF), ResizePlan(ICON_SIZES))
+
+
+def screen_case(gen, device):
+    return lambda: gen(device)
+
+
+def cases(only=None):
+    """(이름, 크기 라벨, 호출) 목록 - 각 생성기를 여러 크기로 (재생 대상은 디스플레이 리스트 경로)"""
+    def wanted(name):
+        return not only or name in only
+
+    out = []
+    for size in (256, 512, 1024):
+        out.append(("icon", str(size), icon_case(size)))
+    if wanted("icon-replay") or wanted("icon-set"):
+        icon_dl = icon_display_list()
+        for size in (256, 512, 1024):
+            out.append(("icon-replay", str(size), replay_case(icon_dl, size)))
+        out.append(("icon-set", str(ICON_REF), icon_set_case(icon_dl)))
+    for size in (200, 400, 600):
+        out.append(("splash", str(size), splash_case(size)))
+    for fn, gen in SCREENS:
+        for device in DEVICES:
+            out.append((gen.__name__, device, screen_case(gen, device)))
+    return [c for c in out if not only or c[0] in only]
+
+
+def sweep_cases():
+    """아이콘 해상도 스윕 (128 -> 4096) - 픽셀 수 대비 비용 증가 확인"""
+    return [("icon-sweep", str(size), icon_case(size)) for size in (128, 256, 512, 1024, 2048, 4096)]
+
+
+# === 측정 ===
+
+def reset_peak_rss():
+    """부모가 해제한 힙 (이미 상주) 을 돌려주고 최대 RSS 를 현재 RSS 로 되돌림 (Linux)
+
+    그러지 않으면 재사용한 힙은 증가량에 안 잡히고, 최대 RSS 는 fork 당시 값에 머문다.
+    """
+    libc = ctypes.CDLL(None)
+    if hasattr(libc, "malloc_trim"):
+        libc.malloc_trim(0)
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_kib(func, warm=False):
+    """fork 한 자식 프로세스에서 한 번 실행한 최대 RSS 증가량 (KiB)
+
+    RSS 라 Pillow 이미지 버퍼 (C 할당) 도 포함된다. 자식이라 앞선 측정의 최대치가 섞이지 않는다.
+    """
+    ctx = multiprocessing.get_context('fork')
+    receiver, sender = ctx.Pipe(duplex=False)
+
+    def child():
+        if not warm:
+            reset_caches()
+        reset_peak_rss()
+        before = current_rss_mb()
+        func()
+        sender.send(max(peak_rss_mb() - before, 0) * 1024)
+
+    proc = ctx.Process(target=child)
+    proc.start()
+    peak = receiver.recv()
+    proc.join()
+    return int(peak)
+
+
+def measure(func, repeat=5, warm=False):
+    """반복 실행 시간 (최소/중앙값) + 최대 RSS 증가량
+
+    메모리는 별도 1회 실행 (fork 한 자식 프로세스) 으로 잰다 - 최대 RSS 는 프로세스 단위로만 줄지 않으므로.
+    """
+    times = []
+    for _ in range(repeat):
+        if not warm:
+            reset_caches()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return {"min_s": min(times), "median_s": statistics.median(times), "peak_rss_kib": peak_rss_kib(func, warm)}
+
+
+def run(selected, repeat=5, warm=False):
+    results = {}
+    for name, label, func in selected:
+        key = f"{name}@{label}"
+        results[key] = measure(func, repeat, warm)
+        r = results[key]
+        print(f"  {key:<24} median {r['median_s'] * 1000:9.1f} ms   min {r['min_s'] * 1000:9.1f} ms   peak RSS {r['peak_rss_kib']:>8,} KiB")
+    return results
+
+
+def print_sweep(results):
+    """해상도 스윕 - 1 메가픽셀당 시간"""
+    print()
+    print(f"  {'size':>6} {'median ms':>10} {'ms/MPix':>9} {'RSS KiB':>10}")
+    for key, r in results.items():
+        size = int(key.split('@')[1])
+        mpix = size * size / 1e6
+        print(f"  {size:>6} {r['median_s'] * 1000:>10.1f} {r['median_s'] * 1000 / mpix:>9.1f} {r['peak_rss_kib']:>10,}")
+
+
+# === 기준선 ===
+
+def environment():
+    return {"python": platform.python_version(), "pillow": PIL.__version__, "machine": platform.machine()}
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    data = {"environment": environment(), "results": dict(sorted(results.items()))}
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def compare(results, baseline, threshold):
+    """기준선 대비 회귀 목록 [(키, 지표, 기준, 현재)]"""
+    regressions = []
+    for key, r in results.items():
+        base = baseline["results"].get(key)
+        if not base:
+            continue
+        if base["median_s"] >= MIN_SECONDS and r["median_s"] > base["median_s"] * (1 + threshold):
+            regressions.append((key, "median_s", base["median_s"], r["median_s"]))
+        # tracemalloc 시절 기준선 (peak_kib) 은 RSS 와 비교하지 않음
+        if base.get("peak_rss_kib") and r["peak_rss_kib"] > base["peak_rss_kib"] * (1 + threshold):
+            regressions.append((key, "peak_rss_kib", base["peak_rss_kib"], r["peak_rss_kib"]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 에셋 생성기 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--only", help="측정할 생성기 (쉼표 구분: icon, icon-replay, icon-set, splash, ss1..ss5)")
+    parser.add_argument("--warm", action="store_true", help="반복 사이에 캐시를 비우지 않음")
+    parser.add_argument("--sweep", action="store_true", help="아이콘 해상도 스윕 (128 -> 4096)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help=f"기준선 JSON (기본 {BASELINE_PATH})")
+    parser.add_argument("--save", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"허용 회귀 비율 (기본 {DEFAULT_THRESHOLD} = 25%%)")
+    args = parser.parse_args()
+
+    if args.sweep:
+        print("📈 아이콘 해상도 스윕...")
+        results = run(sweep_cases(), args.repeat, args.warm)
+        print_sweep(results)
+    else:
+        print("⏱ 생성기 벤치마크...")
+        results = run(cases(args.only.split(',') if args.only else None), args.repeat, args.warm)
+
+    baseline = load_baseline(args.baseline)
+    if args.save:
+        if baseline is not None:
+            results = {**baseline["results"], **results}
+        save_baseline(args.baseline, results)
+        print(f"\n💾 기준선 저장: {args.baseline}")
+        sys.exit(0)
+    if baseline is None:
+        # 기준선 없이 통과하면 첫 CI 실행이 항상 성공 - 기록은 --save 로만
+        print(f"\n❌ 기준선 없음: {args.baseline} (--save 로 먼저 기록)")
+        sys.exit(1)
+
+    if baseline["environment"] != environment():
+        print(f"\n⚠️ 기준선 환경이 다름: {baseline['environment']}")
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ 회귀 {len(regressions)}건 (허용 {args.threshold:.0%}):")
+        for key, metric, base, now in regressions:
+            print(f"  {key} {metric}: {base:.4g} -> {now:.4g} ({now / base - 1:+.0%})")
+        sys.exit(1)
+    print(f"\n✅ 회귀 없음 (허용 {args.threshold:.0%})")
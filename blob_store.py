@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Blob Store
+내용 주소 출력 저장소 - 인코딩 바이트를 sha256 으로 한 번만 저장하고 출력 경로는 reflink/하드링크로 연결
+"""
+
+import argparse
+import ctypes
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from asset_build import encode_png, fingerprint, sha256_bytes, sha256_file
+from png_optimize import pixel_hash
+
+STORE_DIR = ".asset_store"
+STORE_VERSION = 1
+
+# 연결 방식 - auto 는 reflink (쓰기 시 복사라 출력을 고쳐도 blob 이 안전) -> 하드링크 -> 복사 순서로 시도
+LINK_MODES = {
+    "auto": ("reflink", "hardlink", "copy"),
+    "reflink": ("reflink", "copy"),
+    "hardlink": ("hardlink", "copy"),
+    "copy": ("copy",),
+}
+
+# Linux FICLONE ioctl (btrfs, xfs, bcachefs ...)
+FICLONE = 0x40049409
+
+
+# === 연결 ===
+
+def _reflink(src, dst):
+    if sys.platform == 'darwin':
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), dst)
+        return
+    import fcntl
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.remove(dst)
+            raise
+
+
+def _hardlink(src, dst):
+    os.link(src, dst)
+
+
+def _copy(src, dst):
+    shutil.copyfile(src, dst)
+
+
+LINKERS = {"reflink": _reflink, "hardlink": _hardlink, "copy": _copy}
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return [st.st_ino, st.st_size, st.st_mtime_ns]
+
+
+# === 저장소 ===
+
+class BlobStore:
+    """sha256 -> blob 파일 + 픽셀 색인 + 출력 경로 참조
+
+    objects/ab/abcdef... 에 인코딩 바이트를 한 번만 저장 (읽기 전용). 같은 픽셀 + 같은 인코딩
+    설정이면 (픽셀 색인) 다시 인코딩하지 않고 blob 을 그대로 쓴다. 출력 경로마다 연결 당시의
+    (inode, 크기, mtime) 을 기록해 다음 실행에서 해시 계산 없이 변경 여부를 판단한다.
+    하드링크 출력은 blob 과 권한을 공유해 읽기 전용 - 제자리 수정이 저장소를 오염시키지 않도록
+    (atomic_write 처럼 rename 으로 바꾸는 쓰기는 링크만 끊음).
+    """
+
+    def __init__(self, root=STORE_DIR, link="auto"):
+        self.root = root
+        self.link = link
+        self.pixels = {}
+        self.refs = {}
+        self.index_path = os.path.join(root, "index.json")
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                data = json.load(f)
+            if data.get("version") == STORE_VERSION:
+                self.pixels = data.get("pixels", {})
+                self.refs = data.get("refs", {})
+
+    @staticmethod
+    def _key(path):
+        return os.path.normpath(path).replace(os.sep, '/')
+
+    def blob_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def has(self, digest):
+        return os.path.exists(self.blob_path(digest))
+
+    # --- blob ---
+
+    def put(self, data, digest=None):
+        """바이트 저장 (이미 있으면 그대로) -> sha256"""
+        digest = digest or sha256_bytes(data)
+        path = self.blob_path(digest)
+        if os.path.exists(path):
+            return digest
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # 스레드마다 다른 임시 파일 - 같은 내용을 동시에 넣어도 rename 이 원자적
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        return digest
+
+    def adopt(self, path, digest):
+        """이미 디스크에 있는 출력 파일을 저장소로 옮기고 경로는 blob 에 연결"""
+        if not self.has(digest):
+            with open(path, 'rb') as f:
+                self.put(f.read(), digest)
+        self.materialize(digest, path)
+
+    def encode_png(self, img, params):
+        """픽셀 해시 + 인코딩 설정이 색인에 있으면 blob 바이트, 없으면 인코딩 후 저장"""
+        key = fingerprint(pixel_hash(img), params)
+        digest = self.pixels.get(key)
+        if digest and self.has(digest):
+            with open(self.blob_path(digest), 'rb') as f:
+                return f.read()
+        data = encode_png(img, params)
+        self.pixels[key] = self.put(data)
+        return data
+
+    # --- 출력 경로 ---
+
+    def materialize(self, digest, path):
+        """blob 을 path 에 연결 (임시 이름으로 만든 뒤 rename) -> 사용한 방식"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        blob = self.blob_path(digest)
+        tmp = f"{path}.{os.getpid()}.link.tmp"
+        for method in LINK_MODES[self.link]:
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+            try:
+                LINKERS[method](blob, tmp)
+                break
+            except OSError:
+                if method == "copy":
+                    raise
+        if method == "copy":
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+        self.refs[self._key(path)] = {"sha256": digest, "stat": _stat_key(path), "link": method}
+        return method
+
+    def forget(self, path):
+        """출력 경로 참조 제거 (삭제한 출력) - blob 은 다른 참조가 없으면 gc 로 정리"""
+        self.refs.pop(self._key(path), None)
+
+    def holds(self, path, digest):
+        """path 가 연결 이후 그대로면 True - stat 만 비교 (해시 없음)"""
+        ref = self.refs.get(self._key(path))
+        if not ref or ref["sha256"] != digest:
+            return False
+        try:
+            return _stat_key(path) == ref["stat"]
+        except OSError:
+            return False
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        data = {"version": STORE_VERSION, "pixels": dict(sorted(self.pixels.items())),
+                "refs": dict(sorted(self.refs.items()))}
+        with open(self.index_path, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+    # --- 정리 / 보고 ---
+
+    def blobs(self):
+        """저장소의 모든 blob -> {sha256: 크기}"""
+        out = {}
+        objects = os.path.join(self.root, "objects")
+        for dirpath, _, filenames in os.walk(objects):
+            for name in filenames:
+                if not name.endswith(".tmp"):
+                    out[name] = os.path.getsize(os.path.join(dirpath, name))
+        return out
+
+    def live_refs(self):
+        """내용이 아직 blob 과 같은 참조만 - 지워졌거나 다른 내용으로 바뀐 출력은 제외"""
+        live = {}
+        for path, ref in self.refs.items():
+            if not os.path.exists(path):
+                continue
+            if self.holds(path, ref["sha256"]) or sha256_file(path) == ref["sha256"]:
+                live[path] = ref
+        return live
+
+    def gc(self, dry_run=False):
+        """살아 있는 참조가 없는 blob 삭제 + 끊긴 참조/색인 정리 -> (삭제 수, 해제 바이트)"""
+        live = self.live_refs()
+        keep = {ref["sha256"] for ref in live.values()}
+        removed, freed = 0, 0
+        for digest, size in self.blobs().items():
+            if digest in keep:
+                continue
+            removed += 1
+            freed += size
+            if not dry_run:
+                os.remove(self.blob_path(digest))
+        if not dry_run:
+            self.refs = live
+            self.pixels = {k: d for k, d in self.pixels.items() if d in keep}
+            self.save()
+        return removed, freed
+
+    def dedup_report(self):
+        """-> {"paths", "blobs", "logical", "unique", "on_disk", "garbage", "shared": [(sha256, 크기, [경로])]}
+
+        logical = 출력 경로 크기 합, unique = 서로 다른 blob 크기 합 (논리적 중복 제거 결과),
+        on_disk = 출력 + 저장소에서 서로 다른 inode 크기 합 (하드링크는 한 번만 - reflink 는
+        inode 가 달라 여기서는 절감으로 보이지 않지만 파일시스템 블록은 공유).
+        """
+        live = self.live_refs()
+        sizes = self.blobs()
+        by_digest = {}
+        for path, ref in live.items():
+            by_digest.setdefault(ref["sha256"], []).append(path)
+        inodes = {}
+        for path in list(live) + [self.blob_path(d) for d in by_digest if d in sizes]:
+            st = os.stat(path)
+            inodes[(st.st_dev, st.st_ino)] = st.st_size
+        shared = sorted(((d, sizes.get(d, 0), sorted(paths)) for d, paths in by_digest.items() if len(paths) > 1),
+                        key=lambda item: -item[1] * (len(item[2]) - 1))
+        return {
+            "paths": len(live),
+            "blobs": len(by_digest),
+            "logical": sum(os.path.getsize(p) for p in live),
+            "unique": sum(sizes.get(d, 0) for d in by_digest),
+            "on_disk": sum(inodes.values()),
+            "garbage": sum(size for d, size in sizes.items() if d not in by_digest),
+            "shared": shared,
+        }
+
+
+def _tree_files(store, root):
+    """root 아래 파일 - 저장소 자신과 .git 등 숨김 디렉터리는 들어가지 않음"""
+    store_root = os.path.realpath(store.root)
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.')
+                             and os.path.realpath(os.path.join(dirpath, d)) != store_root)
+        paths.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+    return paths
+
+
+def ingest(store, roots):
+    """기존 파일 트리를 저장소로 옮김 (같은 내용은 blob 하나) -> 연결한 파일 수"""
+    count = 0
+    for root in roots:
+        paths = [root] if os.path.isfile(root) else _tree_files(store, root)
+        for path in paths:
+            digest = sha256_file(path)
+            if not store.holds(path, digest):
+                store.adopt(path, digest)
+                count += 1
+    return count
+
+
+def print_report(report, top=10):
+    saved = report["logical"] - report["unique"]
+    pct = 100 * saved / report["logical"] if report["logical"] else 0
+    print(f"  출력 {report['paths']} 개 -> blob {report['blobs']} 개")
+    print(f"  논리 크기 {report['logical']:,} bytes, 고유 {report['unique']:,} bytes "
+          f"(중복 제거 {saved:,} bytes, -{pct:.1f}%)")
+    print(f"  디스크 (출력 + 저장소, inode 기준) {report['on_disk']:,} bytes")
+    if report["garbage"]:
+        print(f"  참조 없는 blob {report['garbage']:,} bytes (gc 로 정리)")
+    for digest, size, paths in report["shared"][:top]:
+        print(f"  {digest[:12]} {size:,} bytes x {len(paths)}: {', '.join(paths)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 내용 주소 출력 저장소")
+    parser.add_argument("--store", default=STORE_DIR, help="저장소 디렉터리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    report_cmd = sub.add_parser("report", help="중복 제거 현황")
+    report_cmd.add_argument("--top", type=int, default=10, help="공유 blob 출력 수")
+    gc_cmd = sub.add_parser("gc", help="참조 없는 blob 삭제")
+    gc_cmd.add_argument("--dry-run", action="store_true", help="삭제하지 않고 크기만")
+    ingest_cmd = sub.add_parser("ingest", help="기존 파일을 저장소로 옮기고 링크로 교체")
+    ingest_cmd.add_argument("paths", nargs="+")
+    ingest_cmd.add_argument("--link", choices=sorted(LINK_MODES), default="auto")
+    args = parser.parse_args()
+
+    store = BlobStore(args.store, getattr(args, "link", "auto"))
+    if args.command == "report":
+        print_report(store.dedup_report(), args.top)
+    elif args.command == "gc":
+        removed, freed = store.gc(args.dry_run)
+        verb = "삭제 예정" if args.dry_run else "삭제"
+        print(f"  blob {removed} 개 {verb} ({freed:,} bytes)")
+    elif args.command == "ingest":
+        count = ingest(store, args.paths)
+        store.save()
+        print(f"  {count} 개 파일 연결")
+        print_report(store.dedup_report())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Color Output
+색 관리 출력 - PNG 에 색 공간 ICC 프로필 (행렬/TRC v2) 태그
+"""
+
+import struct
+
+import numpy as np
+
+from asset_build import PNG_PARAMS, fingerprint
+
+# 색 공간 (Contents.json display-gamut 값과 같은 이름)
+SRGB = "sRGB"
+DISPLAY_P3 = "display-P3"
+
+# 원색 / 백색점 (CIE xy) - 두 색 공간 모두 D65 백색 + sRGB 전달 함수
+PRIMARIES = {
+    SRGB: ((0.640, 0.330), (0.300, 0.600), (0.150, 0.060)),
+    DISPLAY_P3: ((0.680, 0.320), (0.265, 0.690), (0.150, 0.060)),
+}
+D65 = (0.3127, 0.3290)
+D50_XYZ = (0.9642, 1.0, 0.8249)
+PROFILE_NAMES = {SRGB: "sRGB IEC61966-2.1", DISPLAY_P3: "Display P3"}
+
+BRADFORD = np.array([[0.8951, 0.2664, -0.1614],
+                     [-0.7502, 1.7135, 0.0367],
+                     [0.0389, -0.0685, 1.0296]])
+
+
+# === 색 공간 수학 ===
+
+def _xyz(xy):
+    x, y = xy
+    return np.array([x / y, 1.0, (1 - x - y) / y])
+
+
+def rgb_to_xyz(space):
+    """선형 RGB -> XYZ (D65) 행렬 - 원색과 백색점에서 계산"""
+    p = np.stack([_xyz(xy) for xy in PRIMARIES[space]], axis=1)
+    return p * np.linalg.solve(p, _xyz(D65))
+
+
+def decode(v):
+    """sRGB 전달 함수 -> 선형"""
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+# === ICC ===
+
+def _s15(v):
+    return struct.pack('>i', int(round(v * 65536)))
+
+
+def _xyz_tag(xyz):
+    return b'XYZ \0\0\0\0' + b''.join(_s15(v) for v in xyz)
+
+
+def _desc_tag(text):
+    ascii_text = text.encode('ascii') + b'\0'
+    return (b'desc\0\0\0\0' + struct.pack('>I', len(ascii_text)) + ascii_text
+            + struct.pack('>II', 0, 0) + struct.pack('>HB', 0, 0) + b'\0' * 67)
+
+
+def _curve_tag(points=1024):
+    """sRGB 전달 함수 표 - TRC 는 장치 값 -> 선형 방향"""
+    curve = decode(np.linspace(0, 1, points))
+    data = np.rint(curve * 65535).astype('>u2').tobytes()
+    return b'curv\0\0\0\0' + struct.pack('>I', points) + data
+
+
+def _adapted_colorants(space):
+    """RGB -> XYZ (D50, Bradford 순응) 열 = rXYZ/gXYZ/bXYZ"""
+    src = BRADFORD @ _xyz(D65)
+    dst = BRADFORD @ np.array(D50_XYZ)
+    adapt = np.linalg.inv(BRADFORD) @ np.diag(dst / src) @ BRADFORD
+    return adapt @ rgb_to_xyz(space)
+
+
+def icc_profile(gamut):
+    """행렬/TRC ICC v2 디스플레이 프로필 바이트 (sRGB 또는 Display P3) - 결정적 (날짜/ID 0)"""
+    m = _adapted_colorants(gamut)
+    curve = _curve_tag()
+    tags = [
+        (b'desc', _desc_tag(PROFILE_NAMES[gamut])),
+        (b'cprt', b'text\0\0\0\0' + b'No copyright, use freely\0'),
+        (b'wtpt', _xyz_tag(D50_XYZ)),
+        (b'rXYZ', _xyz_tag(m[:, 0])),
+        (b'gXYZ', _xyz_tag(m[:, 1])),
+        (b'bXYZ', _xyz_tag(m[:, 2])),
+        (b'rTRC', curve),
+        (b'gTRC', curve),
+        (b'bTRC', curve),
+    ]
+    table, blobs = [], []
+    offset = 128 + 4 + 12 * len(tags)
+    shared = {}
+    for sig, data in tags:
+        if data in shared:
+            table.append((sig, *shared[data]))
+            continue
+        shared[data] = (offset, len(data))
+        table.append((sig, offset, len(data)))
+        padded = data + b'\0' * (-len(data) % 4)
+        blobs.append(padded)
+        offset += len(padded)
+    body = struct.pack('>I', len(tags)) + b''.join(struct.pack('>4sII', *t) for t in table) + b''.join(blobs)
+    size = 128 + len(body)
+    header = (struct.pack('>I', size) + b'\0\0\0\0' + struct.pack('>I', 0x02100000)
+              + b'mntrRGB XYZ ' + b'\0' * 12 + b'acsp' + b'APPL' + b'\0' * 4
+              + b'\0' * 8 + b'\0' * 8 + struct.pack('>I', 0)
+              + b''.join(_s15(v) for v in D50_XYZ) + b'\0' * 4 + b'\0' * 16 + b'\0' * 28)
+    assert len(header) == 128
+    return header + body
+
+
+_profiles = {}
+
+
+def profile(gamut):
+    if gamut not in _profiles:
+        _profiles[gamut] = icc_profile(gamut)
+    return _profiles[gamut]
+
+
+# === 출력 ===
+
+def png_params(gamut, params=PNG_PARAMS):
+    """gamut ICC 프로필을 iCCP 청크로 붙이는 인코딩 설정"""
+    return {**params, "icc_profile": profile(gamut)}
+
+
+def gamut_fingerprint(gamut):
+    """출력 지문에 넣을 색 단계 입력 - ICC 프로필 바이트"""
+    return fingerprint(profile(gamut))
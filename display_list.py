@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Display List
+해상도 독립 디스플레이 리스트 - 캔버스 비율 좌표로 한 번 기록, 크기별 재생, SVG/PDF 내보내기
+"""
+
+import argparse
+from contextlib import contextmanager
+import hashlib
+import json
+import math
+import os
+import zlib
+
+from PIL import Image, ImageDraw
+
+import sdf_raster
+from gradient import linear_gradient
+from strip_render import offset_draw
+
+FORMAT_VERSION = 1
+CACHE_DIR = ".display_lists"
+
+# 기록된 연산 중 드로어 메서드 (나머지는 캔버스 연산: gradient, clip, layer, end, flatten, group)
+DRAW_OPS = ("ellipse", "arc", "rounded_rectangle", "rectangle", "line")
+
+
+# === 캔버스 프로토콜 ===
+#
+# 생성기 그리기 코드는 캔버스에만 그린다:
+#   canvas.gradient(top, bottom)           세로 선형 그라데이션으로 채우기
+#   canvas.clip_rounded_rectangle(xy, r)   둥근 사각형 밖을 투명하게
+#   canvas.draw()                          ImageDraw 호환 드로어
+#   with canvas.layer(xy) as draw:         xy 영역 투명 레이어 - 블록 끝에서 합성
+#   canvas.flatten(color) / canvas.result()
+#   canvas.group(name)                     이후 연산의 레이어 이름 (래스터 출력에는 영향 없음)
+# canvas.fractional 이 True 면 실수 좌표를 그대로 쓰고, 아니면 정수로 잘라 그린다.
+
+class _NullDraw:
+    """띠 밖 레이어 - 그리기 호출을 무시"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class RasterCanvas:
+    """래스터 캔버스 - 생성기 실행과 디스플레이 리스트 재생이 같이 쓰는 백엔드
+
+    antialias=True 면 sdf_raster 드로어 (실수 좌표), band=(y0, y1) 이면 그 행 구간만
+    (strip_render 의 띠 렌더링). 레이어는 한 버퍼에 제자리 합성한다.
+    """
+
+    def __init__(self, size, antialias=False, band=None):
+        self.width, self.height = size
+        self.fractional = antialias
+        self.band = band
+        self.y0, self.y1 = band or (0, self.height)
+        self._factory = sdf_raster.Draw if antialias else ImageDraw.Draw
+        self.img = Image.new('RGBA', (self.width, self.y1 - self.y0), (0, 0, 0, 0))
+
+    def _drawer(self, im, origin):
+        return offset_draw(self._factory, origin)(im)
+
+    def gradient(self, top, bottom):
+        """캔버스를 그라데이션으로 교체 - 이전에 받은 드로어는 무효"""
+        self.img = linear_gradient((self.width, self.height), top, bottom, mode='RGBA', rows=self.band)
+
+    def clip_rounded_rectangle(self, xy, radius):
+        # 마스크를 알파 채널로 바로 (마스크 밖 RGB 는 flatten 에서 버려짐)
+        mask = Image.new('L', self.img.size, 0)
+        self._drawer(mask, (0, self.y0)).rounded_rectangle(xy, radius=radius, fill=255)
+        self.img.putalpha(mask)
+
+    def draw(self):
+        return self._drawer(self.img, (0, self.y0))
+
+    @contextmanager
+    def layer(self, xy):
+        """xy (끝 포함) 와 안티앨리어싱 가장자리 1px 만 덮는 투명 레이어"""
+        x0, y0 = max(int(xy[0]) - 1, 0), max(int(xy[1]) - 1, self.y0)
+        x1, y1 = min(int(xy[2]) + 2, self.width), min(int(xy[3]) + 2, self.y1)
+        if x0 >= x1 or y0 >= y1:
+            yield _NullDraw()
+            return
+        layer = Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+        yield self._drawer(layer, (x0, y0))
+        self.img.alpha_composite(layer, dest=(x0, y0 - self.y0))
+
+    def group(self, name):
+        pass
+
+    def flatten(self, color):
+        """알파 제거 - color 위에 합성한 RGB"""
+        final = Image.new('RGB', self.img.size, color)
+        final.paste(self.img, mask=self.img)
+        return final
+
+    def result(self):
+        return self.img
+
+
+# === 기록 ===
+
+def _color(c):
+    return None if c is None else ([c] if isinstance(c, (int, float)) else list(c))
+
+
+def _flat(xy):
+    if xy and isinstance(xy[0], (tuple, list)):
+        return [v for point in xy for v in point]
+    return list(xy)
+
+
+class Recorder:
+    """캔버스 프로토콜 기록기 - 생성기를 기준 크기 정수 좌표로 한 번 실행해 비율 좌표 연산으로 저장"""
+
+    fractional = False
+
+    def __init__(self, size):
+        self.width, self.height = size
+        self.ops = []
+
+    def _xy(self, xy):
+        return [round(v / (self.height if i % 2 else self.width), 7) for i, v in enumerate(_flat(xy))]
+
+    def _len(self, v):
+        return round(v / self.width, 7)
+
+    def record(self, op, xy, **kwargs):
+        args = {"xy": self._xy(xy)}
+        for key, value in kwargs.items():
+            if value is None:
+                continue
+            if key in ("fill", "outline", "color"):
+                value = _color(value)
+            elif key in ("width", "radius"):
+                value = self._len(value)
+            args[key] = value
+        self.ops.append([op, args])
+
+    def gradient(self, top, bottom):
+        self.ops.append(["gradient", {"stops": [list(top), list(bottom)]}])
+
+    def clip_rounded_rectangle(self, xy, radius):
+        self.record("clip", xy, radius=radius)
+
+    def draw(self):
+        return RecordingDraw(self)
+
+    @contextmanager
+    def layer(self, xy):
+        self.record("layer", xy)
+        yield RecordingDraw(self)
+        self.ops.append(["end", {}])
+
+    def group(self, name):
+        self.ops.append(["group", {"name": name}])
+
+    def flatten(self, color):
+        self.ops.append(["flatten", {"color": list(color)}])
+        return self.result()
+
+    def result(self):
+        return DisplayList((self.width, self.height), self.ops)
+
+
+class RecordingDraw:
+    """ImageDraw 호환 드로어 - 호출을 Recorder 에 기록"""
+
+    def __init__(self, recorder):
+        self.rec = recorder
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self.rec.record("ellipse", xy, fill=fill, outline=outline, width=width if outline is not None else None)
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        self.rec.record("arc", xy, start=start, end=end, fill=fill, width=width)
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        self.rec.record("rounded_rectangle", xy, radius=radius, fill=fill, outline=outline,
+                        width=width if outline is not None else None)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.rec.record("rectangle", xy, fill=fill, outline=outline, width=width if outline is not None else None)
+
+    def line(self, xy, fill=None, width=0):
+        self.rec.record("line", xy, fill=fill, width=width)
+
+
+class DisplayList:
+    """기준 크기 (ref) + 연산 목록 [[연산, 인자]] - 위치는 ref 가로/세로 비율, 길이는 ref 가로 비율"""
+
+    def __init__(self, ref, ops):
+        self.ref = tuple(ref)
+        self.ops = ops
+
+    def to_json(self):
+        return json.dumps({"version": FORMAT_VERSION, "ref": list(self.ref), "ops": self.ops},
+                          separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"display list version {data.get('version')} != {FORMAT_VERSION}")
+        return cls(data["ref"], data["ops"])
+
+    def digest(self):
+        return hashlib.sha256(self.to_json().encode('utf-8')).hexdigest()
+
+    def size_for(self, width):
+        """가로 width 로 재생할 때의 (가로, 세로) - 비율 유지"""
+        return width, round(self.ref[1] * width / self.ref[0])
+
+
+def cached(name, record, fp, cache_dir=CACHE_DIR):
+    """디스크 캐시 (cache_dir/name.json) - 지문이 같으면 불러오고 아니면 record() 로 다시 기록"""
+    path = os.path.join(cache_dir, name + ".json")
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("fingerprint") == fp and data.get("version") == FORMAT_VERSION:
+            return DisplayList(data["ref"], data["ops"])
+    dl = record()
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({"fingerprint": fp, **json.loads(dl.to_json())}, separators=(',', ':')))
+    os.replace(tmp, path)
+    return dl
+
+
+# === 래스터 재생 ===
+
+def replay(dl, width=None, band=None):
+    """가로 width 픽셀로 재생 - 기준 크기면 정수 좌표 ImageDraw (생성기와 같은 픽셀),
+    아니면 실수 좌표 SDF 안티앨리어싱 (축소 리샘플링 없이 바로 그 크기로)"""
+    width = width or dl.ref[0]
+    w, h = dl.size_for(width)
+    exact = (w, h) == dl.ref
+    canvas = RasterCanvas((w, h), antialias=not exact, band=band)
+    num = round if exact else float
+
+    def pos(xy):
+        return [num(v * (h if i % 2 else w)) for i, v in enumerate(xy)]
+
+    def length(v):
+        return num(v * w)
+
+    drawers, layers = [], []
+    for op, args in dl.ops:
+        if op == "gradient":
+            canvas.gradient(*(tuple(c) for c in args["stops"]))
+            drawers = []
+        elif op == "clip":
+            canvas.clip_rounded_rectangle(pos(args["xy"]), length(args["radius"]))
+        elif op == "layer":
+            layers.append(canvas.layer(pos(args["xy"])))
+            drawers.append(layers[-1].__enter__())
+        elif op == "end":
+            layers.pop().__exit__(None, None, None)
+            drawers.pop()
+        elif op == "flatten":
+            return canvas.flatten(tuple(args["color"]))
+        elif op == "group":
+            continue
+        elif op in DRAW_OPS:
+            if not drawers:
+                drawers.append(canvas.draw())
+            kwargs = {}
+            for key, value in args.items():
+                if key in ("fill", "outline"):
+                    kwargs[key] = tuple(value)
+                elif key in ("width", "radius"):
+                    kwargs[key] = length(value)
+                elif key != "xy":
+                    kwargs[key] = value
+            getattr(drawers[-1], op)(pos(args["xy"]), **kwargs)
+        else:
+            raise ValueError(f"unknown display list op {op!r}")
+    return canvas.result()
+
+
+def split_groups(dl):
+    """group 연산 기준으로 나눈 [(이름, DisplayList)] - 이름이 같아도 떨어진 구간은 따로, 그리기 순서대로
+
+    각 구간은 투명 캔버스에 따로 재생할 수 있다 (flatten 은 빠짐, 첫 group 앞 연산은 이름 None).
+    """
+    runs = [(None, [])]
+    for op, args in dl.ops:
+        if op == "group":
+            runs.append((args["name"], []))
+        elif op != "flatten":
+            runs[-1][1].append([op, args])
+    return [(name, DisplayList(dl.ref, ops)) for name, ops in runs if ops]
+
+
+def replay_task(task):
+    """워커: (디스플레이 리스트, 가로) -> 재생 이미지"""
+    dl, width = task
+    return replay(dl, width)
+
+
+# === 벡터 공통 ===
+
+def _vector_ops(dl, w, h):
+    """벡터 백엔드용 연산 -> (배경색, 클립 둥근 사각형, 나머지 연산) - 좌표는 ref 픽셀 단위 연속 좌표
+
+    래스터에서는 flatten 이 마지막, 클립이 그라데이션 뒤에 오지만 벡터에서는 배경과 클립이
+    먼저 깔려야 한다. 반투명 RGBA 도형은 래스터에서 캔버스 픽셀을 덮어쓰고 벡터에서는 블렌드되므로
+    가장자리 색이 아주 조금 다를 수 있다.
+    """
+    background, clip, ops = None, None, []
+    for op, args in dl.ops:
+        if op == "group":
+            continue
+        if op == "flatten":
+            background = args["color"]
+        elif op == "clip":
+            x0, y0, x1, y1 = _continuous(args["xy"], w, h)
+            clip = (x0, y0, x1, y1, args["radius"] * w)
+        else:
+            ops.append((op, args))
+    return background, clip, ops
+
+
+def _continuous(xy, w, h):
+    """비율 bbox (끝 픽셀 포함) -> ref 픽셀 연속 좌표"""
+    return xy[0] * w, xy[1] * h, xy[2] * w + 1, xy[3] * h + 1
+
+
+def _shape(op, args, w, h):
+    """그리기 연산 -> (종류, 기하, 채우기, 외곽선, 두께) - 외곽선은 ImageDraw 처럼 안쪽으로"""
+    width = args.get("width", 0) * w
+    if op == "line":
+        pts = [(args["xy"][i] * w + 0.5, args["xy"][i + 1] * h + 0.5) for i in range(0, len(args["xy"]), 2)]
+        return "line", pts, None, args.get("fill"), max(width, 1)
+    x0, y0, x1, y1 = _continuous(args["xy"], w, h)
+    if op == "arc":
+        half = width / 2
+        geom = ((x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2 - half, (y1 - y0) / 2 - half, args["start"], args["end"])
+        return "arc", geom, None, args.get("fill"), width
+    radius = args.get("radius", 0) * w if op == "rounded_rectangle" else 0
+    kind = "ellipse" if op == "ellipse" else "rect"
+    return kind, (x0, y0, x1, y1, radius), args.get("fill"), args.get("outline"), width
+
+
+def _inset(kind, geom, d):
+    x0, y0, x1, y1, r = geom
+    return x0 + d, y0 + d, x1 - d, y1 - d, max(r - d, 0)
+
+
+# === SVG ===
+
+def _svg_color(c):
+    alpha = f' opacity="{c[3] / 255:.3f}"' if len(c) > 3 and c[3] < 255 else ''
+    return f'rgb({c[0]},{c[1]},{c[2]})', alpha
+
+
+def _n(v):
+    return f"{v:.3f}".rstrip('0').rstrip('.')
+
+
+def _svg_arc(cx, cy, rx, ry, start, end):
+    span = (end - start) % 360 or 360
+    a0, a1 = math.radians(start), math.radians(start + span)
+    p0 = (cx + rx * math.cos(a0), cy + ry * math.sin(a0))
+    p1 = (cx + rx * math.cos(a1), cy + ry * math.sin(a1))
+    large = 1 if span > 180 else 0
+    return f"M{_n(p0[0])} {_n(p0[1])} A{_n(rx)} {_n(ry)} 0 {large} 1 {_n(p1[0])} {_n(p1[1])}"
+
+
+def to_svg(dl, size=None):
+    """SVG 문자열 - viewBox 는 기준 크기, width/height 는 size (기본 기준 크기)"""
+    w, h = dl.ref
+    out_w, out_h = dl.size_for(size or w)
+    background, clip, ops = _vector_ops(dl, w, h)
+    defs, body = [], []
+    for op, args in ops:
+        if op == "gradient":
+            (top, bottom) = args["stops"]
+            defs.append(f'<linearGradient id="bg" x1="0" y1="0" x2="0" y2="1">'
+                        f'<stop offset="0" stop-color="{_svg_color(top)[0]}"/>'
+                        f'<stop offset="1" stop-color="{_svg_color(bottom)[0]}"/></linearGradient>')
+            body.append(f'<rect width="{w}" height="{h}" fill="url(#bg)"/>')
+        elif op == "layer":
+            body.append('<g>')
+        elif op == "end":
+            body.append('</g>')
+        else:
+            kind, geom, fill, outline, width = _shape(op, args, w, h)
+            if kind == "line":
+                color, alpha = _svg_color(outline)
+                points = " ".join(f"{_n(x)},{_n(y)}" for x, y in geom)
+                body.append(f'<polyline points="{points}" fill="none" stroke="{color}"{alpha} '
+                            f'stroke-width="{_n(width)}"/>')
+            elif kind == "arc":
+                color, alpha = _svg_color(outline)
+                body.append(f'<path d="{_svg_arc(*geom)}" fill="none" stroke="{color}"{alpha} '
+                            f'stroke-width="{_n(width)}"/>')
+            else:
+                for paint, g, attrs in ((fill, geom, None), (outline, _inset(kind, geom, width / 2), width)):
+                    if paint is None:
+                        continue
+                    color, alpha = _svg_color(paint)
+                    style = (f'fill="none" stroke="{color}"{alpha} stroke-width="{_n(attrs)}"' if attrs
+                             else f'fill="{color}"{alpha}')
+                    x0, y0, x1, y1, r = g
+                    if kind == "ellipse":
+                        body.append(f'<ellipse cx="{_n((x0 + x1) / 2)}" cy="{_n((y0 + y1) / 2)}" '
+                                    f'rx="{_n((x1 - x0) / 2)}" ry="{_n((y1 - y0) / 2)}" {style}/>')
+                    else:
+                        rx = f' rx="{_n(r)}"' if r else ''
+                        body.append(f'<rect x="{_n(x0)}" y="{_n(y0)}" width="{_n(x1 - x0)}" '
+                                    f'height="{_n(y1 - y0)}"{rx} {style}/>')
+    if clip:
+        x0, y0, x1, y1, r = clip
+        defs.append(f'<clipPath id="clip"><rect x="{_n(x0)}" y="{_n(y0)}" width="{_n(x1 - x0)}" '
+                    f'height="{_n(y1 - y0)}" rx="{_n(r)}"/></clipPath>')
+        body = ['<g clip-path="url(#clip)">'] + body + ['</g>']
+    if background:
+        body.insert(0, f'<rect width="{w}" height="{h}" fill="{_svg_color(background)[0]}"/>')
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{out_w}" height="{out_h}" viewBox="0 0 {w} {h}">'
+            f'<defs>{"".join(defs)}</defs>{"".join(body)}</svg>\n')
+
+
+# === PDF ===
+
+KAPPA = 0.5522847498
+
+
+def _pdf_ellipse(x0, y0, x1, y1):
+    cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+    kx, ky = rx * KAPPA, ry * KAPPA
+    return (f"{_n(cx + rx)} {_n(cy)} m "
+            f"{_n(cx + rx)} {_n(cy + ky)} {_n(cx + kx)} {_n(cy + ry)} {_n(cx)} {_n(cy + ry)} c "
+            f"{_n(cx - kx)} {_n(cy + ry)} {_n(cx - rx)} {_n(cy + ky)} {_n(cx - rx)} {_n(cy)} c "
+            f"{_n(cx - rx)} {_n(cy - ky)} {_n(cx - kx)} {_n(cy - ry)} {_n(cx)} {_n(cy - ry)} c "
+            f"{_n(cx + kx)} {_n(cy - ry)} {_n(cx + rx)} {_n(cy - ky)} {_n(cx + rx)} {_n(cy)} c h")
+
+
+def _pdf_rect(x0, y0, x1, y1, r):
+    if not r:
+        return f"{_n(x0)} {_n(y0)} {_n(x1 - x0)} {_n(y1 - y0)} re"
+    r = min(r, (x1 - x0) / 2, (y1 - y0) / 2)
+    k = r * (1 - KAPPA)
+    return (f"{_n(x0 + r)} {_n(y0)} m {_n(x1 - r)} {_n(y0)} l "
+            f"{_n(x1 - k)} {_n(y0)} {_n(x1)} {_n(y0 + k)} {_n(x1)} {_n(y0 + r)} c "
+            f"{_n(x1)} {_n(y1 - r)} l {_n(x1)} {_n(y1 - k)} {_n(x1 - k)} {_n(y1)} {_n(x1 - r)} {_n(y1)} c "
+            f"{_n(x0 + r)} {_n(y1)} l {_n(x0 + k)} {_n(y1)} {_n(x0)} {_n(y1 - k)} {_n(x0)} {_n(y1 - r)} c "
+            f"{_n(x0)} {_n(y0 + r)} l {_n(x0)} {_n(y0 + k)} {_n(x0 + k)} {_n(y0)} {_n(x0 + r)} {_n(y0)} c h")
+
+
+def _pdf_arc(cx, cy, rx, ry, start, end):
+    """90도 이하 베지어 조각들로 나눈 원호"""
+    span = (end - start) % 360 or 360
+    pieces = max(1, math.ceil(span / 90))
+    step = math.radians(span / pieces)
+    a = math.radians(start)
+    k = 4 / 3 * math.tan(step / 4)
+    out = [f"{_n(cx + rx * math.cos(a))} {_n(cy + ry * math.sin(a))} m"]
+    for _ in range(pieces):
+        b = a + step
+        out.append(f"{_n(cx + rx * (math.cos(a) - k * math.sin(a)))} {_n(cy + ry * (math.sin(a) + k * math.cos(a)))} "
+                   f"{_n(cx + rx * (math.cos(b) + k * math.sin(b)))} {_n(cy + ry * (math.sin(b) - k * math.cos(b)))} "
+                   f"{_n(cx + rx * math.cos(b))} {_n(cy + ry * math.sin(b))} c")
+        a = b
+    return " ".join(out)
+
+
+def to_pdf(dl, size=None):
+    """한 페이지 벡터 PDF 바이트 - 페이지 크기는 size 포인트 (기본 기준 크기)"""
+    w, h = dl.ref
+    out_w, out_h = dl.size_for(size or w)
+    background, clip, ops = _vector_ops(dl, w, h)
+    alphas, shadings = {}, []
+
+    def paint(c, stroke):
+        op = "RG" if stroke else "rg"
+        s = f"{c[0] / 255:.4f} {c[1] / 255:.4f} {c[2] / 255:.4f} {op}"
+        a = c[3] if len(c) > 3 else 255
+        if a < 255:
+            name = alphas.setdefault(a, f"A{a}")
+            s += f" /{name} gs"
+        return s
+
+    # 위 -> 아래 좌표계로 뒤집고 ref 픽셀 -> 포인트 배율
+    cmds = [f"{out_w / w:.6f} 0 0 {-out_h / h:.6f} 0 {out_h} cm"]
+    if background:
+        cmds.append(f"{paint(background, False)} 0 0 {w} {h} re f")
+    if clip:
+        cmds.append(f"{_pdf_rect(*clip)} W n")
+    for op, args in ops:
+        if op == "gradient":
+            shadings.append(args["stops"])
+            cmds.append(f"/Sh{len(shadings) - 1} sh")
+        elif op == "layer":
+            cmds.append("q")
+        elif op == "end":
+            cmds.append("Q")
+        else:
+            kind, geom, fill, outline, width = _shape(op, args, w, h)
+            if kind == "line":
+                pts = " ".join(f"{_n(x)} {_n(y)} {'m' if i == 0 else 'l'}" for i, (x, y) in enumerate(geom))
+                cmds.append(f"q {paint(outline, True)} {_n(width)} w 0 J {pts} S Q")
+            elif kind == "arc":
+                cmds.append(f"q {paint(outline, True)} {_n(width)} w 0 J {_pdf_arc(*geom)} S Q")
+            else:
+                path = _pdf_ellipse if kind == "ellipse" else _pdf_rect
+                if fill is not None:
+                    g = geom[:4] if kind == "ellipse" else geom
+                    cmds.append(f"q {paint(fill, False)} {path(*g)} f Q")
+                if outline is not None and width > 0:
+                    g = _inset(kind, geom, width / 2)
+                    cmds.append(f"q {paint(outline, True)} {_n(width)} w {path(*(g[:4] if kind == 'ellipse' else g))} S Q")
+    content = zlib.compress("\n".join(cmds).encode('ascii'))
+
+    gs = "".join(f"/{name} << /ca {a / 255:.4f} /CA {a / 255:.4f} >> " for a, name in alphas.items())
+    sh = "".join(f"/Sh{i} << /ShadingType 2 /ColorSpace /DeviceRGB /Coords [0 0 0 {h}] /Extend [true true] "
+                 f"/Function << /FunctionType 2 /Domain [0 1] /N 1 "
+                 f"/C0 [{' '.join(f'{c / 255:.4f}' for c in top[:3])}] "
+                 f"/C1 [{' '.join(f'{c / 255:.4f}' for c in bottom[:3])}] >> >> "
+                 for i, (top, bottom) in enumerate(shadings))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {out_w} {out_h}] /Contents 4 0 R "
+         f"/Resources << /ExtGState << {gs}>> /Shading << {sh}>> >> >>").encode('ascii'),
+        f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode('ascii') + content + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode('ascii') + obj + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('ascii')
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode('ascii')
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode('ascii')
+    return bytes(out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 디스플레이 리스트 내보내기")
+    parser.add_argument("asset", choices=["icon", "splash"], help="기록할 에셋")
+    parser.add_argument("--svg", help="SVG 출력 경로")
+    parser.add_argument("--pdf", help="PDF 출력 경로")
+    parser.add_argument("--png", help="PNG 재생 출력 경로 (--size 크기)")
+    parser.add_argument("--size", type=int, help="출력 크기 (SVG/PDF 는 포인트, PNG 는 픽셀 - 기본 기준 크기)")
+    args = parser.parse_args()
+
+    if args.asset == "icon":
+        from generate_app_icon import icon_display_list as load
+    else:
+        from generate_splash import splash_display_list as load
+    dl = load()
+    print(f"📐 {args.asset}: {len(dl.ops)} ops, ref {dl.ref[0]}x{dl.ref[1]}, {len(dl.to_json()):,} bytes")
+    if args.svg:
+        with open(args.svg, 'w', encoding='utf-8') as f:
+            f.write(to_svg(dl, args.size))
+        print(f"  ✓ {args.svg}")
+    if args.pdf:
+        with open(args.pdf, 'wb') as f:
+            f.write(to_pdf(dl, args.size))
+        print(f"  ✓ {args.pdf}")
+    if args.png:
+        replay(dl, args.size).save(args.png)
+        print(f"  ✓ {args.png}")
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Draw Profile
+드로잉 프리미티브별 프로파일링 - 시간/호출 수/픽셀/할당 + 플레임 그래프 트레이스
+"""
+
+import argparse
+from collections import Counter
+from contextlib import contextmanager
+import functools
+import json
+import os
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+import gradient
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+_THIS = os.path.abspath(__file__)
+
+# 감쌀 ImageDraw 메서드 (드로잉 프리미티브)
+DRAW_METHODS = ["rectangle", "rounded_rectangle", "ellipse", "arc", "chord", "pieslice",
+                "line", "polygon", "regular_polygon", "point", "text", "bitmap"]
+
+# 감쌀 Image 메서드 / 모듈 함수 (합성, 변환, 새 버퍼)
+IMAGE_METHODS = ["alpha_composite", "paste", "convert", "resize", "copy", "crop", "split", "putalpha"]
+IMAGE_FUNCTIONS = ["new", "alpha_composite", "composite", "fromarray", "merge"]
+
+# 저장소 내부 단계 (모듈, 함수명, 라벨)
+REPO_STAGES = [(gradient, "_render", "gradient")]
+
+
+# === 픽셀 수 추정 ===
+
+def _clip_area(coords, size):
+    """좌표 목록의 bbox 를 이미지 안으로 잘라낸 면적"""
+    flat = []
+    for c in coords:
+        flat.extend(c if isinstance(c, (tuple, list)) else [c])
+    if len(flat) < 2:
+        return 0
+    xs, ys = flat[0::2], flat[1::2]
+    w, h = size
+    x0, x1 = max(0, min(xs)), min(w, max(xs) + 1)
+    y0, y1 = max(0, min(ys)), min(h, max(ys) + 1)
+    return int(max(0, x1 - x0) * max(0, y1 - y0))
+
+
+def _draw_pixels(label, args, kwargs):
+    draw = args[0]
+    size = draw.im.size
+    xy = args[1] if len(args) > 1 else kwargs.get("xy")
+    if label == "bitmap":
+        bitmap = args[2] if len(args) > 2 else kwargs.get("bitmap")
+        return bitmap.width * bitmap.height
+    if label == "text":
+        text = args[2] if len(args) > 2 else kwargs.get("text", "")
+        bbox = draw.textbbox(xy, text, font=kwargs.get("font"))
+        return _clip_area([bbox], size)
+    if label == "regular_polygon":
+        x, y, r = xy if len(xy) == 3 else (*xy[0], xy[1])
+        return _clip_area([(x - r, y - r, x + r, y + r)], size)
+    if xy is None:
+        return 0
+    return _clip_area(list(xy) if isinstance(xy, (list, tuple)) else [xy], size)
+
+
+def _image_bytes(img):
+    return img.width * img.height * len(img.getbands())
+
+
+# === 프로파일러 ===
+
+class Stat:
+    __slots__ = ("calls", "total", "self_time", "pixels", "alloc")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.pixels = 0
+        self.alloc = 0
+
+
+class Profiler:
+    """ImageDraw / Image 호출을 감싸 (생성기, 프리미티브) 별로 집계
+
+    - 시간: 총 시간과 자기 시간 (중첩된 프리미티브 제외)
+    - 픽셀: 드로잉 bbox (이미지 안으로 잘라냄) 또는 결과/붙여넣은 이미지 면적
+    - 할당: 호출이 새로 만든 이미지 버퍼 바이트 (Pillow 버퍼는 tracemalloc 에 안 잡힘)
+    - 스택: 생성기 > 저장소 함수 프레임 > 프리미티브 (folded 스택 = 플레임 그래프 입력)
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.folded = Counter()
+        self.events = []
+        self.generator = None
+        self._top = 0.0
+        self._stack = []
+        self._patched = []
+        self._origin = time.perf_counter()
+
+    # --- 훅 설치 ---
+
+    def install(self):
+        for name in DRAW_METHODS:
+            self._patch(ImageDraw.ImageDraw, name, name, _draw_pixels)
+        for name in IMAGE_METHODS:
+            self._patch(Image.Image, name, f"Image.{name}", None)
+        for name in IMAGE_FUNCTIONS:
+            self._patch(Image, name, f"Image.{name}()", None)
+        for module, name, label in REPO_STAGES:
+            self._patch(module, name, label, None)
+
+    def uninstall(self):
+        for owner, name, orig in reversed(self._patched):
+            setattr(owner, name, orig)
+        self._patched = []
+
+    def _patch(self, owner, name, label, pixels):
+        orig = getattr(owner, name, None)
+        if orig is None:
+            return
+        prof = self
+
+        @functools.wraps(orig)
+        def hooked(*args, **kwargs):
+            return prof._call(label, orig, pixels, args, kwargs)
+
+        # lru_cache 로 감싼 단계는 cache_clear() 등을 그대로 노출
+        for attr in ("cache_clear", "cache_info"):
+            if hasattr(orig, attr):
+                setattr(hooked, attr, getattr(orig, attr))
+        setattr(owner, name, hooked)
+        self._patched.append((owner, name, orig))
+
+    # --- 기록 ---
+
+    def _repo_frames(self):
+        """호출 지점까지의 저장소 내부 파이썬 프레임 (바깥 -> 안)"""
+        names = []
+        frame = sys._getframe(3)
+        while frame:
+            path = frame.f_code.co_filename
+            if path.startswith(ROOT) and path != _THIS:
+                names.append(frame.f_code.co_name)
+            frame = frame.f_back
+        names.reverse()
+        # 생성기 자신의 프레임은 루트 라벨과 중복
+        return names[1:] if names and names[0] == self.generator else names
+
+    def _call(self, label, orig, pixels, args, kwargs):
+        if self.generator is None:
+            return orig(*args, **kwargs)
+        frames = self._repo_frames() if not self._stack else []
+        entry = {"label": label, "children": 0.0, "path": None}
+        parent = self._stack[-1] if self._stack else None
+        entry["path"] = (parent["path"] if parent else [self.generator] + frames) + [label]
+        self._stack.append(entry)
+        start = time.perf_counter()
+        try:
+            result = orig(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+        if parent:
+            parent["children"] += elapsed
+        else:
+            self._top += elapsed
+
+        stat = self.stats.setdefault((self.generator, label), Stat())
+        stat.calls += 1
+        stat.total += elapsed
+        stat.self_time += elapsed - entry["children"]
+        if pixels:
+            stat.pixels += pixels(label, args, kwargs)
+        elif isinstance(result, Image.Image):
+            stat.pixels += result.width * result.height
+            stat.alloc += _image_bytes(result)
+        elif isinstance(result, tuple) and result and isinstance(result[0], Image.Image):
+            stat.pixels += sum(im.width * im.height for im in result)
+            stat.alloc += sum(_image_bytes(im) for im in result)
+        elif len(args) > 1 and isinstance(args[1], Image.Image):
+            stat.pixels += args[1].width * args[1].height
+        self.folded[";".join(entry["path"])] += elapsed - entry["children"]
+        self.events.append({"name": label, "ph": "X", "pid": 0, "tid": 0,
+                            "ts": (start - self._origin) * 1e6, "dur": elapsed * 1e6})
+        return result
+
+    @contextmanager
+    def profile(self, name):
+        """생성기 한 번 실행 - 프리미티브 밖의 시간 (파이썬 로직) 은 생성기 자기 시간으로"""
+        self.generator = name
+        self._top = 0.0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            inner = self._top
+            stat = self.stats.setdefault((name, "(python)"), Stat())
+            stat.calls += 1
+            stat.total += elapsed - inner
+            stat.self_time += elapsed - inner
+            self.folded[name] += elapsed - inner
+            self.events.append({"name": name, "ph": "X", "pid": 0, "tid": 0,
+                                "ts": (start - self._origin) * 1e6, "dur": elapsed * 1e6})
+            self.generator = None
+
+    # --- 출력 ---
+
+    def summary(self, out=sys.stdout):
+        """생성기별 표 - 자기 시간 내림차순"""
+        for gen in dict.fromkeys(g for g, _ in self.stats):
+            rows = [(label, s) for (g, label), s in self.stats.items() if g == gen]
+            wall = sum(s.self_time for _, s in rows)
+            print(f"\n  {gen}  ({wall * 1000:.1f} ms)", file=out)
+            print(f"  {'stage':<26} {'calls':>6} {'self ms':>9} {'total ms':>9} {'%':>6} {'Mpixels':>9} {'alloc MB':>9}", file=out)
+            for label, s in sorted(rows, key=lambda r: -r[1].self_time):
+                pct = 100 * s.self_time / wall if wall else 0
+                print(f"  {label:<26} {s.calls:>6} {s.self_time * 1000:>9.2f} {s.total * 1000:>9.2f} {pct:>5.1f}%"
+                      f" {s.pixels / 1e6:>9.2f} {s.alloc / 1e6:>9.2f}", file=out)
+
+    def write_folded(self, path):
+        """folded 스택 (flamegraph.pl / speedscope) - 값은 마이크로초"""
+        with open(path, 'w') as f:
+            for stack, seconds in sorted(self.folded.items()):
+                us = round(seconds * 1e6)
+                if us > 0:
+                    f.write(f"{stack} {us}\n")
+
+    def write_trace(self, path):
+        """Chrome trace event JSON (chrome://tracing, Perfetto)"""
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+
+@contextmanager
+def profiling():
+    """with profiling() as prof: ... - 블록 안에서만 훅 설치"""
+    prof = Profiler()
+    prof.install()
+    try:
+        yield prof
+    finally:
+        prof.uninstall()
+
+
+def generators(size=None, device=None):
+    """(이름, 호출) - 프로파일 대상 생성기"""
+    from generate_app_icon import create_app_icon
+    from generate_screenshots import SCREENS
+    from generate_splash import create_splash_image
+    from screenshot_templates import DEFAULT_DEVICE
+
+    out = [("create_app_icon", lambda: create_app_icon(size or 1024)),
+           ("create_splash_image", lambda: create_splash_image(size or 400, size or 400))]
+    for _, gen in SCREENS:
+        out.append((gen.__name__, functools.partial(gen, device or DEFAULT_DEVICE)))
+    return out
+
+
+if __name__ == "__main__":
+    from bench import reset_caches
+
+    parser = argparse.ArgumentParser(description="VoiceScheduler 드로잉 프리미티브 프로파일")
+    parser.add_argument("only", nargs="*", help="생성기 (create_app_icon, create_splash_image, ss1..ss5) - 기본 전체")
+    parser.add_argument("--size", type=int, help="아이콘/스플래시 크기")
+    parser.add_argument("--device", help="스크린샷 기기 클래스")
+    parser.add_argument("--folded", default="profile.folded", help="folded 스택 출력 (flamegraph.pl / speedscope)")
+    parser.add_argument("--trace", help="Chrome trace JSON 출력")
+    args = parser.parse_args()
+
+    with profiling() as prof:
+        for name, func in generators(args.size, args.device):
+            if args.only and name not in args.only:
+                continue
+            reset_caches()
+            with prof.profile(name):
+                func()
+    prof.summary()
+    prof.write_folded(args.folded)
+    print(f"\n🔥 folded 스택: {args.folded}")
+    if args.trace:
+        prof.write_trace(args.trace)
+        print(f"🧭 trace: {args.trace}")
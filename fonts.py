@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Fonts
+폰트 레지스트리 (macOS/Linux/Windows 경로) + 텍스트 레이아웃 캐시
+"""
+
+from functools import lru_cache
+import os
+import sys
+
+from PIL import Image, ImageDraw, ImageFont, features
+
+# 패밀리 -> 후보 폰트 파일 (앞에서부터 처음 존재하는 파일 사용)
+FONT_FAMILIES = {
+    "sans": [
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/Library/Fonts/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "C:/Windows/Fonts/arial.ttf",
+    ],
+    "sans-bold": [
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/Library/Fonts/Arial Bold.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "C:/Windows/Fonts/arialbd.ttf",
+    ],
+    # 스크립트별 대체 폰트 - .ttc 는 (경로, 인덱스)
+    "sans-kr": [
+        "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+        ("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", 1),
+        ("/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc", 1),
+        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "C:/Windows/Fonts/malgun.ttf",
+    ],
+    "sans-jp": [
+        "/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc",
+        ("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", 0),
+        ("/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc", 0),
+        "C:/Windows/Fonts/YuGothR.ttc",
+    ],
+    "sans-sc": [
+        "/System/Library/Fonts/PingFang.ttc",
+        ("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", 2),
+        ("/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc", 2),
+        "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc",
+        "C:/Windows/Fonts/msyh.ttc",
+    ],
+    "sans-tc": [
+        "/System/Library/Fonts/PingFang.ttc",
+        ("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", 3),
+        ("/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc", 3),
+        "C:/Windows/Fonts/msjh.ttc",
+    ],
+    "sans-deva": [
+        "/System/Library/Fonts/Kohinoor.ttc",
+        "/usr/share/fonts/truetype/noto/NotoSansDevanagari-Regular.ttf",
+        "/usr/share/fonts/noto/NotoSansDevanagari-Regular.ttf",
+        "/usr/share/fonts/truetype/lohit-devanagari/Lohit-Devanagari.ttf",
+        "C:/Windows/Fonts/Nirmala.ttf",
+    ],
+}
+
+# 유니코드 블록 -> 스크립트 (라틴이 아닌 것만)
+SCRIPT_RANGES = [
+    ("hangul", 0x1100, 0x11FF), ("hangul", 0x3130, 0x318F), ("hangul", 0xAC00, 0xD7AF),
+    ("kana", 0x3040, 0x30FF), ("kana", 0x31F0, 0x31FF),
+    ("han", 0x3400, 0x4DBF), ("han", 0x4E00, 0x9FFF), ("han", 0xF900, 0xFAFF),
+    ("devanagari", 0x0900, 0x097F),
+]
+
+# 한자만 있는 텍스트는 로케일에 맞는 자형으로
+HAN_FAMILIES = {"ja": "sans-jp", "ko": "sans-kr", "zh-Hant": "sans-tc"}
+SCRIPT_FAMILIES = {"latin": "sans", "hangul": "sans-kr", "kana": "sans-jp", "devanagari": "sans-deva"}
+
+# 로케일의 주 폰트 패밀리 (매트릭스 작업을 폰트별로 묶을 때 사용)
+LOCALE_FAMILIES = {"ko": "sans-kr", "ja": "sans-jp", "zh-Hans": "sans-sc", "zh-Hant": "sans-tc", "hi": "sans-deva"}
+
+# libraqm 이 있으면 데바나가리 결합 문자 등을 제대로 셰이핑
+LAYOUT_ENGINE = ImageFont.Layout.RAQM if features.check('raqm') else ImageFont.Layout.BASIC
+
+
+def _entry(candidate):
+    return candidate if isinstance(candidate, tuple) else (candidate, 0)
+
+
+@lru_cache(maxsize=None)
+def font_entry(family="sans"):
+    """패밀리의 실제 (폰트 파일, .ttc 인덱스) - 없으면 None"""
+    for candidate in FONT_FAMILIES.get(family, ()):
+        path, index = _entry(candidate)
+        if os.path.exists(path):
+            return path, index
+    return None
+
+
+def font_file(family="sans"):
+    """패밀리의 실제 폰트 파일 경로 (없으면 None)"""
+    entry = font_entry(family)
+    return entry[0] if entry else None
+
+
+def font_files():
+    """현재 시스템에서 해석된 폰트 파일 목록 (빌드 지문용)"""
+    return sorted({path for path in map(font_file, FONT_FAMILIES) if path})
+
+
+def script_of(text):
+    """텍스트의 첫 비라틴 스크립트 (없으면 'latin')"""
+    for ch in text:
+        code = ord(ch)
+        if code < 0x0900:
+            continue
+        for script, lo, hi in SCRIPT_RANGES:
+            if lo <= code <= hi:
+                return script
+    return "latin"
+
+
+# 이번 실행에서 이미 경고한 (스크립트, 패밀리) - clear_cache 로 지우지 않음
+_missing = set()
+
+
+def _warn_missing(script, family):
+    """스크립트를 덮는 폰트가 없을 때 실행마다 한 번만 경고 (두부 글자로 렌더링됨)"""
+    if (script, family) not in _missing:
+        _missing.add((script, family))
+        print(f"  Warning: no {family} font installed, {script} text falls back to sans (renders as tofu)",
+              file=sys.stderr)
+
+
+@lru_cache(maxsize=4096)
+def family_for(text, locale="en"):
+    """텍스트 런의 스크립트를 덮는 폰트 패밀리 - 설치된 폰트가 없으면 경고 후 'sans' 로 대체"""
+    script = script_of(text)
+    if script == "han":
+        family = HAN_FAMILIES.get(locale, "sans-sc")
+    else:
+        family = SCRIPT_FAMILIES[script]
+    if font_entry(family):
+        return family
+    if family != "sans":
+        _warn_missing(script, family)
+    return "sans"
+
+
+@lru_cache(maxsize=None)
+def get_font(size, family="sans"):
+    """(패밀리, 크기) 별로 한 번만 로드한 폰트"""
+    entry = font_entry(family)
+    if entry:
+        try:
+            return ImageFont.truetype(entry[0], size, index=entry[1], layout_engine=LAYOUT_ENGINE)
+        except OSError:
+            pass
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+class TextRun:
+    """측정된 텍스트 - bbox 와 (필요 시) 래스터화된 글리프 마스크"""
+
+    def __init__(self, text, font):
+        self.text = text
+        self.font = font
+        self.bbox = font.getbbox(text)
+        self.width = self.bbox[2] - self.bbox[0]
+        self.height = self.bbox[3] - self.bbox[1]
+        self._mask = None
+
+    @property
+    def mask(self):
+        """글리프 커버리지 'L' 마스크 (처음 붙여넣을 때 한 번만 래스터화)"""
+        if self._mask is None:
+            left, top = self.bbox[0], self.bbox[1]
+            mask = Image.new('L', (max(self.width, 1), max(self.height, 1)), 0)
+            ImageDraw.Draw(mask).text((-left, -top), self.text, fill=255, font=self.font)
+            self._mask = mask
+        return self._mask
+
+    def draw(self, draw, xy, color):
+        """캐시된 마스크를 color 로 붙여넣기"""
+        x, y = xy
+        draw.bitmap((x + self.bbox[0], y + self.bbox[1]), self.mask, fill=color)
+
+
+@lru_cache(maxsize=2048)
+def layout(text, size, family="sans"):
+    """(텍스트, 패밀리, 크기) 별 레이아웃 캐시"""
+    return TextRun(text, get_font(size, family))
+
+
+def clear_cache():
+    """로드된 폰트/레이아웃 해제 (매트릭스에서 스크립트 그룹이 바뀔 때)"""
+    layout.cache_clear()
+    get_font.cache_clear()
+    family_for.cache_clear()
@@ -4,15 +4,40 @@ VoiceScheduler App Icon Generator
 캘린더 + 마이크 골드 디자인 - 굵은 스케줄 선
 """
 
-from PIL import Image, ImageDraw
-import math
+import argparse
 import os
 
-def create_app_icon(size=1024):
-    """앱 아이콘 생성 - 캘린더 + 마이크 골드"""
-
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+import display_list
+import gradient
+import icon_variants
+import resize_plan
+import sdf_raster
+from asset_build import AssetBuild, PNG_PARAMS, fingerprint
+from blob_store import BlobStore
+from display_list import RasterCanvas
+from icon_variants import APPEARANCES
+from output_stage import OutputStage, render_to_stage
+from parallel_render import resolve_jobs
+from png_optimize import optimize_build
+from resize_plan import ResizePlan, render_plan
+from web_icons import DOCS_DIR, save_web_icons
+
+# 디스플레이 리스트 기준 크기 - 이 크기로 재생하면 create_app_icon 과 같은 픽셀
+ICON_REF = 1024
+
+def create_app_icon(size=1024, antialias=False, band=None):
+    """앱 아이콘 생성 - 캘린더 + 마이크 골드
+
+    antialias=True 면 SDF 안티앨리어싱 드로어 + 실수 좌표로 그려서
+    작은 크기도 마스터 축소 없이 바로 렌더링할 수 있다.
+    band=(y0, y1) 이면 최종 아이콘의 그 행 구간만 (size x (y1 - y0)) 렌더링한다
+    (strip_render 의 대형 마스터 띠 렌더링).
+    """
+    return draw_app_icon(RasterCanvas((size, size), antialias, band), size)
+
+def draw_app_icon(canvas, size):
+    """아이콘 그리기 코드 - canvas 는 RasterCanvas 또는 display_list.Recorder"""
+    u = (lambda f: size * f) if canvas.fractional else (lambda f: int(size * f))
 
     # 컬러 팔레트
     deep_navy = (15, 20, 40)
@@ -23,37 +48,28 @@ def create_app_icon(size=1024):
     gold_header = (235, 215, 160)
     white = (255, 255, 255)
 
-    corner_radius = int(size * 0.22)
+    corner_radius = u(0.22)
     cx, cy = size // 2, size // 2
 
     # === 배경 - 깊은 네이비 그라데이션 ===
-    for y in range(size):
-        ratio = y / size
-        r = int(deep_navy[0] + (navy_mid[0] - deep_navy[0]) * ratio)
-        g = int(deep_navy[1] + (navy_mid[1] - deep_navy[1]) * ratio)
-        b = int(deep_navy[2] + (navy_mid[2] - deep_navy[2]) * ratio)
-        draw.line([(0, y), (size, y)], fill=(r, g, b))
+    canvas.group("background")
+    canvas.gradient(deep_navy, navy_mid)
 
     # 라운드 마스크 적용
-    mask = Image.new('L', (size, size), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    mask_draw.rounded_rectangle([0, 0, size, size], radius=corner_radius, fill=255)
-
-    bg = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    bg.paste(img, mask=mask)
-    img = bg
-    draw = ImageDraw.Draw(img)
+    canvas.clip_rounded_rectangle([0, 0, size, size], corner_radius)
+    draw = canvas.draw()
 
     # === 캘린더 프레임 ===
-    cal_margin = int(size * 0.1)
+    cal_margin = u(0.1)
     cal_left = cal_margin
     cal_right = size - cal_margin
-    cal_top = int(size * 0.08)
-    cal_bottom = int(size * 0.92)
-    cal_radius = int(size * 0.06)
-    cal_stroke = int(size * 0.01)  # 10px at 1024
+    cal_top = u(0.08)
+    cal_bottom = u(0.92)
+    cal_radius = u(0.06)
+    cal_stroke = u(0.01)  # 10px at 1024
 
     # 캘린더 외곽선
+    canvas.group("frame")
     draw.rounded_rectangle(
         [cal_left, cal_top, cal_right, cal_bottom],
         radius=cal_radius,
@@ -62,41 +78,41 @@ def create_app_icon(size=1024):
     )
 
     # === 캘린더 헤더 (상단 영역) ===
-    header_height = int(size * 0.12)
+    header_height = u(0.12)
     header_bottom = cal_top + header_height
 
-    # 헤더 배경 채우기
-    header_img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    header_draw = ImageDraw.Draw(header_img)
-    header_draw.rounded_rectangle(
-        [cal_left + cal_stroke, cal_top + cal_stroke,
-         cal_right - cal_stroke, header_bottom],
-        radius=max(cal_radius - cal_stroke, 1),
-        fill=gold_header
-    )
-    # 하단 모서리를 직각으로 채우기
-    header_draw.rectangle(
-        [cal_left + cal_stroke, header_bottom - cal_radius,
-         cal_right - cal_stroke, header_bottom],
-        fill=gold_header
-    )
-    img = Image.alpha_composite(img, header_img)
-    draw = ImageDraw.Draw(img)
+    # 헤더 배경 채우기 - 헤더 bbox 크기 레이어에 그려 합성
+    canvas.group("header")
+    header_box = [cal_left + cal_stroke, cal_top + cal_stroke, cal_right - cal_stroke, header_bottom]
+    with canvas.layer(header_box) as header_draw:
+        header_draw.rounded_rectangle(
+            [cal_left + cal_stroke, cal_top + cal_stroke,
+             cal_right - cal_stroke, header_bottom],
+            radius=max(cal_radius - cal_stroke, 1),
+            fill=gold_header
+        )
+        # 하단 모서리를 직각으로 채우기
+        header_draw.rectangle(
+            [cal_left + cal_stroke, header_bottom - cal_radius,
+             cal_right - cal_stroke, header_bottom],
+            fill=gold_header
+        )
 
     # 헤더 구분선
+    canvas.group("frame")
     divider_y = header_bottom
     draw.line(
         [(cal_left, divider_y), (cal_right, divider_y)],
         fill=gold_alpha,
-        width=int(size * 0.007)
+        width=u(0.007)
     )
 
     # 요일 표시 도트 (7개)
     dot_y = cal_top + header_height // 2
-    dot_area_left = cal_left + int(size * 0.08)
-    dot_area_right = cal_right - int(size * 0.08)
+    dot_area_left = cal_left + u(0.08)
+    dot_area_right = cal_right - u(0.08)
     dot_spacing = (dot_area_right - dot_area_left) / 6
-    dot_r = int(size * 0.009)
+    dot_r = u(0.009)
 
     for i in range(7):
         dx = int(dot_area_left + i * dot_spacing)
@@ -106,17 +122,18 @@ def create_app_icon(size=1024):
         )
 
     # === 스케줄 선 (3개 - 굵게!) ===
-    body_top = header_bottom + int(size * 0.04)
-    body_bottom = cal_bottom - int(size * 0.04)
+    body_top = header_bottom + u(0.04)
+    body_bottom = cal_bottom - u(0.04)
     body_height = body_bottom - body_top
-    line_width = int(size * 0.012)  # 12px at 1024 - 더 굵게!
+    line_width = u(0.012)  # 12px at 1024 - 더 굵게!
 
+    canvas.group("frame")
     line_positions = [0.22, 0.50, 0.78]  # 상단, 중앙, 하단
     for pos in line_positions:
         ly = int(body_top + body_height * pos)
         draw.line(
-            [(cal_left + int(size * 0.06), ly),
-             (cal_right - int(size * 0.06), ly)],
+            [(cal_left + u(0.06), ly),
+             (cal_right - u(0.06), ly)],
             fill=gold_line,
             width=line_width
         )
@@ -127,8 +144,9 @@ def create_app_icon(size=1024):
     mic_cy = body_center_y  # 본문 영역 정중앙
 
     # 마이크 본체 (타원) - 크게
-    mic_w = int(size * 0.12)
-    mic_h = int(size * 0.17)
+    canvas.group("mic")
+    mic_w = u(0.12)
+    mic_h = u(0.17)
     draw.ellipse(
         [mic_cx - mic_w, mic_cy - mic_h,
          mic_cx + mic_w, mic_cy + int(mic_h * 0.3)],
@@ -136,29 +154,29 @@ def create_app_icon(size=1024):
     )
 
     # U자 홀더
-    holder_width = int(size * 0.01)
-    holder_radius = int(size * 0.15)
+    holder_width = u(0.01)
+    holder_radius = u(0.15)
     holder_cy = mic_cy + int(mic_h * 0.3)
 
     # U자 아크 그리기
     arc_bbox = [
-        mic_cx - holder_radius, holder_cy - holder_radius + int(size * 0.02),
-        mic_cx + holder_radius, holder_cy + holder_radius + int(size * 0.02)
+        mic_cx - holder_radius, holder_cy - holder_radius + u(0.02),
+        mic_cx + holder_radius, holder_cy + holder_radius + u(0.02)
     ]
     draw.arc(arc_bbox, start=0, end=180, fill=white, width=holder_width)
 
     # 스탠드 (수직선)
-    stand_top = holder_cy + holder_radius + int(size * 0.02)
-    stand_bottom = stand_top + int(size * 0.05)
-    stand_w = int(size * 0.007)
+    stand_top = holder_cy + holder_radius + u(0.02)
+    stand_bottom = stand_top + u(0.05)
+    stand_w = u(0.007)
     draw.rectangle(
         [mic_cx - stand_w, stand_top, mic_cx + stand_w, stand_bottom],
         fill=white
     )
 
     # 받침대 (수평선)
-    base_w = int(size * 0.06)
-    base_h = int(size * 0.007)
+    base_w = u(0.06)
+    base_h = u(0.007)
     draw.rounded_rectangle(
         [mic_cx - base_w, stand_bottom,
          mic_cx + base_w, stand_bottom + base_h],
@@ -167,104 +185,245 @@ def create_app_icon(size=1024):
     )
 
     # === 음파 (마이크 양쪽) ===
-    wave_cy = mic_cy - int(size * 0.02)
+    wave_cy = mic_cy - u(0.02)
+    canvas.group("waves")
 
     for side in [-1, 1]:
         # 안쪽 음파
-        wave_r1 = int(size * 0.18)
+        wave_r1 = u(0.18)
         arc1_bbox = [
             mic_cx - wave_r1, wave_cy - wave_r1,
             mic_cx + wave_r1, wave_cy + wave_r1
         ]
         if side == -1:
-            draw.arc(arc1_bbox, start=150, end=210, fill=gold, width=int(size * 0.009))
+            draw.arc(arc1_bbox, start=150, end=210, fill=gold, width=u(0.009))
         else:
-            draw.arc(arc1_bbox, start=-30, end=30, fill=gold, width=int(size * 0.009))
+            draw.arc(arc1_bbox, start=-30, end=30, fill=gold, width=u(0.009))
 
         # 바깥쪽 음파
-        wave_r2 = int(size * 0.22)
+        wave_r2 = u(0.22)
         arc2_bbox = [
             mic_cx - wave_r2, wave_cy - wave_r2,
             mic_cx + wave_r2, wave_cy + wave_r2
         ]
         if side == -1:
-            draw.arc(arc2_bbox, start=155, end=205, fill=gold, width=int(size * 0.007))
+            draw.arc(arc2_bbox, start=155, end=205, fill=gold, width=u(0.007))
         else:
-            draw.arc(arc2_bbox, start=-25, end=25, fill=gold, width=int(size * 0.007))
+            draw.arc(arc2_bbox, start=-25, end=25, fill=gold, width=u(0.007))
 
     # 알파 채널 제거 (App Store 요구사항)
-    final = Image.new('RGB', (size, size), deep_navy)
-    final.paste(img, mask=img.split()[3])
-    return final
-
-def save_icon_set(base_icon, output_dir):
-    sizes = [
-        (1024, "icon_1024.png"),
-        (180, "icon_60@3x.png"),
-        (120, "icon_60@2x.png"),
-        (167, "icon_83.5@2x.png"),
-        (152, "icon_76@2x.png"),
-        (76, "icon_76.png"),
-        (40, "icon_40.png"),
-        (80, "icon_40@2x.png"),
-        (120, "icon_40@3x.png"),
-        (58, "icon_29@2x.png"),
-        (87, "icon_29@3x.png"),
-        (20, "icon_20.png"),
-        (40, "icon_20@2x.png"),
-        (60, "icon_20@3x.png"),
+    return canvas.flatten(deep_navy)
+
+def record_app_icon():
+    """아이콘 디스플레이 리스트 기록 (ICON_REF 정수 좌표)"""
+    return draw_app_icon(display_list.Recorder((ICON_REF, ICON_REF)), ICON_REF)
+
+def icon_display_list():
+    """디스크 캐시된 아이콘 디스플레이 리스트 - 그리기 코드가 바뀔 때만 다시 기록"""
+    return display_list.cached("app_icon", record_app_icon, icon_fingerprint())
+
+# 아이콘 슬롯 테이블 (포인트 크기, 스케일, idiom)
+# 파일명 / 픽셀 크기 / Contents.json 모두 이 테이블 하나에서 파생
+ICON_SLOTS = [
+    (20, 2, "iphone"),
+    (20, 3, "iphone"),
+    (29, 2, "iphone"),
+    (29, 3, "iphone"),
+    (40, 2, "iphone"),
+    (40, 3, "iphone"),
+    (60, 2, "iphone"),
+    (60, 3, "iphone"),
+    (20, 1, "ipad"),
+    (20, 2, "ipad"),
+    (29, 1, "ipad"),
+    (29, 2, "ipad"),
+    (40, 1, "ipad"),
+    (40, 2, "ipad"),
+    (76, 1, "ipad"),
+    (76, 2, "ipad"),
+    (83.5, 2, "ipad"),
+    (1024, 1, "ios-marketing"),
+]
+
+def slot_filename(points, scale, appearance=None):
+    name = f"icon_{points:g}" + (f"_{appearance}" if appearance else "")
+    suffix = "" if scale == 1 else f"@{scale}x"
+    return f"{name}{suffix}.png"
+
+def slot_pixels(points, scale):
+    return round(points * scale)
+
+# (픽셀 크기, 파일명) - 슬롯 테이블에서 파일명 기준으로 중복 제거
+ICON_SIZES = list({
+    slot_filename(points, scale): (slot_pixels(points, scale), slot_filename(points, scale))
+    for points, scale, _ in ICON_SLOTS
+}.values())
+
+# 다크/틴트 외관 슬롯 - 앱 내 아이콘만 (App Store 마케팅 아이콘은 기본 외관 하나)
+VARIANT_SLOTS = [slot for slot in ICON_SLOTS if slot[2] != "ios-marketing"]
+
+# (픽셀 크기, 외관, 파일명)
+VARIANT_SIZES = list({
+    slot_filename(points, scale, appearance): (slot_pixels(points, scale), appearance,
+                                               slot_filename(points, scale, appearance))
+    for appearance in APPEARANCES
+    for points, scale, _ in VARIANT_SLOTS
+}.values())
+
+def icon_fingerprint():
+    """디스플레이 리스트 입력 지문 - 그리기 코드 + 기록기"""
+    return fingerprint(draw_app_icon, display_list.Recorder, display_list.RecordingDraw, ICON_REF)
+
+def icon_targets(output_dir, dl, sizes=ICON_SIZES, direct_below=0):
+    """(사이즈, 파일명, 경로, 지문) 목록 - direct_below 미만은 SDF 직접 재생, 나머지는 마스터 축소 지문"""
+    digest = dl.digest()
+    return [
+        (size, filename, os.path.join(output_dir, filename),
+         fingerprint(digest, size, "direct", display_list.replay, display_list.RasterCanvas, sdf_raster, gradient,
+                     PNG_PARAMS) if size < direct_below
+         else fingerprint(digest, size, "LANCZOS", display_list.replay, display_list.RasterCanvas, gradient,
+                          resize_plan, PNG_PARAMS))
+        for size, filename in sizes
     ]
 
-    os.makedirs(output_dir, exist_ok=True)
+def _report(filename, changed):
+    print(f"  ✓ {filename}" if changed else f"  = {filename} (변경 없음)")
 
-    for size, filename in sizes:
-        resized = base_icon.resize((size, size), Image.LANCZOS)
-        filepath = os.path.join(output_dir, filename)
-        resized.save(filepath, 'PNG')
-        print(f"  ✓ {filename}")
+def save_icon_set(dl, output_dir, build=None, jobs=1, direct_below=0):
+    """아이콘 세트 - 1024 마스터를 한 번 재생 (create_app_icon 과 같은 픽셀) 해 피라미드 LANCZOS 축소
 
-    return sizes
+    direct_below 미만 크기만 (옵트인) 축소 대신 SDF 안티앨리어싱으로 그 크기에 바로 재생한다 -
+    선 굵기/도트가 마스터 축소와 눈에 띄게 달라지므로 기본은 0 (모두 축소).
+    """
+    build = build or AssetBuild()
 
-def create_contents_json(sizes, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+
+    plan = ResizePlan(ICON_SIZES)
+    targets = {}
+    for size, filename, filepath, fp in icon_targets(output_dir, dl, direct_below=direct_below):
+        targets.setdefault((size, size), []).append((filepath, fp, filename))
+    direct = [dims for dims in plan.sizes if dims[0] < direct_below]
+    scaled = ResizePlan([(size, name) for size, name in ICON_SIZES if size >= direct_below])
+
+    # 고유 픽셀 크기별로 한 번만 리사이즈/인코딩 (피라미드 레벨에서) - 출력 단계 스레드가 생기기 전에
+    encoded = render_plan(display_list.replay(dl, ICON_REF), scaled, jobs) if scaled.sizes else {}
+
+    # 인코딩/쓰기는 출력 단계 스레드에서 - 직접 재생 크기의 프로세스 풀이 fork 한 뒤 첫 submit 에서 시작
+    with OutputStage(build, report=_report) as stage:
+        render_to_stage(stage, display_list.replay_task, [(dl, w) for w, _ in direct],
+                        [targets[dims] for dims in direct], jobs)
+        for dims in scaled.sizes:
+            stage.submit_bytes(encoded[dims], targets[dims])
+
+    return ICON_SIZES
+
+def save_icon_variants(dl, output_dir, build=None, jobs=1, appearances=APPEARANCES):
+    """다크/틴트 아이콘 - 기준 크기 레이어를 기본 세트와 같은 피라미드로 축소해 채널 연산으로 파생
+    (그리기 코드는 다시 실행하지 않음). 요청하지 않은 외관의 이전 파일은 삭제"""
+    build = build or AssetBuild()
+    os.makedirs(output_dir, exist_ok=True)
+
+    pending = []
+    for size, appearance, filename in VARIANT_SIZES:
+        path = os.path.join(output_dir, filename)
+        if appearance not in appearances:
+            if os.path.exists(path):
+                print(f"  🗑 {filename}")
+            build.remove(path)
+            continue
+        fp = fingerprint(dl.digest(), size, appearance, icon_variants, display_list.replay,
+                         display_list.split_groups, display_list.RasterCanvas, gradient, resize_plan, PNG_PARAMS)
+        if build.is_fresh(path, fp):
+            build.skip(path)
+            continue
+        pending.append(((dl, size, appearance), (path, fp, filename)))
+
+    # 픽셀 크기 + 외관이 같은 슬롯은 한 번만 파생, 크기별 레이어는 두 외관이 같이 씀
+    tasks = {}
+    for task, target in pending:
+        tasks.setdefault(task, []).append(target)
+    with OutputStage(build, report=_report) as stage:
+        render_to_stage(stage, icon_variants.variant_task, list(tasks), list(tasks.values()), jobs)
+    icon_variants.clear_cache()
+
+def create_contents_json(sizes, output_dir, build=None, appearances=()):
+    images = [
+        {
+            "size": f"{points:g}x{points:g}",
+            "idiom": idiom,
+            "filename": slot_filename(points, scale),
+            "scale": f"{scale}x",
+        }
+        for points, scale, idiom in ICON_SLOTS
+    ]
+    # iOS 18 외관 - 같은 슬롯 + appearances
+    images += [
+        {
+            "size": f"{points:g}x{points:g}",
+            "idiom": idiom,
+            "filename": slot_filename(points, scale, appearance),
+            "scale": f"{scale}x",
+            "appearances": [{"appearance": "luminosity", "value": appearance}],
+        }
+        for appearance in appearances
+        for points, scale, idiom in VARIANT_SLOTS
+    ]
     contents = {
-        "images": [
-            {"size": "20x20", "idiom": "iphone", "filename": "icon_20@2x.png", "scale": "2x"},
-            {"size": "20x20", "idiom": "iphone", "filename": "icon_20@3x.png", "scale": "3x"},
-            {"size": "29x29", "idiom": "iphone", "filename": "icon_29@2x.png", "scale": "2x"},
-            {"size": "29x29", "idiom": "iphone", "filename": "icon_29@3x.png", "scale": "3x"},
-            {"size": "40x40", "idiom": "iphone", "filename": "icon_40@2x.png", "scale": "2x"},
-            {"size": "40x40", "idiom": "iphone", "filename": "icon_40@3x.png", "scale": "3x"},
-            {"size": "60x60", "idiom": "iphone", "filename": "icon_60@2x.png", "scale": "2x"},
-            {"size": "60x60", "idiom": "iphone", "filename": "icon_60@3x.png", "scale": "3x"},
-            {"size": "20x20", "idiom": "ipad", "filename": "icon_20.png", "scale": "1x"},
-            {"size": "20x20", "idiom": "ipad", "filename": "icon_20@2x.png", "scale": "2x"},
-            {"size": "29x29", "idiom": "ipad", "filename": "icon_29@2x.png", "scale": "1x"},
-            {"size": "29x29", "idiom": "ipad", "filename": "icon_29@2x.png", "scale": "2x"},
-            {"size": "40x40", "idiom": "ipad", "filename": "icon_40.png", "scale": "1x"},
-            {"size": "40x40", "idiom": "ipad", "filename": "icon_40@2x.png", "scale": "2x"},
-            {"size": "76x76", "idiom": "ipad", "filename": "icon_76.png", "scale": "1x"},
-            {"size": "76x76", "idiom": "ipad", "filename": "icon_76@2x.png", "scale": "2x"},
-            {"size": "83.5x83.5", "idiom": "ipad", "filename": "icon_83.5@2x.png", "scale": "2x"},
-            {"size": "1024x1024", "idiom": "ios-marketing", "filename": "icon_1024.png", "scale": "1x"}
-        ],
+        "images": images,
         "info": {"version": 1, "author": "xcode"}
     }
 
-    import json
-    with open(os.path.join(output_dir, "Contents.json"), 'w') as f:
-        json.dump(contents, f, indent=2)
-    print("  ✓ Contents.json")
+    build = build or AssetBuild()
+    fp = fingerprint(create_contents_json, slot_filename, ICON_SLOTS, VARIANT_SLOTS, appearances)
+    if build.write_json(os.path.join(output_dir, "Contents.json"), contents, fp):
+        print("  ✓ Contents.json")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 앱 아이콘 생성")
+    parser.add_argument("--incremental", action="store_true",
+                        help="입력 지문과 디스크 파일이 그대로인 에셋은 렌더링/쓰기 생략")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="병렬 렌더링 프로세스 수 (0 = CPU 코어 수)")
+    parser.add_argument("--optimize", action="store_true",
+                        help="기록한 PNG 를 무손실 최적화 (필터/zlib 탐색, 팔레트 변환, 부가 청크 제거)")
+    parser.add_argument("--no-web", action="store_true",
+                        help="docs/ 웹 아이콘 (파비콘, 애플 터치, PWA, OG 카드) 생략")
+    parser.add_argument("--appearances", action="store_true",
+                        help="iOS 18 다크/틴트 아이콘도 생성해 Contents.json 에 등록 (기본: 기본 외관만)")
+    parser.add_argument("--store", action="store_true",
+                        help="출력을 내용 주소 저장소 (.asset_store) 에 한 번만 두고 reflink/하드링크로 연결")
+    parser.add_argument("--direct-below", type=int, default=0, metavar="PX",
+                        help="PX 미만 크기는 1024 마스터 축소 대신 SDF 안티앨리어싱으로 직접 재생 (디자인이 달라짐)")
+    args = parser.parse_args()
+    appearances = APPEARANCES if args.appearances else ()
+    jobs = resolve_jobs(args.jobs)
+    build = AssetBuild(incremental=args.incremental, store=BlobStore() if args.store else None)
+
     print("✨ Calendar + Mic Icon 생성 중...")
     print()
 
-    icon = create_app_icon(1024)
     output_dir = "VoiceScheduler/Assets.xcassets/AppIcon.appiconset"
+    dl = icon_display_list()
+    targets = icon_targets(output_dir, dl, direct_below=args.direct_below)
 
     print("📁 저장 중...")
-    sizes = save_icon_set(icon, output_dir)
-    create_contents_json(sizes, output_dir)
+    if build.all_fresh((path, fp) for _, _, path, fp in targets):
+        print("  ⏭ 아이콘 세트 변경 없음 - 렌더링 생략")
+    else:
+        save_icon_set(dl, output_dir, build, jobs, args.direct_below)
+    if appearances:
+        print("🌗 다크/틴트 외관 파생 중...")
+    save_icon_variants(dl, output_dir, build, jobs, appearances)
+    create_contents_json(ICON_SIZES, output_dir, build, appearances)
+    if not args.no_web:
+        # 방금 기록 (또는 변경 없음 확인) 한 1024 마스터를 캐시로 사용 - 다시 렌더링하지 않음
+        print("🌐 웹 아이콘 생성 중...")
+        save_web_icons(os.path.join(output_dir, slot_filename(1024, 1)), DOCS_DIR, build, jobs)
+    if args.optimize:
+        print("🗜 PNG 최적화 중...")
+        optimize_build(build, jobs)
+    build.save()
 
     print()
     print("✅ 완료!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""App Store Screenshots from raw device captures (AppStore/Screenshots/IMG_*.PNG)
+
+Each capture is framed on the navy gradient under a headline (AppStore/templates/captures.json,
+"@id" strings as in screenshots.json) and resampled for every device class. Captures stream
+through one at a time: decoded once (JPEG draft / reducing_gap for big sources), composed for
+each device, encoded, released; at most 2 x jobs captures are in flight.
+"""
+import argparse, glob, json, os
+from PIL import Image, ImageDraw
+import screenshot_templates
+from asset_build import AssetBuild, FileInput, PNG_PARAMS, encode_png, fingerprint
+from blob_store import BlobStore
+from generate_screenshots import screen_dir
+from localization import BASE_LOCALE, localize, strings_for
+from parallel_render import resolve_jobs, run_parallel
+from png_optimize import optimize_build
+from screenshot_templates import DEVICES, GOLD, H, WHITE, ScaledDraw, bg, device
+
+CAPTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AppStore", "templates", "captures.json")
+CAPTURE_PATTERNS = ["IMG_*.PNG", "IMG_*.png", "IMG_*.JPG", "IMG_*.jpg", "IMG_*.jpeg"]
+
+# Frame layout in design units (1284x2778 canvas, see screenshot_templates.Device)
+FRAME_TOP, FRAME_BOTTOM, FRAME_MARGIN = 400, H-120, 130
+BEZEL, BEZEL_COLOR, SCREEN_RADIUS = 22, (8, 10, 18), 78
+
+# Photographic captures: zlib level 9 is ~9x slower than 6 for ~5% smaller files; --optimize recovers the rest
+CAPTURE_PNG_PARAMS = {**PNG_PARAMS, "compress_level": 6}
+
+def find_captures(src):
+    return sorted({p for pat in CAPTURE_PATTERNS for p in glob.glob(os.path.join(src, pat))})
+
+def load_captions(path=CAPTIONS_PATH):
+    with open(path, encoding="utf-8") as f: return json.load(f)
+
+def caption_for(captions, name, locale=BASE_LOCALE):
+    return localize({**captions.get("default", {}), **captions.get("captures", {}).get(name, {})}, strings_for(locale))
+
+def frame_box(dev, aspect):
+    """Screen rectangle (design units) of the largest capture with this w/h aspect that fits the frame area"""
+    h = FRAME_BOTTOM-FRAME_TOP; w = h*aspect
+    if w > dev.W-2*FRAME_MARGIN: w = dev.W-2*FRAME_MARGIN; h = w/aspect
+    x0 = (dev.W-w)/2
+    return [x0, FRAME_TOP, x0+w, FRAME_TOP+h]
+
+def decode_capture(path, largest):
+    """Decode one capture; JPEG decodes at reduced scale via draft() when the targets are much smaller"""
+    img = Image.open(path)
+    if img.format == "JPEG": img.draft("RGB", largest)
+    return img.convert("RGB")
+
+def compose(capture, dev, caption, locale=BASE_LOCALE):
+    """Capture in a bezel with rounded screen corners, on the gradient under a two-line headline"""
+    img = bg(dev); draw = ScaledDraw(img, dev, locale)
+    draw.centered_text(150, caption["headline"], 72, WHITE)
+    draw.centered_text(245, caption["accent"], 72, GOLD)
+    x0, y0, x1, y1 = frame_box(dev, capture.width/capture.height)
+    draw.rounded_rectangle([x0-BEZEL, y0-BEZEL, x1+BEZEL, y1+BEZEL], radius=SCREEN_RADIUS+BEZEL, fill=BEZEL_COLOR, outline=GOLD, width=3)
+    box = draw.box([x0, y0, x1, y1]); size = (box[2]-box[0], box[3]-box[1])
+    screen = capture.resize(size, Image.LANCZOS, reducing_gap=3.0)
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, size[0]-1, size[1]-1], radius=draw.n(SCREEN_RADIUS), fill=255)
+    img.paste(screen, box[:2], mask)
+    return img
+
+def capture_fingerprint(path, dev, caption, locale):
+    return fingerprint(compose, frame_box, decode_capture, screenshot_templates, FileInput(path), dev,
+                       sorted(caption.items()), locale, CAPTURE_PNG_PARAMS)
+
+def encode_capture(task):
+    """Worker: decode one capture once, compose + encode it for each pending device class"""
+    path, devs, caption, locale = task
+    largest = max((device(d).pw, device(d).ph) for d in devs)
+    capture = decode_capture(path, largest)
+    return [encode_png(compose(capture, device(d), caption, locale), CAPTURE_PNG_PARAMS) for d in devs]
+
+def process_captures(src, out, devices, locale, build, jobs):
+    captions = load_captions(); captures = find_captures(src)
+    tasks = []
+    for path in captures:
+        name = os.path.basename(path); caption = caption_for(captions, name, locale); pending = []
+        for dev in devices:
+            dst = os.path.join(screen_dir(out, locale, dev), os.path.splitext(name)[0]+".png")
+            fp = capture_fingerprint(path, dev, caption, locale)
+            if build.is_fresh(dst, fp): build.skip(dst); print(f"  Skipped {os.path.relpath(dst, out)} (unchanged)"); continue
+            pending.append((dev, dst, fp))
+        if pending: tasks.append(((path, [d for d, _, _ in pending], caption, locale), pending))
+    # bounded window: only 2 x jobs captures (decoded + encoded outputs) are alive at once
+    window = max(2, 2*jobs)
+    for i in range(0, len(tasks), window):
+        batch = tasks[i:i+window]
+        for (_, pending), encoded in zip(batch, run_parallel(encode_capture, [t for t, _ in batch], jobs)):
+            for (dev, dst, fp), data in zip(pending, encoded):
+                build.write_bytes(dst, data, fp); print(f"  Done {os.path.relpath(dst, out)}")
+    return len(captures)
+
+if __name__=="__main__":
+    ap = argparse.ArgumentParser(description="Store-ready screenshots from raw device captures")
+    ap.add_argument("src", nargs="?", default="AppStore/Screenshots", help="folder of raw captures (IMG_*.PNG)")
+    ap.add_argument("--out", default="AppStore/screenshots/captures", help="output root (<out>/[<locale>/]<device>/)")
+    ap.add_argument("--locale", default=BASE_LOCALE, help="locale of the headline strings")
+    ap.add_argument("--devices", default="all", help=f"comma-separated device classes or 'all' ({', '.join(DEVICES)})")
+    ap.add_argument("--incremental", action="store_true", help="skip outputs whose capture, caption and code are unchanged")
+    ap.add_argument("--jobs", type=int, default=1, help="parallel processes (0 = CPU count)")
+    ap.add_argument("--optimize", action="store_true", help="losslessly re-encode written PNGs")
+    ap.add_argument("--store", action="store_true", help="keep output bytes once in the content-addressed store (.asset_store) and reflink/hardlink the named paths")
+    args = ap.parse_args()
+    devices = list(DEVICES) if args.devices == "all" else args.devices.split(",")
+    for dev in devices:
+        if dev not in DEVICES: ap.error(f"unknown device class {dev!r}")
+    build = AssetBuild(incremental=args.incremental, store=BlobStore() if args.store else None); jobs = resolve_jobs(args.jobs)
+    n = process_captures(args.src, args.out, devices, args.locale, build, jobs)
+    if args.optimize: print("  Optimizing PNGs..."); optimize_build(build, jobs)
+    build.save()
+    print(f"{n} captures x {len(devices)} device classes ({build.written} written, {build.skipped} unchanged)")
@@ -4,106 +4,192 @@ VoiceScheduler Splash Screen Generator
 프리미엄 골드 테마 스플래시
 """
 
-from PIL import Image, ImageDraw
+import argparse
 import math
 import os
 
-def create_splash_image(width=400, height=400):
-    """스플래시 로고 이미지 생성"""
-
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # 프리미엄 골드 컬러
-    gold = (212, 175, 55)
-    gold_light = (240, 210, 120)
-
-    cx, cy = width // 2, height // 2
-    size = min(width, height)
-
-    # === 골드 원형 링 ===
+import color_output
+import display_list
+from asset_build import AssetBuild, PNG_PARAMS, fingerprint
+from blob_store import BlobStore
+from output_stage import OutputStage, render_to_stage
+from parallel_render import resolve_jobs
+from display_list import RasterCanvas
+from png_optimize import optimize_build
+
+# 프리미엄 골드 컬러
+GOLD = (212, 175, 55)
+GOLD_LIGHT = (240, 210, 120)
+
+# 정지 화면 바늘 각도 (도, 화면 좌표 - 0 = 3시 방향, 시계 방향 증가)
+HOUR_ANGLE = -60
+MINUTE_ANGLE = -30
+
+def draw_rings(draw, cx, cy, size):
+    """골드 원형 링 (바깥/안쪽 3겹)"""
     ring_outer = int(size * 0.45)
     ring_inner = int(size * 0.39)
 
     for w in range(3):
         draw.ellipse([cx - ring_outer + w, cy - ring_outer + w,
                       cx + ring_outer - w, cy + ring_outer - w],
-                     outline=gold, width=2)
+                     outline=GOLD, width=2)
         draw.ellipse([cx - ring_inner + w, cy - ring_inner + w,
                       cx + ring_inner - w, cy + ring_inner - w],
-                     outline=gold, width=2)
-
-    # === 시계 바늘 (10:10) ===
-    hour_angle = math.radians(-60)
-    hour_len = int(size * 0.17)
-    hx = cx + int(hour_len * math.cos(hour_angle))
-    hy = cy + int(hour_len * math.sin(hour_angle))
-    draw.line([(cx, cy), (hx, hy)], fill=gold, width=int(size * 0.03))
-
-    min_angle = math.radians(-30)
-    min_len = int(size * 0.24)
-    mx = cx + int(min_len * math.cos(min_angle))
-    my = cy + int(min_len * math.sin(min_angle))
-    draw.line([(cx, cy), (mx, my)], fill=gold, width=int(size * 0.022))
-
-    # 중심점
-    dot_r = int(size * 0.028)
-    draw.ellipse([cx - dot_r, cy - dot_r, cx + dot_r, cy + dot_r], fill=gold_light)
-
-    # === 12시간 마커 ===
+                     outline=GOLD, width=2)
+
+def hand_lines(cx, cy, size, hour_angle=HOUR_ANGLE, minute_angle=MINUTE_ANGLE):
+    """시침/분침 [(끝점, 두께)] - 모두 중심 (cx, cy) 에서 시작"""
+    lines = []
+    for angle, length, width in ((hour_angle, 0.17, 0.03), (minute_angle, 0.24, 0.022)):
+        rad = math.radians(angle)
+        hand_len = int(size * length)
+        end = (cx + int(hand_len * math.cos(rad)), cy + int(hand_len * math.sin(rad)))
+        lines.append((end, int(size * width)))
+    return lines
+
+def center_dot_radius(size):
+    return int(size * 0.028)
+
+def draw_hands(draw, cx, cy, size, hour_angle=HOUR_ANGLE, minute_angle=MINUTE_ANGLE):
+    """시계 바늘 + 중심점"""
+    for end, width in hand_lines(cx, cy, size, hour_angle, minute_angle):
+        draw.line([(cx, cy), end], fill=GOLD, width=width)
+
+    dot_r = center_dot_radius(size)
+    draw.ellipse([cx - dot_r, cy - dot_r, cx + dot_r, cy + dot_r], fill=GOLD_LIGHT)
+
+def markers(cx, cy, size):
+    """12시간 마커 [(x, y, 반지름, 색, 정각 마커 여부)]"""
     marker_r = int(size * 0.32)
+    out = []
     for i in range(12):
         angle = math.radians(i * 30 - 90)
         mx = cx + int(marker_r * math.cos(angle))
         my = cy + int(marker_r * math.sin(angle))
+        major = i % 3 == 0
+        out.append((mx, my, int(size * (0.015 if major else 0.008)), GOLD_LIGHT if major else GOLD, major))
+    return out
 
-        if i % 3 == 0:
-            dot_size = int(size * 0.015)
-            draw.ellipse([mx - dot_size, my - dot_size,
-                          mx + dot_size, my + dot_size], fill=gold_light)
-        else:
-            dot_size = int(size * 0.008)
-            draw.ellipse([mx - dot_size, my - dot_size,
-                          mx + dot_size, my + dot_size], fill=gold)
+def draw_markers(draw, cx, cy, size):
+    for mx, my, dot_size, color, _ in markers(cx, cy, size):
+        draw.ellipse([mx - dot_size, my - dot_size,
+                      mx + dot_size, my + dot_size], fill=color)
 
-    # === 마이크 아이콘 (하단) ===
+def draw_mic(draw, cx, cy, size):
+    """마이크 아이콘 (하단)"""
     mic_y = cy + int(size * 0.32)
     mic_w = int(size * 0.065)
     mic_h = int(size * 0.10)
 
     draw.rounded_rectangle([cx - mic_w, mic_y - mic_h,
                             cx + mic_w, mic_y + int(mic_h * 0.3)],
-                           radius=mic_w, fill=gold)
+                           radius=mic_w, fill=GOLD)
 
     stand_w = int(size * 0.014)
     stand_top = mic_y + int(mic_h * 0.4)
     stand_bottom = stand_top + int(size * 0.05)
-    draw.rectangle([cx - stand_w, stand_top, cx + stand_w, stand_bottom], fill=gold)
+    draw.rectangle([cx - stand_w, stand_top, cx + stand_w, stand_bottom], fill=GOLD)
 
     base_w = int(size * 0.05)
     base_h = int(size * 0.014)
     draw.rounded_rectangle([cx - base_w, stand_bottom,
                             cx + base_w, stand_bottom + base_h],
-                           radius=base_h//2, fill=gold)
+                           radius=base_h//2, fill=GOLD)
 
-    return img
+# 디스플레이 리스트 기준 크기 (@3x) - 이 크기로 재생하면 create_splash_image 와 같은 픽셀
+SPLASH_REF = 600
 
-def save_splash_assets(output_dir):
-    """스플래시 이미지셋 저장"""
+def create_splash_image(width=400, height=400):
+    """스플래시 로고 이미지 생성"""
+    return draw_splash(RasterCanvas((width, height)), width, height)
 
-    os.makedirs(output_dir, exist_ok=True)
+def draw_splash(canvas, width, height):
+    """스플래시 그리기 코드 - 링 -> 바늘 -> 마커 -> 마이크 순서로 겹침"""
+    draw = canvas.draw()
 
-    # 다양한 해상도
-    sizes = [
-        (200, "splash_logo.png"),
-        (400, "splash_logo@2x.png"),
-        (600, "splash_logo@3x.png"),
-    ]
+    cx, cy = width // 2, height // 2
+    size = min(width, height)
 
-    for size, filename in sizes:
-        img = create_splash_image(size, size)
-        img.save(os.path.join(output_dir, filename), 'PNG')
-        print(f"  ✓ {filename}")
+    draw_rings(draw, cx, cy, size)
+    draw_hands(draw, cx, cy, size)
+    draw_markers(draw, cx, cy, size)
+    draw_mic(draw, cx, cy, size)
+
+    return canvas.result()
+
+def record_splash():
+    """스플래시 디스플레이 리스트 기록 (SPLASH_REF 정수 좌표)"""
+    return draw_splash(display_list.Recorder((SPLASH_REF, SPLASH_REF)), SPLASH_REF, SPLASH_REF)
+
+def splash_code_fingerprint():
+    """스플래시 그리기 코드 지문"""
+    return fingerprint(draw_splash, draw_rings, hand_lines, draw_hands, markers, draw_markers, draw_mic)
+
+def splash_display_list():
+    """디스크 캐시된 스플래시 디스플레이 리스트 - 그리기 코드가 바뀔 때만 다시 기록"""
+    fp = fingerprint(splash_code_fingerprint(), display_list.Recorder, display_list.RecordingDraw, SPLASH_REF)
+    return display_list.cached("splash_logo", record_splash, fp)
+
+# 스플래시 로고 해상도 테이블
+SPLASH_SIZES = [
+    (200, "splash_logo.png"),
+    (400, "splash_logo@2x.png"),
+    (600, "splash_logo@3x.png"),
+]
+
+# 벡터 이미지셋 파일
+SPLASH_PDF = "splash_logo.pdf"
+
+# 이전 Display P3 버전 파일 - sRGB 와 같은 색이라 더 만들지 않음, 남아 있으면 삭제
+P3_FILES = ["splash_logo_p3.png", "splash_logo_p3@2x.png", "splash_logo_p3@3x.png"]
+
+def remove_stale(output_dir, filenames, build):
+    """이미지셋 형식을 바꿀 때 남은 이전 형식 파일 삭제 (Xcode 의 unassigned child 경고 방지) - 매니페스트/저장소 참조도 제거"""
+    for filename in filenames:
+        path = os.path.join(output_dir, filename)
+        if os.path.exists(path):
+            print(f"  🗑 {filename}")
+        build.remove(path)
+
+def splash_fingerprint(size):
+    """그리기 코드 + 래스터 캔버스 + ICC 프로필 + 인코딩 설정"""
+    return fingerprint(splash_code_fingerprint(), create_splash_image, display_list.RasterCanvas, size,
+                       color_output.gamut_fingerprint(color_output.SRGB), PNG_PARAMS)
+
+def render_splash_task(size):
+    """워커: 해상도별 스플래시 렌더링 - 선 굵기 2px 등 고정 픽셀 레이아웃 그대로 (축소 재생 아님)"""
+    return create_splash_image(size, size)
+
+def _report(filename, changed):
+    print(f"  ✓ {filename}" if changed else f"  = {filename} (변경 없음)")
+
+def save_splash_assets(output_dir, build=None, jobs=1):
+    """스플래시 이미지셋 저장 - 해상도마다 그 크기로 직접 렌더링 (링 선 굵기가 @1x 에서도 2px 유지)
+
+    sRGB ICC 프로필 태그 - 색 관리 디스플레이 (P3 포함) 가 팔레트 값을 sRGB 로 해석.
+    """
+
+    build = build or AssetBuild()
+    os.makedirs(output_dir, exist_ok=True)
+    remove_stale(output_dir, [SPLASH_PDF] + P3_FILES, build)
+
+    # 다양한 해상도 - 변경된 것만 렌더링
+    pending = []
+    for size, filename in SPLASH_SIZES:
+        path = os.path.join(output_dir, filename)
+        fp = splash_fingerprint(size)
+        if build.is_fresh(path, fp):
+            build.skip(path)
+            print(f"  ⏭ {filename} (변경 없음)")
+            continue
+        pending.append((size, filename, path, fp))
+
+    # 인코딩/쓰기는 출력 단계 스레드에서 - 다음 해상도 렌더링과 겹침
+    with OutputStage(build, report=_report) as stage:
+        render_to_stage(stage, render_splash_task, [size for size, *_ in pending],
+                        [[(path, fp, filename)] for _, filename, path, fp in pending], jobs,
+                        color_output.png_params(color_output.SRGB))
 
     # Contents.json
     contents = {
@@ -115,28 +201,54 @@ def save_splash_assets(output_dir):
         "info": {"version": 1, "author": "xcode"}
     }
 
-    import json
-    with open(os.path.join(output_dir, "Contents.json"), 'w') as f:
-        json.dump(contents, f, indent=2)
-    print("  ✓ Contents.json")
+    fp = fingerprint(save_splash_assets, SPLASH_SIZES)
+    if build.write_json(os.path.join(output_dir, "Contents.json"), contents, fp):
+        print("  ✓ Contents.json")
+
+def save_splash_vector(output_dir, build=None, dl=None):
+    """벡터 스플래시 이미지셋 - PDF 한 장 (1x 포인트 크기) + preserves-vector-representation"""
+
+    build = build or AssetBuild()
+    dl = dl or splash_display_list()
+    os.makedirs(output_dir, exist_ok=True)
+    remove_stale(output_dir, [filename for _, filename in SPLASH_SIZES] + P3_FILES, build)
 
-def create_background_color(output_dir):
+    filename = SPLASH_PDF
+    points = SPLASH_SIZES[0][0]
+    fp = fingerprint(dl.digest(), points, display_list.to_pdf)
+    if build.write_bytes(os.path.join(output_dir, filename), display_list.to_pdf(dl, points), fp):
+        print(f"  ✓ {filename}")
+    else:
+        print(f"  = {filename} (변경 없음)")
+
+    contents = {
+        "images": [{"idiom": "universal", "filename": filename}],
+        "info": {"version": 1, "author": "xcode"},
+        "properties": {"preserves-vector-representation": True}
+    }
+
+    fp = fingerprint(save_splash_vector, points)
+    if build.write_json(os.path.join(output_dir, "Contents.json"), contents, fp):
+        print("  ✓ Contents.json")
+
+# 스플래시 배경 네이비 (sRGB 0-255)
+BACKGROUND = (15, 20, 40)
+
+def create_background_color(output_dir, build=None):
     """배경색 컬러셋 생성"""
 
+    build = build or AssetBuild()
+
     os.makedirs(output_dir, exist_ok=True)
 
     # 네이비 배경색
+    red, green, blue = (f"{v / 255:.3f}" for v in BACKGROUND)
     contents = {
         "colors": [
             {
                 "color": {
                     "color-space": "srgb",
-                    "components": {
-                        "red": "0.059",
-                        "green": "0.078",
-                        "blue": "0.157",
-                        "alpha": "1.000"
-                    }
+                    "components": {"red": red, "green": green, "blue": blue, "alpha": "1.000"}
                 },
                 "idiom": "universal"
             }
@@ -144,23 +256,46 @@ def create_background_color(output_dir):
         "info": {"version": 1, "author": "xcode"}
     }
 
-    import json
-    with open(os.path.join(output_dir, "Contents.json"), 'w') as f:
-        json.dump(contents, f, indent=2)
-    print("  ✓ SplashBackground colorset")
+    fp = fingerprint(create_background_color, BACKGROUND)
+    if build.write_json(os.path.join(output_dir, "Contents.json"), contents, fp):
+        print("  ✓ SplashBackground colorset")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 스플래시 에셋 생성")
+    parser.add_argument("--incremental", action="store_true",
+                        help="입력 지문과 디스크 파일이 그대로인 에셋은 렌더링/쓰기 생략")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="병렬 렌더링 프로세스 수 (0 = CPU 코어 수)")
+    parser.add_argument("--optimize", action="store_true",
+                        help="기록한 PNG 를 무손실 최적화 (필터/zlib 탐색, 팔레트 변환, 부가 청크 제거)")
+    parser.add_argument("--vector", action="store_true",
+                        help="스플래시 로고를 PNG 3장 대신 벡터 PDF 한 장으로 (Xcode 가 해상도별로 래스터화)")
+    parser.add_argument("--store", action="store_true",
+                        help="출력을 내용 주소 저장소 (.asset_store) 에 한 번만 두고 reflink/하드링크로 연결")
+    args = parser.parse_args()
+    build = AssetBuild(incremental=args.incremental, store=BlobStore() if args.store else None)
+
     print("✨ 스플래시 스크린 생성 중...")
     print()
 
     assets_dir = "VoiceScheduler/Assets.xcassets"
 
     print("📁 스플래시 로고 저장 중...")
-    save_splash_assets(f"{assets_dir}/SplashLogo.imageset")
+    jobs = resolve_jobs(args.jobs)
+    if args.vector:
+        save_splash_vector(f"{assets_dir}/SplashLogo.imageset", build)
+    else:
+        save_splash_assets(f"{assets_dir}/SplashLogo.imageset", build, jobs)
 
     print()
     print("🎨 배경색 생성 중...")
-    create_background_color(f"{assets_dir}/SplashBackground.colorset")
+    create_background_color(f"{assets_dir}/SplashBackground.colorset", build)
+
+    if args.optimize:
+        print()
+        print("🗜 PNG 최적화 중...")
+        optimize_build(build, jobs)
+    build.save()
 
     print()
     print("✅ 스플래시 에셋 생성 완료!")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Golden Diff
+새 렌더링과 골든 PNG 비교 - 해시 우선, 타일 단위 채널/SSIM 비교, 변경된 에셋만 히트맵
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from asset_build import sha256_file
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# --render 로 실행할 생성기 (저장소 루트 기준 상대 경로로 출력)
+GENERATORS = {
+    "icon": ["generate_app_icon.py"],
+    "splash": ["generate_splash.py"],
+    "screenshots": ["generate_screenshots.py"],
+}
+
+# 생성기 출력 경로 -> 골든 경로 (접두사 치환, '/' 구분). 스크린샷 생성기는 AppStore/screenshots 에
+# 쓰지만 골든은 커밋된 AppStore/Screenshots 아래 같은 파일 이름 (macOS 에서는 같은 디렉터리)
+GOLDEN_PREFIXES = [
+    ("AppStore/screenshots/", "AppStore/Screenshots/"),
+]
+
+# 한 번에 float 로 바꾸는 행 수 (SSIM 창 크기의 배수)
+TILE_ROWS = 256
+SSIM_WINDOW = 8
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+LUMA = np.array([0.299, 0.587, 0.114], np.float32)
+
+
+# === 비교 ===
+
+def _common_mode(a, b):
+    alpha = any(im.mode in ('RGBA', 'LA', 'PA') or 'transparency' in im.info for im in (a, b))
+    return 'RGBA' if alpha else 'RGB'
+
+
+def _ssim_windows(ya, yb):
+    """겹치지 않는 8x8 창별 SSIM (휘도) - 창 개수, SSIM 합"""
+    w = SSIM_WINDOW
+    h, width = (ya.shape[0] // w) * w, (ya.shape[1] // w) * w
+    if not h or not width:
+        return 0, 0.0
+    shape = (h // w, w, width // w, w)
+    xa, xb = ya[:h, :width].reshape(shape), yb[:h, :width].reshape(shape)
+    mu_a, mu_b = xa.mean(axis=(1, 3)), xb.mean(axis=(1, 3))
+    var_a = (xa * xa).mean(axis=(1, 3)) - mu_a * mu_a
+    var_b = (xb * xb).mean(axis=(1, 3)) - mu_b * mu_b
+    cov = (xa * xb).mean(axis=(1, 3)) - mu_a * mu_b
+    ssim = ((2 * mu_a * mu_b + SSIM_C1) * (2 * cov + SSIM_C2)) / \
+           ((mu_a * mu_a + mu_b * mu_b + SSIM_C1) * (var_a + var_b + SSIM_C2))
+    return ssim.size, float(ssim.sum())
+
+
+def compare_images(new, golden, heatmap=False):
+    """두 이미지의 채널별 차이 + SSIM - 타일(행 묶음)마다만 float 변환
+
+    반환: dict(max, mean, changed_pixels, ssim, channels), heatmap 이면 RGB 히트맵 이미지도.
+    """
+    mode = _common_mode(new, golden)
+    a = np.asarray(new if new.mode == mode else new.convert(mode))
+    b = np.asarray(golden if golden.mode == mode else golden.convert(mode))
+    h, w, bands = a.shape
+    channel_max = np.zeros(bands, np.int32)
+    channel_sum = np.zeros(bands, np.float64)
+    changed = 0
+    windows, ssim_sum = 0, 0.0
+    heat = np.empty((h, w, 3), np.uint8) if heatmap else None
+
+    for y0 in range(0, h, TILE_ROWS):
+        ta = a[y0:y0 + TILE_ROWS].astype(np.int16)
+        tb = b[y0:y0 + TILE_ROWS].astype(np.int16)
+        diff = np.abs(ta - tb)
+        channel_max = np.maximum(channel_max, diff.max(axis=(0, 1)))
+        channel_sum += diff.sum(axis=(0, 1))
+        pixel_diff = diff.max(axis=2)
+        changed += int(np.count_nonzero(pixel_diff))
+
+        ya = ta[:, :, :3].astype(np.float32) @ LUMA
+        yb = tb[:, :, :3].astype(np.float32) @ LUMA
+        n, s = _ssim_windows(ya, yb)
+        windows += n
+        ssim_sum += s
+
+        if heatmap:
+            # 새 렌더링을 어둡게 깔고 차이를 빨강/노랑으로 (작은 차이도 보이게 증폭)
+            base = (ya * 0.3).astype(np.uint8)
+            amp = np.minimum(pixel_diff.astype(np.int32) * 8, 255).astype(np.uint8)
+            tile = heat[y0:y0 + TILE_ROWS]
+            tile[:, :, 0] = np.maximum(base, amp)
+            tile[:, :, 1] = np.where(pixel_diff > 32, amp, base)
+            tile[:, :, 2] = np.where(pixel_diff > 0, 0, base)
+
+    result = {
+        "max": int(channel_max.max()),
+        "mean": float(channel_sum.sum() / (h * w * bands)),
+        "changed_pixels": changed,
+        "ssim": ssim_sum / windows if windows else 1.0,
+        "channels": {band: int(m) for band, m in zip(mode, channel_max)},
+    }
+    return (result, Image.fromarray(heat)) if heatmap else (result, None)
+
+
+def diff_file(new_path, golden_path, heatmap_path=None, tolerance=0, min_ssim=1.0):
+    """파일 한 쌍 비교 -> 상태 dict. 바이트 해시가 같으면 디코딩하지 않는다"""
+    if not os.path.exists(golden_path):
+        return {"status": "new"}
+    if sha256_file(new_path) == sha256_file(golden_path):
+        return {"status": "identical"}
+    with Image.open(new_path) as new, Image.open(golden_path) as golden:
+        if new.size != golden.size:
+            return {"status": "changed", "reason": f"size {golden.size} -> {new.size}"}
+        result, _ = compare_images(new, golden)
+        if result["changed_pixels"] == 0:
+            return {"status": "same-pixels", **result}
+        failed = result["max"] > tolerance or result["ssim"] < min_ssim
+        if failed and heatmap_path:
+            # 히트맵은 실제로 바뀐 에셋만 (두 번째 패스에서만 만든다)
+            _, heat = compare_images(new, golden, heatmap=True)
+            os.makedirs(os.path.dirname(heatmap_path) or '.', exist_ok=True)
+            heat.save(heatmap_path)
+        return {"status": "changed" if failed else "within-tolerance", **result}
+
+
+def find_pngs(root):
+    for base, _, files in os.walk(root):
+        for name in sorted(files):
+            if name.lower().endswith('.png'):
+                yield os.path.relpath(os.path.join(base, name), root)
+
+
+def golden_path(rel):
+    """생성기 출력 상대 경로 -> 골든 상대 경로 (GOLDEN_PREFIXES, 나머지는 같은 경로)"""
+    key = rel.replace(os.sep, '/')
+    for prefix, golden in GOLDEN_PREFIXES:
+        if key.startswith(prefix):
+            return os.path.join(*(golden + key[len(prefix):]).split('/'))
+    return rel
+
+
+def diff_trees(new_root, golden_root, out_dir, tolerance=0, min_ssim=1.0):
+    """new_root 의 모든 PNG 를 golden_root 의 대응 경로 (golden_path) 와 비교 -> [(경로, 상태)]"""
+    results = []
+    for rel in sorted(find_pngs(new_root)):
+        heat = os.path.join(out_dir, os.path.splitext(rel)[0] + ".diff.png") if out_dir else None
+        results.append((rel, diff_file(os.path.join(new_root, rel), os.path.join(golden_root, golden_path(rel)),
+                                       heat, tolerance, min_ssim)))
+    return results
+
+
+def render_to(scratch, only=None):
+    """생성기를 scratch 디렉터리에서 실행 (저장소 파일은 건드리지 않음)"""
+    for name, argv in GENERATORS.items():
+        if only and name not in only:
+            continue
+        print(f"  Rendering {name}...")
+        subprocess.run([sys.executable, os.path.join(ROOT, argv[0]), *argv[1:]], cwd=scratch,
+                       check=True, stdout=subprocess.DEVNULL)
+
+
+def report(results):
+    """상태별 출력 -> 실패 개수 (changed + 골든 없음 new)"""
+    failures = 0
+    for rel, r in results:
+        status = r["status"]
+        if status == "identical":
+            continue
+        if "ssim" in r:
+            detail = f"max {r['max']}, mean {r['mean']:.3f}, {r['changed_pixels']:,} px, SSIM {r['ssim']:.5f}"
+        else:
+            detail = r.get("reason", "no golden")
+        print(f"  {status:<16} {rel}  ({detail})")
+        failures += status in ("changed", "new")
+    identical = sum(r["status"] == "identical" for _, r in results)
+    missing = sum(r["status"] == "new" for _, r in results)
+    print(f"  {len(results)} assets, {identical} identical by hash, {failures - missing} changed, {missing} without golden")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 골든 이미지 회귀 검사")
+    parser.add_argument("new", nargs="?", help="새 렌더링 루트 (생성기 출력 상대 경로, GOLDEN_PREFIXES 로 골든에 대응)")
+    parser.add_argument("--render", action="store_true", help="임시 디렉터리에서 생성기를 실행한 결과를 비교")
+    parser.add_argument("--only", help="--render 할 생성기 (쉼표 구분: icon, splash, screenshots)")
+    parser.add_argument("--golden", default=ROOT, help="골든 루트 (기본: 저장소의 커밋된 에셋)")
+    parser.add_argument("--out", default="golden_diff", help="히트맵 출력 디렉터리")
+    parser.add_argument("--tolerance", type=int, default=0, help="허용 채널 최대 차이 (0-255)")
+    parser.add_argument("--min-ssim", type=float, default=1.0, help="허용 최소 SSIM")
+    parser.add_argument("--update", action="store_true", help="변경/신규 렌더링을 골든으로 복사")
+    args = parser.parse_args()
+
+    if not args.new and not args.render:
+        parser.error("새 렌더링 루트를 주거나 --render 를 사용하세요")
+    scratch = None
+    new_root = args.new
+    if args.render:
+        scratch = tempfile.mkdtemp(prefix="golden-")
+        render_to(scratch, args.only.split(',') if args.only else None)
+        new_root = scratch
+    try:
+        results = diff_trees(new_root, args.golden, os.path.abspath(args.out), args.tolerance, args.min_ssim)
+        failures = report(results)
+        if args.update:
+            for rel, r in results:
+                if r["status"] in ("new", "changed", "within-tolerance"):
+                    dst = os.path.join(args.golden, golden_path(rel))
+                    os.makedirs(os.path.dirname(dst), exist_ok=True)
+                    shutil.copyfile(os.path.join(new_root, rel), dst)
+            print("  Goldens updated")
+            failures = 0
+        elif failures:
+            print(f"  Heat maps: {args.out}/ (new goldens need --update)")
+    finally:
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Gradient Engine
+네이비 배경 그라데이션 - NumPy 벡터 연산 + 메모이즈
+"""
+
+from functools import lru_cache
+import math
+
+from PIL import Image
+import numpy as np
+
+
+def _normalize_stops(stops):
+    """컬러 스톱을 해시 가능한 튜플로 정규화"""
+    return tuple(tuple(int(c) for c in color) for color in stops)
+
+
+def _ramp(t, stops):
+    """0..1 비율 배열을 스톱 사이에서 선형 보간 (채널별 int 절삭)"""
+    colors = np.asarray(stops, dtype=np.float64)
+    segments = len(stops) - 1
+    if segments == 0:
+        return np.broadcast_to(colors[0], t.shape + colors[0].shape).astype(np.uint8)
+
+    pos = t * segments
+    idx = np.minimum(pos.astype(np.intp), segments - 1)
+    local = pos - idx
+    start = colors[idx]
+    delta = colors[idx + 1] - start
+    # 기존 draw.line 루프와 같은 식: int(a + (b - a) * ratio)
+    return (start + delta * local[..., None]).astype(np.uint8)
+
+
+def _pixels(size, stops, kind, mode, y0, y1):
+    """전체 size 그라데이션 중 y0..y1 행만 계산한 이미지"""
+    width, height = size
+
+    if kind == 'linear':
+        # 세로 방향 - 한 열만 계산하고 가로로 브로드캐스트
+        t = np.arange(y0, y1, dtype=np.float64) / height
+        column = _ramp(t, stops)
+        pixels = np.broadcast_to(column[:, None, :], (y1 - y0, width, column.shape[-1]))
+    elif kind == 'radial':
+        # 중심에서 모서리까지 거리 비율
+        cx, cy = width / 2, height / 2
+        ys = (np.arange(y0, y1, dtype=np.float64) - cy)[:, None]
+        xs = (np.arange(width, dtype=np.float64) - cx)[None, :]
+        t = np.minimum(np.hypot(xs, ys) / math.hypot(cx, cy), 1.0)
+        pixels = _ramp(t, stops)
+    else:
+        raise ValueError(f"unknown gradient kind: {kind}")
+
+    channels = pixels.shape[-1]
+    if mode == 'RGBA' and channels == 3:
+        alpha = np.full(pixels.shape[:2] + (1,), 255, dtype=np.uint8)
+        pixels = np.concatenate([pixels, alpha], axis=-1)
+    elif mode == 'RGB' and channels == 4:
+        pixels = pixels[..., :3]
+
+    return Image.fromarray(np.ascontiguousarray(pixels))
+
+
+@lru_cache(maxsize=16)
+def _render(size, stops, kind, mode):
+    return _pixels(size, stops, kind, mode, 0, size[1])
+
+
+def gradient(size, stops, kind='linear', mode='RGB', rows=None):
+    """그라데이션 이미지 반환 - (size, stops, kind, mode) 별로 한 번만 렌더링
+
+    반환값은 캐시된 래스터의 사본이므로 그 위에 자유롭게 그려도 된다.
+    rows=(y0, y1) 이면 그 행 구간만 캐시 없이 계산한다 (큰 마스터의 띠 렌더링용).
+    """
+    if rows is not None:
+        return _pixels(tuple(size), _normalize_stops(stops), kind, mode, *rows)
+    return _render(tuple(size), _normalize_stops(stops), kind, mode).copy()
+
+
+def linear_gradient(size, top, bottom, mode='RGB', rows=None):
+    """위 -> 아래 선형 그라데이션"""
+    return gradient(size, (top, bottom), 'linear', mode, rows)
+
+
+def radial_gradient(size, center, edge, mode='RGB', rows=None):
+    """중심 -> 모서리 원형 그라데이션"""
+    return gradient(size, (center, edge), 'radial', mode, rows)
+
+
+def clear_cache():
+    _render.cache_clear()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Icon Variants
+iOS 18 다크/틴트 아이콘 - 디스플레이 리스트 레이어를 기준 크기로 한 번 재생해 (아이콘 세트와 같은 피라미드로 축소) 캐시하고 채널 연산으로 파생
+"""
+
+import numpy as np
+from PIL import Image
+
+import display_list
+from resize_plan import Pyramid
+
+# 외관 이름 = Contents.json luminosity 값
+APPEARANCES = ("dark", "tinted")
+
+# 골드 계열 레이어 - 다크 외관에서 다시 칠함 (mic 는 흰색 그대로, background 는 투명으로)
+GOLD_GROUPS = ("frame", "header", "waves")
+BACKGROUND_GROUP = "background"
+
+# 다크 외관 골드 - 시스템 어두운 배경 위에서 대비가 나도록 원래 골드보다 밝게
+GOLD = (218, 175, 75)
+DARK_GOLD = (240, 200, 105)
+# 다크 외관에서 넓은 면은 반투명하게 - 헤더 위 요일 도트가 묻히지 않도록
+DARK_OPACITY = {"header": 0.35}
+
+# Rec. 709 휘도
+LUMA = np.array([0.2126, 0.7152, 0.0722], np.float32)
+
+# dl 다이제스트 -> [(그룹, 기준 크기 레이어 Pyramid)]
+_masters = {}
+# (dl 다이제스트, 가로) -> [(그룹, float32 RGBA 0-1)]
+_layers = {}
+
+
+# === 레이어 ===
+
+def master_layers(dl):
+    """그룹 구간별 투명 레이어 (그리기 순서) 를 기준 크기 정수 좌표로 한 번만 재생 - 기본 아이콘과 같은 도형"""
+    key = dl.digest()
+    if key not in _masters:
+        _masters[key] = [(name, Pyramid(display_list.replay(part))) for name, part in display_list.split_groups(dl)]
+    return _masters[key]
+
+
+def icon_layers(dl, width):
+    """width 크기 레이어 - 기본 아이콘 세트 (resize_plan) 와 같은 피라미드 레벨에서 같은 LANCZOS 축소
+
+    크기별 SDF 재생은 헤더 도트/선 굵기/마이크 윤곽이 기본 아이콘과 달라지므로 쓰지 않는다.
+    """
+    key = (dl.digest(), width)
+    if key not in _layers:
+        dims = (width, width)
+        layers = []
+        for name, pyramid in master_layers(dl):
+            src = pyramid.source_for(dims)
+            img = src if src.size == dims else src.resize(dims, pyramid.resample)
+            layers.append((name, np.asarray(img, np.float32) / 255))
+        _layers[key] = layers
+    return _layers[key]
+
+
+def clear_cache():
+    _masters.clear()
+    _layers.clear()
+
+
+def luminance(rgb):
+    return rgb @ LUMA
+
+
+def composite(layers):
+    """[(RGB, 알파)] 를 순서대로 source-over 합성 -> (RGB, 알파) - 프리멀티플라이로 한 번에"""
+    rgb, alpha = None, None
+    for src, a in layers:
+        a = a[..., None]
+        if rgb is None:
+            rgb, alpha = src * a, a
+            continue
+        rgb = src * a + rgb * (1 - a)
+        alpha = a + alpha * (1 - a)
+    return np.where(alpha > 0, rgb / np.maximum(alpha, 1e-6), 0), alpha[..., 0]
+
+
+def _to_image(rgb, alpha):
+    rgba = np.concatenate([rgb, alpha[..., None]], axis=2)
+    return Image.fromarray(np.rint(np.clip(rgba, 0, 1) * 255).astype(np.uint8), 'RGBA')
+
+
+def _foreground(layers):
+    return [(name, px[..., :3], px[..., 3]) for name, px in layers if name != BACKGROUND_GROUP]
+
+
+# === 외관 ===
+
+def dark_icon(layers):
+    """다크: 배경 투명, 골드 레이어는 휘도 비율을 유지한 채 DARK_GOLD 로 (넓은 면은 반투명)"""
+    gain = np.array(DARK_GOLD, np.float32) / 255 / luminance(np.array(GOLD, np.float32) / 255)
+    parts = []
+    for name, rgb, alpha in _foreground(layers):
+        if name in GOLD_GROUPS:
+            rgb = luminance(rgb)[..., None] * gain
+            alpha = alpha * DARK_OPACITY.get(name, 1.0)
+        parts.append((rgb, alpha))
+    return _to_image(*composite(parts))
+
+
+def tinted_icon(layers):
+    """틴트: 전경 합성의 휘도만 남긴 회색조 마스크 (배경 투명) - 시스템이 틴트 색을 곱함"""
+    rgb, alpha = composite([(rgb, alpha) for _, rgb, alpha in _foreground(layers)])
+    gray = luminance(rgb)[..., None]
+    return _to_image(np.repeat(gray, 3, axis=2), alpha)
+
+
+DERIVE = {"dark": dark_icon, "tinted": tinted_icon}
+
+
+def variant_task(task):
+    """워커: (디스플레이 리스트, 가로, 외관) -> 파생 이미지 (레이어는 프로세스별 캐시)"""
+    dl, width, appearance = task
+    return DERIVE[appearance](icon_layers(dl, width))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Localization
+.lproj 스트링 스트리밍 파서 + 문자열 ID 인덱스 (스크린샷 로케일 매트릭스용)
+"""
+
+from functools import lru_cache
+import glob
+import os
+import unicodedata
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 앱 번역 + 스크린샷 전용 마케팅 문구 (같은 ID 면 뒤쪽이 우선)
+STRINGS_GLOBS = [
+    os.path.join(ROOT, "VoiceScheduler", "Resources", "*.lproj", "Localizable.strings"),
+    os.path.join(ROOT, "AppStore", "templates", "*.lproj", "Screenshots.strings"),
+]
+
+BASE_LOCALE = "en"
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\', "'": "'", '0': '\0'}
+
+
+def _chars(f, chunk_size=1 << 14):
+    for chunk in iter(lambda: f.read(chunk_size), ''):
+        yield from chunk
+
+
+def iter_strings(path):
+    """.strings 파일을 청크 단위로 읽으며 (키, 값) 을 순서대로 생성
+
+    주석 (/* */, //), 따옴표 없는 키, 이스케이프 (\\n, \\", \\Uxxxx) 를 처리한다.
+    """
+    with open(path, encoding='utf-8-sig') as f:
+        chars = _chars(f)
+        pending = []   # 현재 "키" = "값" 의 토큰
+        for ch in chars:
+            if ch.isspace():
+                continue
+            if ch == '/':
+                nxt = next(chars, '')
+                if nxt == '/':
+                    for ch in chars:
+                        if ch == '\n':
+                            break
+                elif nxt == '*':
+                    prev = ''
+                    for ch in chars:
+                        if prev == '*' and ch == '/':
+                            break
+                        prev = ch
+                continue
+            if ch == '"':
+                buf = []
+                for ch in chars:
+                    if ch == '"':
+                        break
+                    if ch == '\\':
+                        esc = next(chars, '')
+                        if esc in ('U', 'u'):
+                            buf.append(chr(int(''.join(next(chars, '') for _ in range(4)), 16)))
+                        else:
+                            buf.append(_ESCAPES.get(esc, esc))
+                    else:
+                        buf.append(ch)
+                pending.append(''.join(buf))
+            elif ch == ';':
+                if len(pending) == 2:
+                    yield pending[0], pending[1]
+                pending = []
+            elif ch == '=':
+                continue
+            else:
+                # 따옴표 없는 키 (영숫자/밑줄)
+                buf = [ch]
+                for ch in chars:
+                    if ch.isspace() or ch in '=;':
+                        break
+                    buf.append(ch)
+                pending.append(''.join(buf))
+                if ch == ';':
+                    if len(pending) == 2:
+                        yield pending[0], pending[1]
+                    pending = []
+
+
+def locale_of(path):
+    return os.path.basename(os.path.dirname(path)).rsplit('.', 1)[0]
+
+
+class StringsIndex:
+    """문자열 ID -> {로케일: 값} 인덱스 - 모든 .strings 파일을 한 번씩만 읽음"""
+
+    def __init__(self, patterns=STRINGS_GLOBS):
+        self.by_id = {}
+        self.locales = set()
+        self.files = []
+        for pattern in patterns:
+            for path in sorted(glob.glob(pattern)):
+                locale = locale_of(path)
+                self.locales.add(locale)
+                self.files.append(path)
+                for key, value in iter_strings(path):
+                    self.by_id.setdefault(key, {})[locale] = value
+
+    def get(self, string_id, locale=BASE_LOCALE):
+        """로케일 값, 없으면 기본 로케일 (en) 값"""
+        values = self.by_id.get(string_id)
+        if not values:
+            raise KeyError(f"unknown string id: {string_id!r}")
+        if locale in values:
+            return values[locale]
+        return values[BASE_LOCALE]
+
+
+@lru_cache(maxsize=None)
+def load_index():
+    return StringsIndex()
+
+
+def app_locales():
+    """앱이 배포하는 로케일 (en 먼저)"""
+    pattern = STRINGS_GLOBS[0]
+    locales = sorted(locale_of(p) for p in glob.glob(pattern))
+    return sorted(locales, key=lambda l: l != BASE_LOCALE)
+
+
+def display_text(value):
+    """렌더링용 정리 - 예문 앞의 컬러 이모지(🔴 등)는 폰트에 없으므로 제거"""
+    i = 0
+    while i < len(value) and (unicodedata.category(value[i]) == 'So' or value[i] in ' \ufe0f'):
+        i += 1
+    return value[i:]
+
+
+def strings_for(locale=BASE_LOCALE):
+    """템플릿의 "@id" / "@id@locale" 참조를 해석하는 함수"""
+    index = load_index()
+
+    def resolve(ref):
+        string_id, _, other = ref.partition('@')
+        return display_text(index.get(string_id, other or locale))
+
+    return resolve
+
+
+def localize(value, resolve):
+    """데이터 행 안의 "@id" 문자열을 재귀적으로 번역"""
+    if isinstance(value, str):
+        return resolve(value[1:]) if value.startswith('@') else value
+    if isinstance(value, list):
+        return [localize(v, resolve) for v in value]
+    if isinstance(value, dict):
+        return {k: localize(v, resolve) for k, v in value.items()}
+    return value
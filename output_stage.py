@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Output Stage
+비동기 인코딩/쓰기 단계 - 렌더링한 이미지를 유한 큐에 넣으면 스레드 풀이 PNG 인코딩 + 원자적 쓰기
+"""
+
+import os
+import queue
+import threading
+
+from asset_build import PNG_PARAMS, encode_png
+from parallel_render import imap_parallel
+
+# 큐에서 기다릴 수 있는 최대 작업 수 - 가득 차면 submit 이 막혀 렌더링이 인코딩을 기다림
+DEFAULT_DEPTH = 4
+
+_STOP = object()
+
+
+class OutputStage:
+    """렌더링과 PNG 인코딩/쓰기를 겹치는 생산자/소비자 출력 단계
+
+    zlib 압축은 GIL 을 놓으므로 인코딩 스레드가 다음 렌더링과 동시에 돈다. 큐 크기가
+    depth 로 묶여 있어 (backpressure) 렌더링이 앞서 나가도 메모리에는 depth 장까지만 쌓인다.
+    인코딩은 AssetBuild.encode (저장소가 있으면 같은 픽셀의 이전 결과 재사용), 쓰기는
+    AssetBuild.write_bytes (임시 파일 + rename, 또는 저장소 blob 링크). 작업 하나가 실패하면 남은 작업은
+    버리고, 다음 submit 또는 close() 에서 첫 예외를 다시 던진다.
+
+        with OutputStage(build, report=print_result) as stage:
+            stage.submit(img, [(path, fp, label)])
+    """
+
+    def __init__(self, build, threads=None, depth=DEFAULT_DEPTH, report=None):
+        self.build = build
+        self.threads = threads or os.cpu_count() or 1
+        self.queue = queue.Queue(maxsize=depth)
+        self.report = report
+        self.error = None
+        self._lock = threading.Lock()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 본문 예외가 있어도 이미 큐에 들어간 출력은 마저 쓰고, 본문 예외를 우선 전파
+        self.close(raise_error=exc is None)
+        return False
+
+    # --- 생산자 ---
+
+    def submit(self, img, targets, params=PNG_PARAMS):
+        """img 를 한 번 인코딩해 targets [(경로, 지문, 라벨)] 모두에 쓰기 - 큐가 가득 차면 대기"""
+        self._put(("image", img, params, targets))
+
+    def submit_bytes(self, data, targets):
+        """이미 인코딩된 바이트 (프로세스 풀 워커 결과) 를 targets 에 쓰기"""
+        self._put(("bytes", data, None, targets))
+
+    def flush(self):
+        """지금까지 넣은 작업이 모두 끝날 때까지 대기"""
+        self.queue.join()
+        self._raise()
+
+    def close(self, raise_error=True):
+        """남은 작업을 마저 처리하고 스레드 종료"""
+        for _ in self._workers:
+            self.queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        if raise_error:
+            self._raise()
+
+    def _put(self, item):
+        self._raise()
+        self._start()
+        self.queue.put(item)
+
+    def _raise(self):
+        if self.error is not None:
+            raise self.error
+
+    def _start(self):
+        # 첫 submit 에서 시작 - 프로세스 풀이 fork 한 뒤에 스레드가 생기도록
+        if self._workers:
+            return
+        for _ in range(self.threads):
+            worker = threading.Thread(target=self._work, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    # --- 소비자 ---
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                if self.error is None:
+                    self._process(*item)
+            except BaseException as e:
+                with self._lock:
+                    if self.error is None:
+                        self.error = e
+            finally:
+                self.queue.task_done()
+
+    def _process(self, kind, payload, params, targets):
+        data = self.build.encode(payload, params) if kind == "image" else payload
+        # 매니페스트 갱신과 진행 출력은 한 번에 한 스레드만
+        with self._lock:
+            for path, fp, label in targets:
+                changed = self.build.write_bytes(path, data, fp)
+                if self.report:
+                    self.report(label, changed)
+
+
+def _encode_task(task):
+    """워커: 렌더링 + 인코딩"""
+    render, arg, params = task
+    return encode_png(render(arg), params)
+
+
+def render_to_stage(stage, render, tasks, targets, jobs=1, params=PNG_PARAMS):
+    """render(tasks[i]) 이미지를 targets[i] 로 출력
+
+    jobs <= 1 이면 이 프로세스에서 렌더링하고 이미지를 큐에 넣는다 (인코딩은 스레드에서 다음
+    렌더링과 겹침). jobs > 1 이면 프로세스 풀 워커가 렌더링 + 인코딩하고 끝나는 대로 바이트를
+    큐에 넣는다 (쓰기만). render 는 피클 가능한 모듈 함수여야 한다.
+    """
+    if jobs <= 1:
+        for arg, target in zip(tasks, targets):
+            stage.submit(render(arg), target, params)
+        return
+    encoded = imap_parallel(_encode_task, [(render, arg, params) for arg in tasks], jobs)
+    for data, target in zip(encoded, targets):
+        stage.submit_bytes(data, target)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Parallel Render
+프로세스 풀 병렬 렌더링 - 큰 마스터 이미지는 메모리 매핑 raw 버퍼로 공유
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import mmap
+import os
+import tempfile
+
+from PIL import Image
+
+# 워커 프로세스별로 매핑해 둔 마스터 이미지 (경로 -> Image)
+_mapped = {}
+
+
+def resolve_jobs(jobs):
+    """--jobs 값 해석 (0 이하 = CPU 코어 수)"""
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def run_parallel(func, tasks, jobs=1):
+    """tasks 를 순서대로 func 에 적용한 결과 목록
+
+    jobs <= 1 이면 현재 프로세스에서 직렬로 실행한다. 병렬/직렬 모두 같은
+    func 를 호출하므로 결과 바이트는 동일하다.
+    """
+    return list(imap_parallel(func, tasks, jobs))
+
+
+def imap_parallel(func, tasks, jobs=1):
+    """run_parallel 의 스트리밍 버전 - 결과를 tasks 순서대로 나오는 즉시 하나씩"""
+    tasks = list(tasks)
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield func(task)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        yield from pool.map(func, tasks)
+
+
+@contextmanager
+def shared_image(img, jobs=1):
+    """워커에 넘길 이미지 핸들
+
+    직렬이면 이미지 자체를, 병렬이면 raw 픽셀을 임시 파일에 한 번 쓰고
+    (경로, 모드, 크기) 핸들을 돌려준다. 워커는 피클링 대신 파일을 mmap 해서
+    OS 페이지 캐시를 공유한다.
+    """
+    if jobs <= 1:
+        yield img
+        return
+
+    fd, path = tempfile.mkstemp(prefix="voicescheduler_", suffix=".raw")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(img.tobytes())
+        yield (path, img.mode, img.size)
+    finally:
+        _mapped.pop(path, None)
+        os.remove(path)
+
+
+def resolve_image(handle):
+    """shared_image() 핸들을 Image 로 변환 (워커 프로세스당 한 번 매핑)"""
+    if isinstance(handle, Image.Image):
+        return handle
+
+    path, mode, size = handle
+    img = _mapped.get(path)
+    if img is None:
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        img = Image.frombuffer(mode, size, buf, 'raw', mode, 0, 1)
+        _mapped[path] = img
+    return img
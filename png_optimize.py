@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler PNG Optimize
+렌더링 후 PNG 최적화 - 필터/zlib 후보 탐색, 무손실 팔레트 변환, 부가 청크 제거
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import struct
+import zlib
+
+import numpy as np
+from PIL import Image
+
+from asset_build import atomic_write, sha256_bytes, sha256_file
+from parallel_render import resolve_jobs, run_parallel
+
+CACHE_PATH = ".png_optimize_cache.json"
+
+# 인코더가 바뀌면 캐시 무효화
+OPTIMIZER_VERSION = 2
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG 색상 타입
+COLOR_TYPES = {'L': 0, 'RGB': 2, 'P': 3, 'LA': 4, 'RGBA': 6}
+
+# 스캔라인 필터 (0-4 고정 + 행마다 최소 합 선택)
+FILTERS = (0, 1, 2, 3, 4, "adaptive")
+
+# 1단계: 필터마다 빠른 레벨로 시험 압축 -> 상위 필터만 2단계에서 레벨/전략 조합
+TRIAL_LEVEL = 6
+FINALISTS = 2
+ZLIB_CANDIDATES = [
+    (9, zlib.Z_DEFAULT_STRATEGY),
+    (9, zlib.Z_FILTERED),
+    (9, zlib.Z_RLE),
+]
+
+
+# === 입력 검사 ===
+
+def png_chunks(data):
+    """PNG 바이트 -> (IHDR dict, 청크 타입 목록) - 픽셀은 디코딩하지 않음. PNG 가 아니면 (None, [])"""
+    if data[:8] != PNG_SIGNATURE:
+        return None, []
+    ihdr, chunks, pos = None, [], 8
+    while pos + 8 <= len(data):
+        length, ctype = struct.unpack('>I4s', data[pos:pos + 8])
+        if ctype == b'IHDR' and length >= 13:
+            w, h, depth, color, _, _, interlace = struct.unpack('>IIBBBBB', data[pos + 8:pos + 21])
+            ihdr = {"width": w, "height": h, "bit_depth": depth, "color_type": color, "interlace": interlace}
+        chunks.append(ctype)
+        pos += 12 + length
+        if ctype == b'IEND':
+            break
+    return ihdr, chunks
+
+
+def passthrough_reason(data):
+    """재인코딩하면 정보를 잃는 입력이면 이유, 아니면 None
+
+    Pillow 는 16비트 RGB(A) 를 8비트로 읽고 I;16 은 8비트 L 로 변환되므로 8비트가 아닌 PNG 는
+    건드리지 않는다. APNG 는 첫 프레임만 디코딩되므로 역시 그대로 둔다.
+    """
+    ihdr, chunks = png_chunks(data)
+    if ihdr is None:
+        return "not a PNG"
+    if ihdr["bit_depth"] != 8:
+        return f"{ihdr['bit_depth']}-bit"
+    if b'acTL' in chunks:
+        return "animated"
+    return None
+
+
+def decoded_pixels(data):
+    """비교용 디코딩 -> (비트 깊이, 크기, RGBA 바이트) - 팔레트/그레이/알파 표현 차이는 무시"""
+    ihdr, _ = png_chunks(data)
+    with Image.open(io.BytesIO(data)) as img:
+        return ihdr["bit_depth"] if ihdr else None, img.size, img.convert('RGBA').tobytes()
+
+
+# === 무손실 축소 ===
+
+def pixel_hash(img):
+    """모드/크기/픽셀 바이트 해시 (메타데이터와 인코딩 무관)"""
+    h = hashlib.sha256(f"{img.mode}:{img.width}x{img.height}:".encode())
+    h.update(img.tobytes())
+    return h.hexdigest()
+
+
+def reduce_image(img, gray=True):
+    """픽셀을 바꾸지 않는 가장 작은 표현 -> (모드, 픽셀 배열, 팔레트, 투명도)
+
+    불투명 알파 제거, 무채색이면 그레이스케일 (gray=False 면 생략), 256색 이하면 팔레트.
+    """
+    if img.mode not in ('L', 'LA', 'RGB', 'RGBA'):
+        img = img.convert('RGBA' if 'transparency' in img.info or img.mode in ('P', 'PA') else 'RGB')
+    px = np.asarray(img)
+    if px.ndim == 2:
+        px = px[:, :, None]
+    channels = px.shape[2]
+
+    # 완전 불투명 알파 채널 제거 (App Store 아이콘은 알파가 없어야 함)
+    if channels in (2, 4) and px[:, :, -1].min() == 255:
+        px = px[:, :, :-1]
+        channels -= 1
+
+    # R == G == B 이면 그레이스케일
+    if gray and channels in (3, 4) and np.array_equal(px[:, :, 0], px[:, :, 1]) and np.array_equal(px[:, :, 1], px[:, :, 2]):
+        px = px[:, :, [0, 3]] if channels == 4 else px[:, :, :1]
+        channels -= 2
+
+    # 256색 이하면 팔레트 (RGBA 는 tRNS 로 알파 보존)
+    if channels >= 3:
+        flat = px.reshape(-1, channels)
+        packed = flat.astype(np.uint32) @ (1 << (8 * np.arange(channels - 1, -1, -1, dtype=np.uint32)))
+        colors, index = np.unique(packed, return_inverse=True)
+        if len(colors) <= 256:
+            shifts = 8 * np.arange(channels - 1, -1, -1, dtype=np.uint32)
+            palette = ((colors[:, None] >> shifts) & 0xFF).astype(np.uint8)
+            # 불투명 색을 뒤로 보내 tRNS 를 짧게
+            order = np.argsort(palette[:, 3] == 255, kind='stable') if channels == 4 else np.arange(len(colors))
+            remap = np.empty_like(order)
+            remap[order] = np.arange(len(order))
+            palette = palette[order]
+            indices = remap[index].astype(np.uint8).reshape(px.shape[0], px.shape[1], 1)
+            trns = None
+            if channels == 4:
+                alpha = palette[:, 3]
+                opaque = np.nonzero(alpha == 255)[0]
+                trns = alpha[:opaque[0]].tobytes() if len(opaque) else alpha.tobytes()
+            return 'P', indices, palette[:, :3].tobytes(), trns
+
+    mode = {1: 'L', 2: 'LA', 3: 'RGB', 4: 'RGBA'}[channels]
+    return mode, np.ascontiguousarray(px), None, None
+
+
+# === 스캔라인 필터 ===
+
+def filter_rows(px, filter_type):
+    """(높이, 너비, bpp) 배열에 고정 PNG 필터 적용 -> 필터 바이트가 앞에 붙은 행들
+
+    인코딩 쪽 필터는 원본 바이트만 참조하므로 전체 이미지를 한 번에 벡터 연산한다.
+    """
+    h, w, bpp = px.shape
+    raw = px.reshape(h, w * bpp).astype(np.int16)
+    left = np.zeros_like(raw)
+    left[:, bpp:] = raw[:, :-bpp]
+    up = np.zeros_like(raw)
+    up[1:] = raw[:-1]
+    if filter_type == 0:
+        res = raw
+    elif filter_type == 1:
+        res = raw - left
+    elif filter_type == 2:
+        res = raw - up
+    elif filter_type == 3:
+        res = raw - (left + up) // 2
+    else:
+        upleft = np.zeros_like(raw)
+        upleft[1:, bpp:] = raw[:-1, :-bpp]
+        p = left + up - upleft
+        pa, pb, pc = np.abs(p - left), np.abs(p - up), np.abs(p - upleft)
+        pred = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, upleft))
+        res = raw - pred
+    out = np.empty((h, w * bpp + 1), np.uint8)
+    out[:, 0] = filter_type
+    out[:, 1:] = (res & 0xFF).astype(np.uint8)
+    return out
+
+
+def adaptive_rows(fixed):
+    """행마다 부호 있는 바이트 절댓값 합이 가장 작은 필터 (libpng 휴리스틱)"""
+    stacked = np.stack(fixed)
+    costs = np.abs(stacked[:, :, 1:].view(np.int8).astype(np.int16)).sum(axis=2)
+    best = costs.argmin(axis=0)
+    return stacked[best, np.arange(stacked.shape[1])]
+
+
+def filtered_scanlines(px, filters=FILTERS):
+    """요청한 필터별 IDAT 압축 전 바이트"""
+    fixed = {f: filter_rows(px, f) for f in range(5) if f in filters or "adaptive" in filters}
+    out = {f: fixed[f].tobytes() for f in filters if f != "adaptive"}
+    if "adaptive" in filters:
+        out["adaptive"] = adaptive_rows([fixed[f] for f in range(5)]).tobytes()
+    return out
+
+
+def _compress(data, level, strategy):
+    c = zlib.compressobj(level, zlib.DEFLATED, 15, 9, strategy)
+    return c.compress(data) + c.flush()
+
+
+# === PNG 쓰기 ===
+
+def _chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def write_png(mode, size, idat, palette=None, trns=None, icc=None):
+    """필수 청크만 (IHDR, PLTE, tRNS, IDAT, IEND) + 색 프로필 (iCCP) - 텍스트/시간/감마 등 부가 청크 없음
+
+    iCCP 는 색 관리 출력 (sRGB 프로필 태그) 의 색 공간 표시라 픽셀 의미의 일부로 보고 유지한다.
+    """
+    w, h = size
+    out = [PNG_SIGNATURE, _chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, COLOR_TYPES[mode], 0, 0, 0))]
+    if icc:
+        out.append(_chunk(b'iCCP', b'ICC Profile\0\0' + zlib.compress(icc, 9)))
+    if palette:
+        out.append(_chunk(b'PLTE', palette))
+    if trns:
+        out.append(_chunk(b'tRNS', trns))
+    out.append(_chunk(b'IDAT', idat))
+    out.append(_chunk(b'IEND', b''))
+    return b''.join(out)
+
+
+def encode(img, params=None):
+    """최적 인코딩 -> (바이트, 파라미터). params 가 있으면 탐색 없이 그 설정으로 인코딩"""
+    # RGB 프로필은 그레이스케일 PNG 에 붙일 수 없음 -> 프로필이 있으면 RGB/팔레트로만 축소
+    icc = img.info.get("icc_profile")
+    mode, px, palette, trns = reduce_image(img, gray=not icc)
+    size = (px.shape[1], px.shape[0])
+    if params:
+        data = filtered_scanlines(px, (params["filter"],))[params["filter"]]
+        return write_png(mode, size, _compress(data, params["level"], params["strategy"]), palette, trns, icc), params
+
+    filtered = filtered_scanlines(px)
+    trial = sorted(FILTERS, key=lambda f: len(_compress(filtered[f], TRIAL_LEVEL, zlib.Z_DEFAULT_STRATEGY)))
+    best = None
+    for f in trial[:FINALISTS]:
+        for level, strategy in ZLIB_CANDIDATES:
+            idat = _compress(filtered[f], level, strategy)
+            if best is None or len(idat) < len(best[0]):
+                best = idat, {"filter": f, "level": level, "strategy": strategy, "mode": mode}
+    return write_png(mode, size, best[0], palette, trns, icc), best[1]
+
+
+# === 캐시 ===
+
+class OptimizeCache:
+    """픽셀 해시 -> 선택된 파라미터 + 최적화된 바이트 해시 + 원본 바이트 해시
+
+    이미 최적화된 파일은 해시만 보고 건너뛰고, 전에 본 원본 바이트 (= 같은 픽셀) 는 탐색 없이
+    재인코딩한다. 조회는 모두 부모 프로세스에서 - 워커에는 자기 항목 하나만 보낸다.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") == OPTIMIZER_VERSION:
+                self.entries = data.get("pixels", {})
+
+    def optimized(self):
+        """최적화 결과 바이트 해시 집합"""
+        return {entry["sha256"] for entry in self.entries.values()}
+
+    def by_source(self):
+        """원본 바이트 해시 -> 항목"""
+        return {entry["source"]: entry for entry in self.entries.values() if entry.get("source")}
+
+    def update(self, results):
+        for result in results:
+            if result.get("pixels"):
+                self.entries[result["pixels"]] = {"params": result["params"], "sha256": result["sha256"],
+                                                  "source": result["source"]}
+
+    def save(self):
+        data = {"version": OPTIMIZER_VERSION, "pixels": dict(sorted(self.entries.items()))}
+        with open(self.path, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+
+# === 최적화 단계 ===
+
+def optimize_bytes(data, cached=None):
+    """PNG 바이트 최적화 -> 결과 dict (bytes, before, after, pixels, params, sha256)
+
+    cached 는 같은 픽셀의 캐시 항목 (있으면 그 파라미터로 탐색 없이 인코딩).
+
+    결과가 원본보다 크거나, 8비트가 아니거나 (passthrough), 디코딩한 픽셀이 원본과 다르면
+    (mismatch) 원본을 유지한다 - 제자리 쓰기 전에 항상 픽셀을 대조한다.
+    """
+    reason = passthrough_reason(data)
+    if reason:
+        return {"bytes": data, "before": len(data), "after": len(data), "pixels": None,
+                "params": None, "sha256": sha256_bytes(data), "cached": False, "passthrough": reason}
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    key = pixel_hash(img)
+    out, params = encode(img, cached["params"] if cached else None)
+    mismatch = False
+    if len(out) < len(data) and decoded_pixels(out) != decoded_pixels(data):
+        out, mismatch = data, True
+    if len(out) >= len(data):
+        out = data
+    return {"bytes": out, "mismatch": mismatch, "before": len(data), "after": len(out), "pixels": key,
+            "params": params, "sha256": sha256_bytes(out), "cached": bool(cached)}
+
+
+def _optimize_task(task):
+    """워커: 파일 하나를 읽어 최적화하고 줄었으면 제자리에 덮어쓰기 (cached = 이 파일의 캐시 항목)"""
+    path, cached = task
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = sha256_bytes(data)
+    result = optimize_bytes(data, cached)
+    if result["after"] < len(data):
+        atomic_write(path, result.pop("bytes"))
+    else:
+        result.pop("bytes")
+    result.update(path=path, source=digest, skipped=False)
+    return result
+
+
+def optimize_files(paths, jobs=1, cache=None):
+    """PNG 파일들을 워커 풀에서 최적화 -> 파일별 결과 목록 (캐시 갱신)"""
+    cache = cache or OptimizeCache()
+    done = cache.optimized()
+    by_source = cache.by_source()
+    results, tasks = {}, []
+    for path in paths:
+        digest = sha256_file(path)
+        if digest in done:
+            size = os.path.getsize(path)
+            results[path] = {"path": path, "before": size, "after": size, "sha256": digest, "skipped": True}
+        else:
+            tasks.append((path, by_source.get(digest)))
+    for result in run_parallel(_optimize_task, tasks, jobs):
+        results[result["path"]] = result
+    results = [results[path] for path in paths]
+    cache.update(r for r in results if not r["skipped"])
+    return results
+
+
+def report(results, root='.'):
+    """파일별 절감 바이트 출력 -> 총 절감 바이트"""
+    saved = 0
+    for r in results:
+        name = os.path.relpath(r["path"], root)
+        if r["skipped"]:
+            print(f"  Optimized {name}: already optimized")
+            continue
+        if r.get("passthrough"):
+            print(f"  Kept {name}: {r['passthrough']} (not re-encoded)")
+            continue
+        if r.get("mismatch"):
+            print(f"  Kept {name}: re-encoded pixels differ from the original (not written)")
+            continue
+        diff = r["before"] - r["after"]
+        saved += diff
+        pct = 100 * diff / r["before"] if r["before"] else 0
+        note = " (cached params)" if r.get("cached") else ""
+        print(f"  Optimized {name}: {r['before']:,} -> {r['after']:,} bytes (-{pct:.1f}%){note}")
+    print(f"  PNG optimization saved {saved:,} bytes")
+    return saved
+
+
+def optimize_build(build, jobs=1, cache_path=CACHE_PATH):
+    """AssetBuild 로 이번 실행에 기록된 PNG 를 최적화하고 매니페스트 해시 갱신"""
+    paths = [p for p in build.written_paths if p.lower().endswith('.png')]
+    if not paths:
+        return 0
+    cache = OptimizeCache(cache_path)
+    results = optimize_files(paths, jobs, cache)
+    for r in results:
+        if not r["skipped"]:
+            build.optimized(r["path"], r["source"], r["sha256"])
+    cache.save()
+    return report(results)
+
+
+def find_pngs(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                yield from (os.path.join(root, f) for f in sorted(files) if f.lower().endswith('.png'))
+        else:
+            yield path
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Optimize PNG files in place (lossless)")
+    ap.add_argument("paths", nargs="+", help="PNG files or directories")
+    ap.add_argument("--jobs", type=int, default=1, help="parallel worker processes (0 = CPU count)")
+    args = ap.parse_args()
+    cache = OptimizeCache()
+    report(optimize_files(list(find_pngs(args.paths)), resolve_jobs(args.jobs), cache))
+    cache.save()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Resize Plan
+사이즈 테이블 -> 고유 픽셀 크기별 한 번만 리사이즈 (다운스케일 피라미드 캐시)
+"""
+
+from contextlib import ExitStack
+
+from PIL import Image
+
+from asset_build import encode_png
+from parallel_render import resolve_image, run_parallel, shared_image
+
+
+def _dims(size):
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+class ResizePlan:
+    """(픽셀 크기, 파일명) 목록을 고유 크기별로 묶은 계획
+
+    같은 크기를 여러 파일명이 쓰면 (예: icon_60@2x / icon_40@3x = 120px)
+    한 번만 렌더링/인코딩하고 같은 바이트를 모든 파일에 기록한다.
+    """
+
+    def __init__(self, targets):
+        self.targets = [(_dims(size), name) for size, name in targets]
+        self.by_size = {}
+        for dims, name in sorted(self.targets, key=lambda t: -t[0][0] * t[0][1]):
+            self.by_size.setdefault(dims, []).append(name)
+
+    @property
+    def sizes(self):
+        """고유 픽셀 크기 (큰 것부터)"""
+        return list(self.by_size)
+
+    def __iter__(self):
+        return iter(self.by_size.items())
+
+
+class Pyramid:
+    """마스터에서 절반씩 줄인 레벨 캐시 (1024 -> 512 -> 256 ...)"""
+
+    def __init__(self, master, resample=Image.LANCZOS):
+        self.resample = resample
+        self.levels = [master]
+
+    def source_for(self, dims):
+        """dims 로 줄일 원본 레벨 - 목표의 2배 이상인 가장 작은 레벨"""
+        w, h = dims
+        while True:
+            last = self.levels[-1]
+            half = (last.width // 2, last.height // 2)
+            if half[0] < 2 * w or half[1] < 2 * h:
+                break
+            self.levels.append(last.resize(half, self.resample))
+        for level in reversed(self.levels):
+            if level.width >= 2 * w and level.height >= 2 * h:
+                return level
+        return self.levels[0]
+
+
+def _resize_task(task):
+    """워커: 피라미드 레벨 -> 목표 크기 리사이즈 + 인코딩"""
+    handle, dims, resample = task
+    src = resolve_image(handle)
+    img = src if src.size == dims else src.resize(dims, resample)
+    return encode_png(img)
+
+
+def render_plan(master, plan, jobs=1, resample=Image.LANCZOS):
+    """계획의 고유 크기별 인코딩 바이트 {dims: bytes}"""
+    pyramid = Pyramid(master, resample)
+    sources = [pyramid.source_for(dims) for dims in plan.sizes]
+
+    # 레벨마다 한 번만 워커와 공유
+    with ExitStack() as stack:
+        handles = {}
+        for level in sources:
+            if id(level) not in handles:
+                handles[id(level)] = stack.enter_context(shared_image(level, jobs))
+        tasks = [(handles[id(src)], dims, resample) for src, dims in zip(sources, plan.sizes)]
+        encoded = run_parallel(_resize_task, tasks, jobs)
+    return dict(zip(plan.sizes, encoded))
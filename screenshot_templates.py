@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""Screenshot templates - JSON screen specs compiled once per locale, rendered per data row and device class"""
+from PIL import ImageDraw
+from functools import lru_cache
+import ast, json, math, os, string
+from fonts import family_for, layout
+from gradient import linear_gradient
+from localization import BASE_LOCALE, localize, strings_for
+
+# Layout units: every spec coordinate is in units of the 1284x2778 design canvas
+W, H = 1284, 2778
+BG_TOP = (15, 20, 40)
+BG_BOT = (25, 35, 65)
+GOLD = (218, 175, 75)
+GOLD_L = (240, 210, 120)
+WHITE = (255, 255, 255)
+CARD = (35, 45, 80)
+GREEN = (80, 200, 120)
+RED = (230, 80, 80)
+ORANGE = (240, 160, 50)
+PALETTE = {"BG_TOP":BG_TOP,"BG_BOT":BG_BOT,"GOLD":GOLD,"GOLD_L":GOLD_L,"WHITE":WHITE,"CARD":CARD,"GREEN":GREEN,"RED":RED,"ORANGE":ORANGE}
+
+# App Store device classes -> portrait pixel size
+DEVICES = {
+    "6.5": (1284, 2778),
+    "6.7": (1290, 2796),
+    "6.9": (1320, 2868),
+    "ipad-13": (2064, 2752),
+}
+DEFAULT_DEVICE = "6.5"
+
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AppStore", "templates", "screenshots.json")
+
+class Device:
+    """Fits the design canvas to a device: uniform scale s = min(w/W, h/H), so layouts keep their
+    proportions; extra width widens W (right-anchored elements follow it), extra height is split above/below"""
+    def __init__(self, name):
+        self.name = name
+        self.size = self.pw, self.ph = DEVICES[name]
+        self.s = min(self.pw/W, self.ph/H)
+        self.W = self.pw/self.s
+        self.oy = (self.ph-H*self.s)/2
+
+@lru_cache(maxsize=None)
+def device(name=DEFAULT_DEVICE):
+    return Device(name)
+
+class ScaledDraw:
+    """ImageDraw proxy that takes layout units; coordinates, stroke widths, radii and font sizes are
+    scaled to device pixels. At s == 1 it draws exactly what ImageDraw would. Each text run picks
+    the font family covering its script (Hangul, kana, Han per locale, Devanagari)."""
+    def __init__(self, img, dev, locale=BASE_LOCALE):
+        self.draw, self.dev, self.s, self.locale = ImageDraw.Draw(img), dev, dev.s, locale
+        self.width = img.width
+    def x(self, v): return round(v*self.s)
+    def y(self, v): return round(v*self.s+self.dev.oy)
+    def n(self, v): return max(1, round(v*self.s)) if v else 0
+    def box(self, xy):
+        x0, y0, x1, y1 = xy
+        return [self.x(x0), self.y(y0), self.x(x1), self.y(y1)]
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        self.draw.rounded_rectangle(self.box(xy), radius=self.n(radius), fill=fill, outline=outline, width=self.n(width))
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.draw.rectangle(self.box(xy), fill=fill, outline=outline, width=self.n(width))
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self.draw.ellipse(self.box(xy), fill=fill, outline=outline, width=self.n(width))
+    def arc(self, xy, start, end, fill=None, width=1):
+        self.draw.arc(self.box(xy), start, end, fill=fill, width=self.n(width))
+    def line(self, xy, fill=None, width=0):
+        self.draw.line([(self.x(px), self.y(py)) for px, py in xy], fill=fill, width=self.n(width))
+    def run(self, text, size): return layout(text, self.n(size), family_for(text, self.locale))
+    def text(self, xy, text, size, color):
+        self.run(text, size).draw(self.draw, (self.x(xy[0]), self.y(xy[1])), color)
+    def centered_text(self, y, text, size, color):
+        run = self.run(text, size)
+        run.draw(self.draw, ((self.width-run.width)//2, self.y(y)), color)
+
+def bg(dev=None):
+    """Navy gradient at device resolution (cached per pixel size by gradient.py)"""
+    return linear_gradient((dev or device()).size, BG_TOP, BG_BOT)
+
+def ctxt(draw, y, text, sz, color):
+    draw.centered_text(y, text, sz, color)
+
+def ltxt(draw, x, y, text, sz, color):
+    draw.text((x, y), text, sz, color)
+
+def mic(draw, cx, cy, r, color):
+    mw, mh = int(r*0.4), int(r*0.6)
+    draw.rounded_rectangle([cx-mw,cy-mh,cx+mw,cy+int(mh*0.2)], radius=mw, fill=color)
+    draw.arc([cx-int(mw*1.5),cy-int(mh*0.2),cx+int(mw*1.5),cy+int(mh*0.8)], 0, 180, fill=color, width=max(3,int(r*0.06)))
+    sw = max(2, int(r*0.04))
+    st = cy+int(mh*0.8); sb = st+int(r*0.25)
+    draw.rectangle([cx-sw,st,cx+sw,sb], fill=color)
+    draw.line([(cx-int(mw*0.8),sb),(cx+int(mw*0.8),sb)], fill=color, width=sw)
+
+# --- compiled fields -------------------------------------------------------
+
+FUNCS = {"len": len, "int": int, "min": min, "max": max}
+_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load, ast.Call,
+          ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.USub, ast.UAdd)
+
+class Expr:
+    """Numeric field: a number or an arithmetic expression over W, H, y and row/item fields"""
+    def __init__(self, src):
+        self.const, self.names = None, frozenset()
+        if isinstance(src, (int, float)): self.const = src; return
+        tree = ast.parse(str(src), mode="eval")
+        for node in ast.walk(tree):
+            if not isinstance(node, _NODES) or (isinstance(node, ast.Call) and getattr(node.func, "id", None) not in FUNCS):
+                raise ValueError(f"unsupported template expression: {src!r}")
+        self.names = frozenset(n.id for n in ast.walk(tree) if isinstance(n, ast.Name)) - set(FUNCS)
+        self.code = compile(tree, f"<template {src}>", "eval")
+    def __call__(self, scope):
+        return self.const if self.const is not None else eval(self.code, {"__builtins__": {}, **FUNCS}, scope)
+
+class Text:
+    """String field with {field} placeholders; "@id" is a localized string resolved at compile time"""
+    def __init__(self, src, strings=None):
+        if strings and src.startswith("@"): self.src, self.names = strings(src[1:]), frozenset(); return
+        self.src = src
+        self.names = frozenset(f for _, f, _, _ in string.Formatter().parse(src) if f)
+    def __call__(self, scope):
+        return self.src.format_map(scope) if self.names else self.src
+
+class Color:
+    """Colour field: [r,g,b(,a)], a palette name, or a {field} holding a palette name"""
+    def __init__(self, src, palette):
+        self.palette, self.text, self.const = palette, None, None
+        if isinstance(src, list): self.const = tuple(src)
+        elif "{" in src: self.text = Text(src)
+        else: self.const = palette[src]
+        self.names = self.text.names if self.text else frozenset()
+    def __call__(self, scope):
+        return self.const if self.text is None else self.palette[self.text(scope)]
+
+# --- element ops -----------------------------------------------------------
+
+class Op:
+    """One drawing element; `names` are the fields it reads, used to split static from dynamic"""
+    def __init__(self, spec, palette, strings=None):
+        self.spec, self.palette, self.strings = spec, palette, strings
+        self.when, self.unless = spec.get("when"), spec.get("unless")
+        self.names = {n for n in (self.when, self.unless) if n}
+    def expr(self, key, default=None):
+        e = Expr(self.spec.get(key, default)); self.names |= e.names; return e
+    def exprs(self, key):
+        es = [Expr(v) for v in self.spec[key]]
+        for e in es: self.names |= e.names
+        return es
+    def color(self, key):
+        if key not in self.spec: return None
+        c = Color(self.spec[key], self.palette); self.names |= c.names; return c
+    def text(self, key):
+        t = Text(self.spec[key], self.strings); self.names |= t.names; return t
+    def __call__(self, draw, scope):
+        if self.when and not scope.get(self.when): return
+        if self.unless and scope.get(self.unless): return
+        self.paint(draw, scope)
+
+def _opt(field, scope):
+    return field(scope) if field else None
+
+class Shape(Op):
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.box = self.exprs("box"); self.fill = self.color("fill"); self.outline = self.color("outline")
+        self.width = self.expr("width", 1); self.radius = self.expr("radius", 0)
+    def coords(self, scope): return [e(scope) for e in self.box]
+
+class RRect(Shape):
+    def paint(self, draw, scope):
+        draw.rounded_rectangle(self.coords(scope), radius=self.radius(scope), fill=_opt(self.fill, scope),
+                               outline=_opt(self.outline, scope), width=self.width(scope))
+
+class Rect(Shape):
+    def paint(self, draw, scope):
+        draw.rectangle(self.coords(scope), fill=_opt(self.fill, scope), outline=_opt(self.outline, scope), width=self.width(scope))
+
+class Ellipse(Shape):
+    def paint(self, draw, scope):
+        draw.ellipse(self.coords(scope), fill=_opt(self.fill, scope), outline=_opt(self.outline, scope), width=self.width(scope))
+
+class Line(Op):
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.points = self.exprs("points"); self.fill = self.color("fill"); self.width = self.expr("width", 1)
+    def paint(self, draw, scope):
+        p = [e(scope) for e in self.points]
+        draw.line(list(zip(p[::2], p[1::2])), fill=self.fill(scope), width=self.width(scope))
+
+class TextRun(Op):
+    """Centred when "x" is omitted, else left-aligned at x"""
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.x = self.expr("x") if "x" in spec else None
+        self.y = self.expr("y"); self.value = self.text("text"); self.size = self.expr("size"); self.fill = self.color("color")
+    def paint(self, draw, scope):
+        if self.x is None: ctxt(draw, self.y(scope), self.value(scope), self.size(scope), self.fill(scope))
+        else: ltxt(draw, self.x(scope), self.y(scope), self.value(scope), self.size(scope), self.fill(scope))
+
+class Mic(Op):
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.center = self.exprs("center"); self.r = self.expr("r"); self.fill = self.color("color")
+    def paint(self, draw, scope):
+        cx, cy = (e(scope) for e in self.center)
+        mic(draw, cx, cy, self.r(scope), self.fill(scope))
+
+class Burst(Op):
+    """Radial rays around a centre (the AI badge)"""
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.center = self.exprs("center"); self.inner = self.expr("inner"); self.outer = self.expr("outer")
+        self.step = self.expr("step", 45); self.fill = self.color("fill"); self.width = self.expr("width", 1)
+    def paint(self, draw, scope):
+        cx, cy = (e(scope) for e in self.center); r0, r1 = self.inner(scope), self.outer(scope)
+        for a in range(0, 360, self.step(scope)):
+            rad = math.radians(a)
+            draw.line([(cx+int(r0*math.cos(rad)),cy+int(r0*math.sin(rad))),(cx+int(r1*math.cos(rad)),cy+int(r1*math.sin(rad)))], fill=self.fill(scope), width=self.width(scope))
+
+class Calendar(Op):
+    """Month grid: card, gold header with title, weekday row and day numbers"""
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.box = self.exprs("box"); self.days = self.expr("days", 28); self.first = self.expr("first_weekday", 0)
+        self.today = self.expr("today", 0)
+        self.title = self.text("title") if "title" in spec else None
+        self.weekdays = [Text(d, strings) for d in spec.get("weekdays", [])]
+        for d in self.weekdays: self.names |= d.names
+    def cell(self, scope, day):
+        cx, cy, cw, _ = (e(scope) for e in self.box)
+        dw = cw//7; off = day-1+self.first(scope)
+        return cx+(off%7)*dw+15, cy+180+(off//7)*200, dw
+    def paint(self, draw, scope):
+        cx, cy, cw, ch = (e(scope) for e in self.box)
+        draw.rounded_rectangle([cx,cy,cx+cw,cy+ch], radius=24, fill=CARD)
+        draw.rounded_rectangle([cx,cy,cx+cw,cy+100], radius=24, fill=GOLD)
+        draw.rectangle([cx,cy+70,cx+cw,cy+100], fill=GOLD)
+        if self.title: ctxt(draw, cy+25, self.title(scope), 44, BG_TOP)
+        dw = cw//7
+        for i, d in enumerate(self.weekdays):
+            ltxt(draw, cx+i*dw+dw//2-20, cy+120, d(scope), 28, WHITE)
+        today = self.today(scope)
+        for day in range(1, self.days(scope)+1):
+            dx, dy, _ = self.cell(scope, day)
+            ltxt(draw, dx, dy, str(day), 30, GOLD if day == today else WHITE)
+
+class CalendarEvents(Calendar):
+    """Event pills for a Calendar with the same box; items are {day, slot, label, color}"""
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.items = spec["items"]; self.names.add(self.items)
+    def paint(self, draw, scope):
+        for ev in scope[self.items]:
+            dx, dy, dw = self.cell(scope, ev["day"]); o = ev.get("slot", 0)*40
+            draw.rounded_rectangle([dx-5,dy+40+o,dx+dw-25,dy+72+o], radius=6, fill=self.palette[ev["color"]])
+            ltxt(draw, dx+5, dy+44+o, ev["label"], 22, WHITE)
+
+class Repeat(Op):
+    """Draws its elements once per item of a row list, with y = start + i*step; leaves y after the last item"""
+    def __init__(self, spec, palette, strings=None):
+        super().__init__(spec, palette, strings)
+        self.items = spec["items"]; self.names.add(self.items)
+        self.start = self.expr("start"); self.step = self.expr("step")
+        self.children = [compile_element(e, palette, strings) for e in spec["elements"]]
+    def paint(self, draw, scope):
+        items = scope[self.items]; y0, step = self.start(scope), self.step(scope)
+        for i, item in enumerate(items):
+            sub = {**scope, **item, "i": i, "y": y0+i*step}
+            for op in self.children: op(draw, sub)
+        scope["y"] = y0+len(items)*step
+
+OPS = {"rrect": RRect, "rect": Rect, "ellipse": Ellipse, "line": Line, "text": TextRun, "mic": Mic,
+       "burst": Burst, "calendar": Calendar, "calendar_events": CalendarEvents, "repeat": Repeat}
+
+def compile_element(spec, palette, strings=None):
+    if spec["type"] not in OPS: raise ValueError(f"unknown template element: {spec['type']!r}")
+    return OPS[spec["type"]](spec, palette, strings)
+
+# --- screens ---------------------------------------------------------------
+
+class CompiledScreen:
+    """A screen spec compiled once. Leading elements that read no row field (and not the repeat
+    cursor y) are baked into a base layer cached per device class; the rest are replayed per row.
+    "@id" strings in elements, defaults and rows resolve against the screen's locale."""
+    def __init__(self, name, spec, palette, locale=BASE_LOCALE):
+        self.name, self.locale, self.strings = name, locale, strings_for(locale)
+        self.defaults = localize(spec.get("defaults", {}), self.strings)
+        ops = [compile_element(e, palette, self.strings) for e in spec["elements"]]
+        dynamic = set(self.defaults) | {"y"}
+        n = next((i for i, op in enumerate(ops) if op.names & dynamic), len(ops))
+        self.static_ops, self.dynamic_ops = ops[:n], ops[n:]
+        self._bases = {}
+    def scope(self, dev, row=None):
+        return {**self.defaults, **localize(row or {}, self.strings), "W": dev.W, "H": H, "y": 0}
+    def base(self, dev):
+        if dev.name not in self._bases:
+            img = bg(dev); draw = ScaledDraw(img, dev, self.locale); scope = self.scope(dev)
+            for op in self.static_ops: op(draw, scope)
+            self._bases[dev.name] = img
+        return self._bases[dev.name]
+    def render(self, row=None, device_name=DEFAULT_DEVICE):
+        dev = device(device_name)
+        img = self.base(dev).copy(); draw = ScaledDraw(img, dev, self.locale); scope = self.scope(dev, row)
+        for op in self.dynamic_ops: op(draw, scope)
+        return img
+    def render_batch(self, rows, device_name=DEFAULT_DEVICE):
+        for row in rows: yield self.render(row, device_name)
+
+@lru_cache(maxsize=None)
+def load_spec(path=SPEC_PATH):
+    with open(path, encoding="utf-8") as f: return json.load(f)
+
+# bounded: the locale matrix compiles every (screen, locale) pair and each holds its per-device base layers
+@lru_cache(maxsize=16)
+def compile_screen(name, path=SPEC_PATH, locale=BASE_LOCALE):
+    spec = load_spec(path)
+    palette = {**PALETTE, **{k: tuple(v) for k, v in spec.get("palette", {}).items()}}
+    return CompiledScreen(name, spec["screens"][name], palette, locale)
+
+def render_screen(name, row=None, device_name=DEFAULT_DEVICE, path=SPEC_PATH, locale=BASE_LOCALE):
+    return compile_screen(name, path, locale).render(row, device_name)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler SDF Raster
+부호 거리장(SDF) 기반 해석적 안티앨리어싱 도형 - 도형 bbox 안의 NumPy 격자에서만 계산
+"""
+
+import math
+
+import numpy as np
+from PIL import Image
+
+# 픽셀 i 는 연속 좌표 [i, i+1] 을 덮고 중심 i + 0.5 에서 샘플링 (ImageDraw 와 같은 좌표계)
+# 커버리지 = clip(0.5 - d, 0, 1): 경계에서 1픽셀 폭 선형 램프
+
+
+# === 거리 함수 (음수 = 안쪽) ===
+
+def sd_circle(px, py, r):
+    return np.hypot(px, py) - r
+
+
+def sd_ellipse(px, py, rx, ry):
+    """타원 근사 거리 (1차 테일러) - rx == ry 면 정확한 원"""
+    if abs(rx - ry) < 1e-6:
+        return sd_circle(px, py, rx)
+    k0 = np.hypot(px / rx, py / ry)
+    k1 = np.hypot(px / (rx * rx), py / (ry * ry))
+    return k0 * (k0 - 1) / np.maximum(k1, 1e-6)
+
+
+def sd_round_box(px, py, hw, hh, r):
+    """중심 기준 반폭 hw, 반높이 hh, 모서리 반지름 r 인 둥근 사각형"""
+    r = min(r, hw, hh)
+    qx = np.abs(px) - hw + r
+    qy = np.abs(py) - hh + r
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    return outside + np.minimum(np.maximum(qx, qy), 0) - r
+
+
+def sd_segment(px, py, ax, ay, bx, by):
+    """선분까지의 거리 (캡슐 = 이 값 - 반지름)"""
+    dx, dy = bx - ax, by - ay
+    length2 = dx * dx + dy * dy
+    t = np.clip(((px - ax) * dx + (py - ay) * dy) / length2, 0, 1) if length2 else 0
+    return np.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+def sd_sector(px, py, start, end):
+    """중심에서 start -> end (도, 시계 방향 - ImageDraw 와 같음) 부채꼴 바깥 거리"""
+    span = (end - start) % 360 or 360
+    if span >= 360:
+        return np.full(np.shape(px), -np.inf, np.float32)
+    a0, a1 = math.radians(start), math.radians(start + span)
+    # 시작 반직선 기준 왼쪽/끝 반직선 기준 오른쪽이 안쪽
+    d0 = -(math.cos(a0) * py - math.sin(a0) * px)
+    d1 = math.cos(a1) * py - math.sin(a1) * px
+    return np.maximum(d0, d1) if span <= 180 else np.minimum(d0, d1)
+
+
+def stroke(d, width):
+    """채운 도형 거리 -> 안쪽으로 width 만큼의 외곽선 거리 (ImageDraw outline 과 같은 방향)"""
+    return np.maximum(d, -d - width)
+
+
+def coverage(d):
+    return np.clip(0.5 - d, 0.0, 1.0)
+
+
+# === 그리기 ===
+
+class AADraw:
+    """ImageDraw 호환 안티앨리어싱 드로어 (ellipse/arc/rounded_rectangle/rectangle/line)
+
+    좌표는 ImageDraw 와 같은 bbox 규칙(끝 픽셀 포함)을 따르고 실수 좌표/두께를 받는다.
+    각 도형은 bbox(+1px) 영역만 격자로 만들어 커버리지를 계산하고 원본 위에 합성한다.
+    """
+
+    def __init__(self, img):
+        self.img = img
+        self.mode = img.mode
+
+    # --- 내부 ---
+
+    def _grid(self, x0, y0, x1, y1):
+        """연속 좌표 bbox -> (영역, 픽셀 중심 x, y 격자) - 이미지 밖이면 None"""
+        w, h = self.img.size
+        left, top = max(int(math.floor(x0)) - 1, 0), max(int(math.floor(y0)) - 1, 0)
+        right, bottom = min(int(math.ceil(x1)) + 1, w), min(int(math.ceil(y1)) + 1, h)
+        if left >= right or top >= bottom:
+            return None
+        ys, xs = np.mgrid[top:bottom, left:right].astype(np.float32) + 0.5
+        return (left, top, right, bottom), xs, ys
+
+    def _composite(self, region, cov, color):
+        """커버리지 x 색 알파를 영역에 합성 (RGBA 는 source-over, RGB/L 은 블렌드)"""
+        if color is None or not cov.any():
+            return
+        arr = np.asarray(self.img.crop(region), dtype=np.float32)
+        color = (color,) if isinstance(color, (int, float)) else tuple(color)
+        if self.mode == 'L':
+            a = cov * (color[1] / 255 if len(color) > 1 else 1.0)
+            out = arr * (1 - a) + color[0] * a
+        else:
+            rgb = np.array(color[:3], np.float32)
+            sa = (cov * (color[3] / 255 if len(color) > 3 else 1.0))[..., None]
+            if self.mode == 'RGBA':
+                da = arr[..., 3:4] / 255
+                oa = sa + da * (1 - sa)
+                out_rgb = (rgb * sa + arr[..., :3] * da * (1 - sa)) / np.maximum(oa, 1e-6)
+                out = np.concatenate([out_rgb, oa * 255], axis=2)
+            else:
+                out = arr * (1 - sa) + rgb * sa
+        self.img.paste(Image.fromarray(np.clip(np.rint(out), 0, 255).astype(np.uint8)), region[:2])
+
+    def _fill_and_outline(self, bounds, dist, fill, outline, width):
+        grid = self._grid(*bounds)
+        if grid is None:
+            return
+        region, xs, ys = grid
+        d = dist(xs, ys)
+        if fill is not None:
+            self._composite(region, coverage(d), fill)
+        if outline is not None and width > 0:
+            self._composite(region, coverage(stroke(d, width)), outline)
+
+    @staticmethod
+    def _bbox(xy):
+        """ImageDraw bbox (끝 픽셀 포함) -> 연속 좌표 (x0, y0, x1, y1)"""
+        if len(xy) == 2:
+            (x0, y0), (x1, y1) = xy
+        else:
+            x0, y0, x1, y1 = xy
+        return x0, y0, x1 + 1, y1 + 1
+
+    # --- ImageDraw 호환 ---
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        x0, y0, x1, y1 = self._bbox(xy)
+        cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+        self._fill_and_outline((x0, y0, x1, y1), lambda xs, ys: sd_ellipse(xs - cx, ys - cy, rx, ry),
+                               fill, outline, width)
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        """bbox 타원 위의 start -> end 호, 두께는 bbox 안쪽으로 (ImageDraw 와 같음) - 끝은 평평"""
+        x0, y0, x1, y1 = self._bbox(xy)
+        cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+        half = width / 2
+
+        def dist(xs, ys):
+            px, py = xs - cx, ys - cy
+            ring = np.abs(sd_ellipse(px, py, rx - half, ry - half)) - half
+            return np.maximum(ring, sd_sector(px, py, start, end))
+
+        self._fill_and_outline((x0, y0, x1, y1), dist, fill, None, 0)
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        x0, y0, x1, y1 = self._bbox(xy)
+        cx, cy, hw, hh = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+        self._fill_and_outline((x0, y0, x1, y1), lambda xs, ys: sd_round_box(xs - cx, ys - cy, hw, hh, radius),
+                               fill, outline, width)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.rounded_rectangle(xy, 0, fill, outline, width)
+
+    def line(self, xy, fill=None, width=0):
+        """평평한 끝의 선 (ImageDraw line 처럼 끝 픽셀까지 포함)"""
+        if len(xy) and not isinstance(xy[0], (tuple, list)):
+            xy = list(zip(xy[0::2], xy[1::2]))
+        half = max(width, 1) / 2
+        for (ax, ay), (bx, by) in zip(xy, xy[1:]):
+            ax, ay, bx, by = ax + 0.5, ay + 0.5, bx + 0.5, by + 0.5
+            length = math.hypot(bx - ax, by - ay)
+            ux, uy = ((bx - ax) / length, (by - ay) / length) if length else (1.0, 0.0)
+            mx, my = (ax + bx) / 2, (ay + by) / 2
+            hl = length / 2 + 0.5
+
+            def dist(xs, ys):
+                px, py = xs - mx, ys - my
+                along = px * ux + py * uy
+                across = px * uy - py * ux
+                return sd_round_box(along, across, hl, half, 0)
+
+            pad = half + 0.5
+            bounds = (min(ax, bx) - pad, min(ay, by) - pad, max(ax, bx) + pad, max(ay, by) + pad)
+            self._fill_and_outline(bounds, dist, fill, None, 0)
+
+    # --- 추가 도형 ---
+
+    def circle(self, center, r, fill=None, outline=None, width=1):
+        cx, cy = center
+        self._fill_and_outline((cx - r, cy - r, cx + r, cy + r), lambda xs, ys: sd_circle(xs - cx, ys - cy, r),
+                               fill, outline, width)
+
+    def ring(self, center, r_outer, r_inner, fill=None):
+        self.circle(center, r_outer, outline=fill, width=r_outer - r_inner)
+
+    def capsule(self, p0, p1, r, fill=None):
+        """둥근 끝 선분 (연속 좌표)"""
+        (ax, ay), (bx, by) = p0, p1
+        bounds = (min(ax, bx) - r, min(ay, by) - r, max(ax, bx) + r, max(ay, by) + r)
+        self._fill_and_outline(bounds, lambda xs, ys: sd_segment(xs, ys, ax, ay, bx, by) - r, fill, None, 0)
+
+    def arc_stroke(self, center, r, start, end, width, fill=None):
+        """중심선 반지름 r 의 원호 획 (연속 좌표, 평평한 끝)"""
+        cx, cy = center
+        outer = r + width / 2
+
+        def dist(xs, ys):
+            px, py = xs - cx, ys - cy
+            return np.maximum(np.abs(sd_circle(px, py, r)) - width / 2, sd_sector(px, py, start, end))
+
+        self._fill_and_outline((cx - outer, cy - outer, cx + outer, cy + outer), dist, fill, None, 0)
+
+
+def Draw(img):
+    """ImageDraw.Draw 대체 - 안티앨리어싱 드로어"""
+    return AADraw(img)
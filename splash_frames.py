@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Splash Frames
+애니메이션 스플래시 프레임 - 정적 레이어는 한 번만, 프레임마다 바늘/마커가 바뀐 영역만 다시 그림
+"""
+
+import argparse
+import math
+import os
+import re
+import struct
+import zlib
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+from asset_build import AssetBuild, fingerprint
+from blob_store import BlobStore
+from generate_splash import (GOLD_LIGHT, HOUR_ANGLE, MINUTE_ANGLE, center_dot_radius, draw_hands,
+                             draw_markers, draw_mic, draw_rings, hand_lines, markers)
+from png_optimize import PNG_SIGNATURE, _chunk, _compress, filtered_scanlines
+
+DEFAULT_FRAMES = 90
+DEFAULT_FPS = 30
+FRAME_NAME = re.compile(r"frame_(\d+)\.png$")
+
+# 분침이 정지 포즈까지 도는 바퀴 수 (시침은 1/12)
+SWEEP_TURNS = 1
+
+# 정각 마커가 빛나는 횟수 - 첫/마지막 프레임은 빛 없음 (마지막 프레임 = 정적 스플래시)
+PULSES = 2
+GLOW_SCALE = 3.0
+
+# APNG 프레임 압축 (프레임 수가 많아 레벨 6 - 최종 크기는 --optimize 대상 아님)
+APNG_LEVEL = 6
+
+
+# === 타임라인 ===
+
+def pose(t):
+    """t (0 -> 1) -> (시침 각도, 분침 각도, 마커 빛 세기 0-1) - 바늘은 ease-out 으로 정지 포즈에 도착"""
+    remaining = (1 - t) ** 3
+    minute = MINUTE_ANGLE - 360 * SWEEP_TURNS * remaining
+    hour = HOUR_ANGLE - 30 * SWEEP_TURNS * remaining
+    pulse = 0.5 - 0.5 * math.cos(2 * math.pi * PULSES * t)
+    return hour, minute, round(pulse, 3)
+
+
+# === 사각형 ===
+
+def _union(boxes):
+    boxes = [b for b in boxes if b]
+    if not boxes:
+        return None
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+def _clip(box, width, height):
+    l, t, r, b = max(box[0], 0), max(box[1], 0), min(box[2], width), min(box[3], height)
+    return (l, t, r, b) if l < r and t < b else None
+
+
+# === 렌더러 ===
+
+class SplashAnimator:
+    """정적 레이어 (링 / 마커+마이크 / 마커 빛) 를 한 번 그리고 캔버스 하나를 프레임마다 부분 갱신
+
+    겹침 순서는 create_splash_image 와 같다: 링 -> 바늘 -> (빛) -> 마커 -> 마이크.
+    더티 영역은 이전/현재 바늘 bbox 와 (빛 세기가 바뀌면) 정각 마커 빛 bbox.
+    """
+
+    def __init__(self, size=400, frames=DEFAULT_FRAMES):
+        self.size = size
+        self.frames = frames
+        self.cx = self.cy = size // 2
+
+        # 바늘 아래 레이어: 링
+        self.under = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        draw_rings(ImageDraw.Draw(self.under), self.cx, self.cy, size)
+
+        # 바늘 위 레이어: 마커 + 마이크 (불투명 픽셀만 있어 합성 = ImageDraw 로 덧그리기)
+        self.over = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        over_draw = ImageDraw.Draw(self.over)
+        draw_markers(over_draw, self.cx, self.cy, size)
+        draw_mic(over_draw, self.cx, self.cy, size)
+
+        self.glows = self._glow_sprites()
+        self.canvas = None
+        self._hands = None
+        self._pulse = 0.0
+
+    def _glow_sprites(self):
+        """정각 마커 빛 [(bbox, RGBA 배열)] - 흐림은 여기서 한 번만"""
+        glows = []
+        for mx, my, r, _, major in markers(self.cx, self.cy, self.size):
+            if not major:
+                continue
+            gr = max(int(r * GLOW_SCALE), 2)
+            pad = gr
+            sprite = Image.new('RGBA', (2 * (gr + pad) + 1,) * 2, GOLD_LIGHT + (0,))
+            c = gr + pad
+            ImageDraw.Draw(sprite).ellipse([c - gr, c - gr, c + gr, c + gr], fill=GOLD_LIGHT + (160,))
+            sprite = sprite.filter(ImageFilter.GaussianBlur(gr / 2))
+            box = (mx - c, my - c, mx - c + sprite.width, my - c + sprite.height)
+            glows.append((box, np.asarray(sprite).copy()))
+        return glows
+
+    def hands_box(self, hour, minute):
+        """바늘 + 중심점이 닿는 영역 (이미지 좌표, 끝 제외)"""
+        cx, cy = self.cx, self.cy
+        boxes = []
+        for (ex, ey), width in hand_lines(cx, cy, self.size, hour, minute):
+            pad = width // 2 + 2
+            boxes.append((min(cx, ex) - pad, min(cy, ey) - pad, max(cx, ex) + pad + 1, max(cy, ey) + pad + 1))
+        dot = center_dot_radius(self.size) + 1
+        boxes.append((cx - dot, cy - dot, cx + dot + 1, cy + dot + 1))
+        return _clip(_union(boxes), self.size, self.size)
+
+    def _draw_glows(self, pulse, rects):
+        """다시 칠한 영역 (rects) 안에만 빛 합성 - 영역 밖은 이미 빛이 있고, 겹친 영역도 한 번만 (합성은 누적됨)"""
+        if pulse <= 0:
+            return
+        for box, px in self.glows:
+            part = _clip(box, self.size, self.size)
+            if not part:
+                continue
+            sprite = px.copy()
+            sprite[..., 3] = np.rint(px[..., 3] * pulse).astype(np.uint8)
+            x0, y0 = box[:2]
+            glow = Image.fromarray(sprite).crop((part[0] - x0, part[1] - y0, part[2] - x0, part[3] - y0))
+            mask = Image.new('L', glow.size, 0)
+            mask_draw = ImageDraw.Draw(mask)
+            for r in rects:
+                mask_draw.rectangle([r[0] - part[0], r[1] - part[1], r[2] - part[0] - 1, r[3] - part[1] - 1], fill=255)
+            region = self.canvas.crop(part)
+            region.alpha_composite(glow)
+            self.canvas.paste(region, part[:2], mask)
+
+    def render(self, index):
+        """index 번째 프레임으로 캔버스 갱신 -> 바뀐 영역 (첫 프레임은 전체)"""
+        t = index / (self.frames - 1) if self.frames > 1 else 1.0
+        hour, minute, pulse = pose(t)
+        hands = self.hands_box(hour, minute)
+
+        if self.canvas is None:
+            self.canvas = self.under.copy()
+            rects = [(0, 0, self.size, self.size)]
+        else:
+            rects = [hands, self._hands]
+            if pulse != self._pulse:
+                rects += [_clip(box, self.size, self.size) for box, _ in self.glows]
+            rects = [r for r in rects if r]
+            for r in rects:
+                self.canvas.paste(self.under.crop(r), r[:2])
+
+        draw_hands(ImageDraw.Draw(self.canvas), self.cx, self.cy, self.size, hour, minute)
+        self._draw_glows(pulse, rects)
+        for r in rects:
+            self.canvas.alpha_composite(self.over, dest=r[:2], source=r)
+
+        self._hands, self._pulse = hands, pulse
+        return _union(rects)
+
+
+# === 출력 ===
+
+class ApngWriter:
+    """프레임을 받는 즉시 fcTL/fdAT 로 기록하는 APNG 스트리밍 인코더
+
+    두 번째 프레임부터는 바뀐 영역만 부분 프레임으로 (dispose NONE, blend SOURCE)
+    기록하므로 전체 시퀀스를 메모리에 들고 있지 않는다. 임시 파일에 쓰고 완료 시 교체.
+    """
+
+    def __init__(self, path, size, frames, fps=DEFAULT_FPS, plays=1):
+        self.path = path
+        self.tmp = path + ".tmp"
+        self.size = size
+        self.delay = (1, fps)
+        self.seq = 0
+        self.count = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.f = open(self.tmp, 'wb')
+        w, h = size
+        self.f.write(PNG_SIGNATURE)
+        self.f.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 6, 0, 0, 0)))
+        self.f.write(_chunk(b'acTL', struct.pack('>II', frames, plays)))
+
+    def add(self, canvas, box):
+        x0, y0, x1, y1 = box
+        px = np.asarray(canvas.crop(box))
+        data = _compress(filtered_scanlines(px, ("adaptive",))["adaptive"], APNG_LEVEL, zlib.Z_DEFAULT_STRATEGY)
+        self.f.write(_chunk(b'fcTL', struct.pack('>IIIIIHHBB', self.seq, x1 - x0, y1 - y0, x0, y0,
+                                                 *self.delay, 0, 0)))
+        self.seq += 1
+        if self.count == 0:
+            # 첫 프레임 = 기본 이미지 (IDAT, 전체 크기)
+            self.f.write(_chunk(b'IDAT', data))
+        else:
+            self.f.write(_chunk(b'fdAT', struct.pack('>I', self.seq) + data))
+            self.seq += 1
+        self.count += 1
+
+    def close(self):
+        self.f.write(_chunk(b'IEND', b''))
+        self.f.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self):
+        self.f.close()
+        if os.path.exists(self.tmp):
+            os.remove(self.tmp)
+
+
+def write_apng(animator, path, fps=DEFAULT_FPS, loop=False):
+    """APNG 한 파일 (loop 면 무한 반복) -> 바이트 수"""
+    writer = ApngWriter(path, (animator.size,) * 2, animator.frames, fps, 0 if loop else 1)
+    try:
+        for i in range(animator.frames):
+            box = animator.render(i)
+            writer.add(animator.canvas, box)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    return os.path.getsize(path)
+
+
+def write_frames(animator, out_dir, build=None):
+    """프레임 시퀀스 (frame_0000.png ...) - SwiftUI/Lottie 용 전체 프레임, 바뀐 파일만 기록
+
+    프레임 수가 줄었으면 남는 frame_NNNN.png (index >= frames) 는 삭제 -> (기록 수, 삭제 수)
+    """
+    build = build or AssetBuild()
+    os.makedirs(out_dir, exist_ok=True)
+    written = 0
+    for i in range(animator.frames):
+        animator.render(i)
+        path = os.path.join(out_dir, f"frame_{i:04d}.png")
+        if build.write_bytes(path, build.encode(animator.canvas), fingerprint(pose, animator.size, animator.frames, i)):
+            written += 1
+    removed = 0
+    for name in sorted(os.listdir(out_dir)):
+        match = FRAME_NAME.match(name)
+        if match and int(match.group(1)) >= animator.frames:
+            build.remove(os.path.join(out_dir, name))
+            removed += 1
+    return written, removed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 애니메이션 스플래시 프레임")
+    parser.add_argument("--size", type=int, default=400, help="프레임 크기 (정사각형)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="프레임 수")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS, help="초당 프레임")
+    parser.add_argument("--format", choices=["apng", "frames"], default="apng",
+                        help="apng = 부분 프레임 APNG 한 파일, frames = 전체 프레임 PNG 시퀀스")
+    parser.add_argument("--loop", action="store_true", help="APNG 무한 반복")
+    parser.add_argument("--store", action="store_true",
+                        help="frames: 프레임을 내용 주소 저장소 (.asset_store) 에 한 번만 두고 링크로 연결 (정지 구간 중복 제거)")
+    parser.add_argument("--out", help="출력 (기본: AppStore/splash/splash.apng 또는 AppStore/splash/frames)")
+    args = parser.parse_args()
+    if args.frames < 1:
+        parser.error("--frames 는 1 이상")
+
+    animator = SplashAnimator(args.size, args.frames)
+    print(f"🎞 스플래시 애니메이션 {args.frames} 프레임 ({args.size}px, {args.fps}fps)...")
+    if args.format == "apng":
+        out = args.out or "AppStore/splash/splash.apng"
+        size = write_apng(animator, out, args.fps, args.loop)
+        print(f"  ✓ {out} ({size / 1024:.1f} KiB)")
+    else:
+        out = args.out or "AppStore/splash/frames"
+        build = AssetBuild(store=BlobStore() if args.store else None)
+        written, removed = write_frames(animator, out, build)
+        build.save()
+        stale = f", {removed} stale removed" if removed else ""
+        print(f"  ✓ {out}/ ({written} written, {args.frames - written} unchanged{stale})")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Strip Render
+저메모리 띠 렌더링 - 큰 아이콘 마스터를 가로 띠 단위로 그려 PNG 로 바로 스트리밍, 최대 RSS 보고
+"""
+
+import argparse
+import os
+import resource
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from png_optimize import PNG_SIGNATURE, _chunk, filter_rows
+
+MB = 1024 * 1024
+
+# 기본 메모리 한도 (최대 RSS, MB)
+DEFAULT_LIMIT_MB = 512
+
+# 띠 한 행의 픽셀당 작업 메모리 추정 (바이트)
+# RGBA 캔버스 4 + 그라데이션 임시 배열 ~7 + 마스크 1 + 최종 RGB 3
+ROW_BYTES_PER_PIXEL = 16
+# SDF 안티앨리어싱: float32 격자/거리/커버리지 배열 추가
+AA_ROW_BYTES_PER_PIXEL = 48
+
+MIN_STRIP_ROWS = 16
+
+# 띠 PNG: 그라데이션/평면 위주라 Paeth 고정 필터 (적응형보다 임시 메모리 1/5)
+STRIP_FILTER = 4
+STRIP_LEVEL = 9
+# 필터는 이 행 수씩 나눠 계산 (int16 임시 배열이 원본의 ~20배라 띠 높이와 무관하게 묶어 둠)
+FILTER_ROWS = 64
+FILTER_BYTES_PER_PIXEL = 3 * 24
+
+
+# === 좌표 이동 드로어 ===
+
+class OffsetDraw:
+    """전체 캔버스 좌표로 부른 그리기를 (ox, oy) 만큼 옮겨 띠/부분 레이어에 그림
+
+    ImageDraw 와 sdf_raster.AADraw 모두 첫 인자 xy 만 좌표이므로 그것만 옮긴다.
+    """
+
+    def __init__(self, draw, ox=0, oy=0):
+        self.draw = draw
+        self.ox = ox
+        self.oy = oy
+
+    def _shift(self, xy):
+        if xy and isinstance(xy[0], (tuple, list)):
+            return [(x - self.ox, y - self.oy) for x, y in xy]
+        return [v - (self.oy if i % 2 else self.ox) for i, v in enumerate(xy)]
+
+    def __getattr__(self, name):
+        method = getattr(self.draw, name)
+
+        def shifted(xy, *args, **kwargs):
+            return method(self._shift(xy), *args, **kwargs)
+        return shifted
+
+
+def offset_draw(factory, origin):
+    """Draw 팩토리 -> origin 이 (0, 0) 이 아니면 OffsetDraw 로 감싼 팩토리"""
+    if not any(origin):
+        return factory
+    return lambda im: OffsetDraw(factory(im), *origin)
+
+
+# === 메모리 ===
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB) - Linux 는 KiB, macOS 는 바이트 단위로 보고됨"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / MB if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb():
+    """현재 RSS (MB) - /proc 이 없으면 최대 RSS 로 대신"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / MB
+    except OSError:
+        return peak_rss_mb()
+
+
+def strip_rows(width, limit_mb, antialias=False):
+    """한도 안에 들어가는 띠 높이 - 현재 RSS 를 뺀 여유의 절반을 띠 작업 메모리로"""
+    per_row = width * (AA_ROW_BYTES_PER_PIXEL if antialias else ROW_BYTES_PER_PIXEL)
+    filter_mb = width * FILTER_ROWS * FILTER_BYTES_PER_PIXEL / MB
+    budget = max(limit_mb - current_rss_mb() - filter_mb, 0) * MB / 2
+    return max(MIN_STRIP_ROWS, int(budget // per_row))
+
+
+# === PNG 스트리밍 ===
+
+class PngStripWriter:
+    """RGB 행 띠를 받는 즉시 필터 + 압축해 IDAT 로 기록 (전체 이미지를 메모리에 두지 않음)
+
+    Up/Paeth 필터는 윗 행을 참조하므로 이전 띠의 마지막 행을 하나 들고 있다.
+    임시 파일에 쓰고 완료 시 교체.
+    """
+
+    def __init__(self, path, size, level=STRIP_LEVEL, filter_type=STRIP_FILTER):
+        self.path = path
+        self.tmp = path + ".tmp"
+        self.size = size
+        self.filter_type = filter_type
+        self.rows = 0
+        self.prev = None
+        self.z = zlib.compressobj(level, zlib.DEFLATED, 15, 9)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.f = open(self.tmp, 'wb')
+        w, h = size
+        self.f.write(PNG_SIGNATURE)
+        self.f.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0)))
+
+    def add(self, strip):
+        px = np.asarray(strip)
+        for r0 in range(0, px.shape[0], FILTER_ROWS):
+            rows = px[r0:r0 + FILTER_ROWS]
+            if self.prev is None:
+                filtered = filter_rows(rows, self.filter_type)
+            else:
+                filtered = filter_rows(np.concatenate([self.prev, rows]), self.filter_type)[1:]
+            self.prev = rows[-1:].copy()
+            data = self.z.compress(filtered.tobytes())
+            if data:
+                self.f.write(_chunk(b'IDAT', data))
+        self.rows += px.shape[0]
+
+    def close(self):
+        if self.rows != self.size[1]:
+            raise ValueError(f"{self.rows} rows written, expected {self.size[1]}")
+        self.f.write(_chunk(b'IDAT', self.z.flush()))
+        self.f.write(_chunk(b'IEND', b''))
+        self.f.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self):
+        self.f.close()
+        if os.path.exists(self.tmp):
+            os.remove(self.tmp)
+
+
+# === 아이콘 ===
+
+def render_icon_strips(size, path, limit_mb=DEFAULT_LIMIT_MB, antialias=False, rows=None):
+    """size 아이콘 마스터를 rows 행씩 (기본: 한도에서 계산) 그려 path 로 스트리밍 -> 통계 dict"""
+    from generate_app_icon import create_app_icon
+
+    rows = rows or strip_rows(size, limit_mb, antialias)
+    writer = PngStripWriter(path, (size, size))
+    start = time.perf_counter()
+    try:
+        for y0 in range(0, size, rows):
+            writer.add(create_app_icon(size, antialias, band=(y0, min(y0 + rows, size))))
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return {"rows": rows, "strips": -(-size // rows), "seconds": time.perf_counter() - start,
+            "peak_rss_mb": peak_rss_mb(), "bytes": os.path.getsize(path)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 대형 아이콘 마스터 저메모리 띠 렌더링")
+    parser.add_argument("size", type=int, nargs="?", default=4096, help="마스터 크기 (정사각형)")
+    parser.add_argument("--out", help="출력 PNG (기본: AppStore/press/AppIcon-<size>.png)")
+    parser.add_argument("--limit-mb", type=float, default=DEFAULT_LIMIT_MB,
+                        help=f"최대 RSS 한도 (기본 {DEFAULT_LIMIT_MB} MB) - 넘으면 종료 코드 1")
+    parser.add_argument("--rows", type=int, help="띠 높이 (기본: 한도에서 계산)")
+    parser.add_argument("--antialias", action="store_true", help="SDF 안티앨리어싱 드로어로 렌더링")
+    args = parser.parse_args()
+
+    out = args.out or f"AppStore/press/AppIcon-{args.size}.png"
+    print(f"🧱 {args.size}x{args.size} 아이콘 띠 렌더링 (한도 {args.limit_mb:.0f} MB)...")
+    stats = render_icon_strips(args.size, out, args.limit_mb, args.antialias, args.rows)
+    print(f"  ✓ {out} ({stats['bytes'] / MB:.1f} MB, {stats['strips']} strips x {stats['rows']} rows, "
+          f"{stats['seconds']:.1f}s)")
+    over = stats["peak_rss_mb"] > args.limit_mb
+    print(f"  {'❌' if over else '✅'} 최대 RSS {stats['peak_rss_mb']:.0f} MB / 한도 {args.limit_mb:.0f} MB")
+    sys.exit(1 if over else 0)
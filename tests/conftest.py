@@ -0,0 +1,6 @@
+import os
+import sys
+
+# 생성기 모듈은 저장소 최상위에 평평하게 있음
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
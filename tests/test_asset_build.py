@@ -0,0 +1,91 @@
+"""asset_build - 지문/디스크 바이트가 같을 때만 건너뜀, 바뀐 출력만 기록"""
+
+import json
+import os
+
+import pytest
+
+from asset_build import AssetBuild, FileInput, fingerprint
+
+
+def make_build(tmp_path, incremental=True):
+    return AssetBuild(incremental=incremental, manifest_path=str(tmp_path / "manifest.json"))
+
+
+def test_fingerprint_follows_inputs(tmp_path):
+    font = tmp_path / "font.ttf"
+    font.write_bytes(b"a")
+    before = fingerprint(make_build, 1, (1, 2), FileInput(str(font)))
+    assert fingerprint(make_build, 1, (1, 2), FileInput(str(font))) == before
+    assert fingerprint(make_build, 2, (1, 2), FileInput(str(font))) != before
+    font.write_bytes(b"b")
+    assert fingerprint(make_build, 1, (1, 2), FileInput(str(font))) != before
+
+
+def test_fresh_only_when_fingerprint_and_bytes_match(tmp_path):
+    path = str(tmp_path / "out" / "a.bin")
+    build = make_build(tmp_path)
+    os.makedirs(os.path.dirname(path))
+    assert build.write_bytes(path, b"one", "fp1")
+    build.save()
+
+    build = make_build(tmp_path)
+    assert build.is_fresh(path, "fp1")
+    assert not build.is_fresh(path, "fp2")
+    with open(path, 'wb') as f:
+        f.write(b"edited by hand")
+    assert not build.is_fresh(path, "fp1")
+    os.remove(path)
+    assert not build.is_fresh(path, "fp1")
+
+
+def test_full_runs_never_skip(tmp_path):
+    path = str(tmp_path / "a.bin")
+    build = make_build(tmp_path)
+    build.write_bytes(path, b"one", "fp")
+    build.save()
+    assert not make_build(tmp_path, incremental=False).is_fresh(path, "fp")
+
+
+def test_write_bytes_reports_changes(tmp_path):
+    path = str(tmp_path / "a.bin")
+    build = make_build(tmp_path)
+    assert build.write_bytes(path, b"one", "fp")
+    assert not build.write_bytes(path, b"one", "fp2")
+    assert build.write_bytes(path, b"two", "fp2")
+    assert (build.written, build.skipped) == (2, 1)
+    assert build.written_paths == [path, path]
+
+
+def test_skip_requires_manifest_entry(tmp_path):
+    build = make_build(tmp_path)
+    with pytest.raises(KeyError):
+        build.skip(str(tmp_path / "never_written.png"))
+    path = str(tmp_path / "a.bin")
+    build.write_bytes(path, b"one", "fp")
+    build.skip(path)
+    assert build.skipped == 1
+
+
+def test_manifest_written_only_for_incremental_runs(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    build = make_build(tmp_path, incremental=False)
+    build.write_bytes(str(tmp_path / "a.bin"), b"one", "fp")
+    build.save()
+    assert not manifest.exists()
+
+    build = make_build(tmp_path)
+    build.write_bytes(str(tmp_path / "a.bin"), b"one", "fp")
+    build.save()
+    assert list(json.loads(manifest.read_text())["outputs"]) == [str(tmp_path / "a.bin")]
+
+
+def test_remove_drops_file_and_entry(tmp_path):
+    path = str(tmp_path / "a.bin")
+    build = make_build(tmp_path)
+    build.write_bytes(path, b"one", "fp")
+    build.remove(path)
+    build.remove(path)
+    assert not os.path.exists(path)
+    assert not build.is_fresh(path, "fp")
+    assert build.entries == {}
@@ -0,0 +1,90 @@
+"""asset_validate - PNG 헤더 읽기와 규칙 표 (크기, 알파, 비트 깊이, Contents.json)"""
+
+import json
+import os
+
+from PIL import Image
+
+import asset_validate
+from asset_validate import Rule, check, collect, read_png_header, rule_for
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def png(path, mode='RGB', size=(4, 4), **params):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.new(mode, size).save(path, **params)
+    return path
+
+
+def test_header_reads_ihdr_and_alpha(tmp_path):
+    info = read_png_header(png(str(tmp_path / "a.png"), 'RGBA', (3, 5)))
+    assert (info["width"], info["height"], info["bit_depth"], info["color_type"]) == (3, 5, 8, 6)
+    assert info["alpha"] and info["chunks"][0] == "IHDR" and info["chunks"][-1] == "IEND"
+    assert not info["errors"]
+    # 팔레트 + tRNS 도 알파
+    assert read_png_header(png(str(tmp_path / "p.png"), 'P', transparency=0))["alpha"]
+    assert not read_png_header(png(str(tmp_path / "rgb.png")))["alpha"]
+
+
+def test_truncated_and_non_png(tmp_path):
+    path = png(str(tmp_path / "a.png"))
+    data = open(path, 'rb').read()
+    with open(path, 'wb') as f:
+        f.write(data[:-20])
+    assert read_png_header(path)["errors"]
+    (tmp_path / "x.png").write_bytes(b"GIF89a" + bytes(20))
+    assert check(read_png_header(str(tmp_path / "x.png")), Rule("png", alpha=True))
+
+
+def test_check_rules():
+    info = {"errors": [], "width": 10, "height": 20, "bit_depth": 16, "color_type": 6, "alpha": True, "chunks": ["IHDR", "acTL"]}
+    problems = check(info, Rule("r", [(20, 10)]))
+    assert len(problems) == 4  # 크기, 알파, 비트 깊이, 애니메이션
+    assert check(dict(info, bit_depth=8, chunks=["IHDR"]), Rule("r", [(10, 20)], alpha=True)) == []
+
+
+def test_screenshot_rule_table():
+    assert rule_for("AppStore/screenshots/6.7/01_home.png").sizes == {(1290, 2796), (2796, 1290)}
+    assert rule_for("AppStore/screenshots/ko/ipad-13/01_home.png").name == "screenshot ipad-13"
+    generic = rule_for("AppStore/Screenshots/promo.png")
+    assert generic.name == "screenshot" and (1320, 2868) in generic.sizes and not generic.alpha
+    assert rule_for("docs/icon.png").alpha
+
+
+def test_contents_json_rules(tmp_path):
+    d = tmp_path / "AppIcon.appiconset"
+    png(str(d / "icon.png"), size=(120, 120))
+    png(str(d / "dark.png"), 'RGBA', size=(120, 120))
+    png(str(d / "extra.png"))
+    images = [
+        {"filename": "icon.png", "idiom": "universal", "platform": "ios", "size": "60x60", "scale": "2x"},
+        {"filename": "dark.png", "idiom": "universal", "platform": "ios", "size": "60x60", "scale": "2x",
+         "appearances": [{"appearance": "luminosity", "value": "dark"}]},
+        {"filename": "gone.png", "idiom": "universal", "size": "20x20", "scale": "1x"},
+    ]
+    (d / "Contents.json").write_text(json.dumps({"images": images}))
+    targets, problems = collect([str(tmp_path)])
+    assert any("gone.png" in p for p in problems)
+    assert any("extra.png" in p and "Contents.json" in p for p in problems)
+    rules = {os.path.basename(path): rule for path, rule in targets}
+    assert rules["icon.png"].sizes == {(120, 120)} and not rules["icon.png"].alpha
+    assert rules["dark.png"].alpha
+    assert all(check(read_png_header(path), rule) == [] for path, rule in targets
+               if not path.endswith("extra.png"))
+
+
+def test_opaque_icon_with_alpha_fails(tmp_path):
+    d = tmp_path / "AppIcon.appiconset"
+    png(str(d / "icon.png"), 'RGBA', size=(40, 40))
+    (d / "Contents.json").write_text(json.dumps({"images": [
+        {"filename": "icon.png", "idiom": "universal", "size": "20x20", "scale": "2x"}]}))
+    [(_, _, issues)], problems = asset_validate.validate([str(tmp_path)], jobs=1)
+    assert problems == [] and any("알파" in issue for issue in issues)
+
+
+def test_committed_assets_pass():
+    roots = [os.path.join(ROOT, r) for r in asset_validate.DEFAULT_ROOTS]
+    results, problems = asset_validate.validate(roots, jobs=2)
+    assert results and problems == []
+    assert [path for path, _, issues in results if issues] == []
@@ -0,0 +1,107 @@
+"""blob_store - blob 저장/연결, stat 기반 변경 판단, 픽셀 색인, gc, ingest"""
+
+import os
+
+import pytest
+from PIL import Image
+
+import blob_store
+from asset_build import AssetBuild, sha256_bytes
+from blob_store import BlobStore, ingest
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path / "store"), link="hardlink")
+
+
+def test_put_stores_each_content_once(store):
+    digest = store.put(b"abc")
+    assert digest == sha256_bytes(b"abc") and store.put(b"abc") == digest
+    assert store.blobs() == {digest: 3}
+    assert os.stat(store.blob_path(digest)).st_mode & 0o777 == 0o444
+
+
+def test_materialize_links_and_holds(store, tmp_path):
+    digest = store.put(b"abc")
+    path = str(tmp_path / "out" / "a.png")
+    assert store.materialize(digest, path) == "hardlink"
+    assert os.path.samefile(path, store.blob_path(digest))
+    assert store.holds(path, digest) and not store.holds(path, sha256_bytes(b"other"))
+    # rename 으로 바꾼 출력은 링크가 끊겨 더 이상 blob 과 같다고 보지 않음
+    tmp = path + ".new"
+    with open(tmp, 'wb') as f:
+        f.write(b"changed")
+    os.replace(tmp, path)
+    assert not store.holds(path, digest)
+    assert open(store.blob_path(digest), 'rb').read() == b"abc"
+
+
+def test_copy_mode_writes_writable_files(tmp_path):
+    store = BlobStore(str(tmp_path / "store"), link="copy")
+    digest = store.put(b"abc")
+    path = str(tmp_path / "a.png")
+    assert store.materialize(digest, path) == "copy"
+    assert not os.path.samefile(path, store.blob_path(digest))
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+
+def test_pixel_index_reuses_encoded_bytes(store, monkeypatch):
+    img = Image.new('RGB', (16, 16), (10, 20, 30))
+    data = store.encode_png(img, {"compress_level": 6})
+    monkeypatch.setattr(blob_store, "encode_png", lambda *a: pytest.fail("encoded again"))
+    assert store.encode_png(img.copy(), {"compress_level": 6}) == data
+
+
+def test_index_round_trip(store, tmp_path):
+    path = str(tmp_path / "a.png")
+    digest = store.put(b"abc")
+    store.materialize(digest, path)
+    store.save()
+    again = BlobStore(store.root)
+    assert again.holds(path, digest)
+
+
+def test_gc_keeps_live_blobs_only(store, tmp_path):
+    keep, drop = store.put(b"keep"), store.put(b"drop")
+    a, b, c = (str(tmp_path / name) for name in ("a", "b", "c"))
+    store.materialize(keep, a)
+    store.materialize(keep, b)
+    store.materialize(drop, c)
+    os.remove(c)
+    assert store.gc(dry_run=True) == (1, 4)
+    assert store.has(drop)
+    assert store.gc() == (1, 4)
+    assert not store.has(drop) and store.has(keep)
+    # 마지막 참조를 잊으면 (삭제한 출력) 그 blob 도 정리
+    store.forget(a)
+    store.forget(b)
+    assert store.refs == {} and store.gc() == (1, 4)
+
+
+def test_ingest_skips_hidden_dirs_and_store(tmp_path):
+    root = tmp_path / "tree"
+    (root / ".git").mkdir(parents=True)
+    (root / ".git" / "HEAD").write_bytes(b"ref")
+    (root / "sub").mkdir()
+    (root / "a.png").write_bytes(b"same")
+    (root / "sub" / "b.png").write_bytes(b"same")
+    store = BlobStore(str(root / "store"), link="hardlink")
+    store.put(b"blob")
+    assert ingest(store, [str(root)]) == 2
+    assert len(store.blobs()) == 2
+    assert os.path.samefile(root / "a.png", root / "sub" / "b.png")
+    assert not store.refs.get(BlobStore._key(str(root / ".git" / "HEAD")))
+    # 그대로면 다시 연결하지 않음
+    assert ingest(store, [str(root)]) == 0
+
+
+def test_build_dedups_and_forgets_removed_outputs(store, tmp_path):
+    build = AssetBuild(manifest_path=str(tmp_path / "m.json"), store=store)
+    a, b = str(tmp_path / "a.png"), str(tmp_path / "b.png")
+    assert build.write_bytes(a, b"same", "fp") and build.write_bytes(b, b"same", "fp")
+    report = store.dedup_report()
+    assert (report["paths"], report["blobs"], report["logical"], report["unique"]) == (2, 1, 8, 4)
+    assert not build.write_bytes(a, b"same", "fp")
+    build.remove(a)
+    assert BlobStore._key(a) not in store.refs and not os.path.exists(a)
@@ -0,0 +1,71 @@
+"""color_output - ICC v2 프로필 헤더/태그, 원색 (D50 순응), 스플래시 sRGB 태그"""
+
+import io
+import os
+import struct
+
+import numpy as np
+from PIL import Image
+
+import color_output
+from asset_build import AssetBuild
+from color_output import D50_XYZ, DISPLAY_P3, SRGB, profile
+from generate_splash import P3_FILES, SPLASH_SIZES, create_splash_image, save_splash_assets
+
+
+def tags(data):
+    count = struct.unpack('>I', data[128:132])[0]
+    return {sig.decode(): (offset, size) for sig, offset, size in
+            (struct.unpack('>4sII', data[132 + 12 * i:144 + 12 * i]) for i in range(count))}
+
+
+def xyz(data, sig):
+    offset, _ = tags(data)[sig]
+    assert data[offset:offset + 4] == b'XYZ '
+    return np.array(struct.unpack('>3i', data[offset + 8:offset + 20])) / 65536
+
+
+def test_icc_header():
+    for gamut in (SRGB, DISPLAY_P3):
+        data = profile(gamut)
+        assert struct.unpack('>I', data[:4])[0] == len(data)
+        assert struct.unpack('>I', data[8:12])[0] == 0x02100000
+        assert data[12:24] == b'mntrRGB XYZ '
+        assert data[36:40] == b'acsp'
+        table = tags(data)
+        assert len(table) == 9
+        assert all(offset % 4 == 0 and offset + size <= len(data) for offset, size in table.values())
+        # 세 TRC 는 같은 곡선 데이터를 공유
+        assert table['rTRC'] == table['gTRC'] == table['bTRC']
+
+
+def test_colorants_add_up_to_d50_white():
+    for gamut in (SRGB, DISPLAY_P3):
+        data = profile(gamut)
+        white = xyz(data, 'rXYZ') + xyz(data, 'gXYZ') + xyz(data, 'bXYZ')
+        assert np.allclose(white, D50_XYZ, atol=1e-3)
+        assert np.allclose(xyz(data, 'wtpt'), D50_XYZ, atol=1e-4)
+    # P3 빨강이 더 채도 높음 (x 좌표)
+    red = {g: xyz(profile(g), 'rXYZ') for g in (SRGB, DISPLAY_P3)}
+    assert red[DISPLAY_P3][0] / red[DISPLAY_P3].sum() > red[SRGB][0] / red[SRGB].sum()
+
+
+def test_profile_parses_and_is_deterministic():
+    from PIL import ImageCms
+    parsed = ImageCms.ImageCmsProfile(io.BytesIO(profile(SRGB)))
+    assert ImageCms.getProfileDescription(parsed).strip() == "sRGB IEC61966-2.1"
+    assert color_output.icc_profile(SRGB) == profile(SRGB)
+
+
+def test_splash_is_srgb_tagged_and_p3_files_removed(tmp_path):
+    out = tmp_path / "SplashLogo.imageset"
+    out.mkdir()
+    stale = out / P3_FILES[0]
+    stale.write_bytes(b"old")
+    save_splash_assets(str(out), AssetBuild(manifest_path=str(tmp_path / "m.json")))
+    assert not stale.exists()
+    assert sorted(os.listdir(out)) == sorted(["Contents.json"] + [name for _, name in SPLASH_SIZES])
+    size, name = SPLASH_SIZES[0]
+    with Image.open(out / name) as img:
+        assert img.info["icc_profile"] == profile(SRGB)
+        assert img.tobytes() == create_splash_image(size, size).convert(img.mode).tobytes()
@@ -0,0 +1,33 @@
+"""디스플레이 리스트 재생 - 기준 크기에서 생성기와 같은 픽셀"""
+
+import os
+
+import numpy as np
+from PIL import Image
+
+import display_list
+from generate_app_icon import ICON_REF, create_app_icon, record_app_icon
+from generate_splash import SPLASH_REF, create_splash_image, record_splash
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICON_1024 = os.path.join(ROOT, "VoiceScheduler/Assets.xcassets/AppIcon.appiconset/icon_1024.png")
+
+
+def same_pixels(a, b):
+    return a.mode == b.mode and a.size == b.size and a.tobytes() == b.tobytes()
+
+
+def test_icon_replay_at_reference_size():
+    dl = display_list.DisplayList.from_json(record_app_icon().to_json())
+    assert same_pixels(display_list.replay(dl, ICON_REF), create_app_icon(ICON_REF))
+
+
+def test_splash_replay_at_reference_size():
+    dl = display_list.DisplayList.from_json(record_splash().to_json())
+    assert same_pixels(display_list.replay(dl, SPLASH_REF), create_splash_image(SPLASH_REF, SPLASH_REF))
+
+
+def test_icon_matches_committed_master():
+    with Image.open(ICON_1024) as golden:
+        assert np.array_equal(np.asarray(create_app_icon(ICON_REF).convert('RGB')), np.asarray(golden.convert('RGB')))
+
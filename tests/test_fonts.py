@@ -0,0 +1,32 @@
+"""fonts - 스크립트 폰트가 없으면 'sans' 로 대체하되 실행마다 한 번 경고"""
+
+import fonts
+
+
+def test_missing_script_font_warns_once(monkeypatch, capsys):
+    monkeypatch.setattr(fonts, "font_entry", lambda family="sans": ("sans.ttf", 0) if family == "sans" else None)
+    monkeypatch.setattr(fonts, "_missing", set())
+    fonts.family_for.cache_clear()
+    try:
+        assert fonts.family_for("음성 일정") == "sans"
+        assert fonts.family_for("한국어") == "sans"
+        assert fonts.family_for("हिन्दी") == "sans"
+        assert fonts.family_for("Voice") == "sans"
+    finally:
+        fonts.family_for.cache_clear()
+    err = capsys.readouterr().err
+    assert err.count("sans-kr") == 1
+    assert err.count("sans-deva") == 1
+    assert "latin" not in err
+
+
+def test_installed_script_font_is_used(monkeypatch, capsys):
+    monkeypatch.setattr(fonts, "font_entry", lambda family="sans": (family + ".ttf", 0))
+    fonts.family_for.cache_clear()
+    try:
+        assert fonts.family_for("日本語", "ja") == "sans-jp"
+        assert fonts.family_for("日本語", "zh-Hans") == "sans-sc"
+        assert fonts.family_for("ひらがな") == "sans-jp"
+    finally:
+        fonts.family_for.cache_clear()
+    assert capsys.readouterr().err == ""
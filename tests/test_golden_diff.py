@@ -0,0 +1,43 @@
+"""golden_diff - 생성기 경로 -> 골든 경로 대응, 골든이 없으면 실패"""
+
+import os
+
+from PIL import Image
+
+from golden_diff import diff_trees, golden_path, report
+
+
+def save(path, color):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.new('RGB', (16, 16), color).save(path)
+
+
+def test_screenshot_paths_map_to_committed_goldens():
+    rel = os.path.join("AppStore", "screenshots", "6.5", "01_voice_input.png")
+    assert golden_path(rel) == os.path.join("AppStore", "Screenshots", "6.5", "01_voice_input.png")
+    icon = os.path.join("VoiceScheduler", "Assets.xcassets", "AppIcon.appiconset", "icon_1024.png")
+    assert golden_path(icon) == icon
+
+
+def test_every_generated_screenshot_has_a_golden():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    from generate_screenshots import SCREENS
+    from screenshot_templates import DEVICES
+    for device in DEVICES:
+        for filename, _ in SCREENS:
+            rel = os.path.join("AppStore", "screenshots", device, filename)
+            assert os.path.exists(os.path.join(root, golden_path(rel))), rel
+
+
+def test_changed_and_missing_goldens_fail(tmp_path):
+    new, golden = tmp_path / "new", tmp_path / "golden"
+    save(str(new / "AppStore/screenshots/6.5/a.png"), (1, 2, 3))
+    save(str(golden / "AppStore/Screenshots/6.5/a.png"), (1, 2, 3))
+    save(str(new / "b.png"), (9, 9, 9))
+    save(str(golden / "b.png"), (0, 0, 0))
+    save(str(new / "c.png"), (5, 5, 5))
+    results = dict(diff_trees(str(new), str(golden), None))
+    assert results[os.path.join("AppStore", "screenshots", "6.5", "a.png")]["status"] == "identical"
+    assert results["b.png"]["status"] == "changed"
+    assert results["c.png"]["status"] == "new"
+    assert report(list(results.items())) == 2
@@ -0,0 +1,39 @@
+"""gradient - 기존 draw.line 루프와 같은 픽셀 + 캐시 사본"""
+
+from PIL import Image, ImageDraw
+
+import gradient
+
+DEEP_NAVY = (15, 20, 40)
+NAVY_MID = (25, 35, 65)
+
+
+def scanline_gradient(size, top, bottom):
+    """교체 전 아이콘/스크린샷 배경 루프"""
+    img = Image.new('RGB', size)
+    draw = ImageDraw.Draw(img)
+    width, height = size
+    for y in range(height):
+        ratio = y / height
+        draw.line([(0, y), (width, y)], fill=tuple(int(a + (b - a) * ratio) for a, b in zip(top, bottom)))
+    return img
+
+
+def test_linear_matches_scanline_loop():
+    for size in [(1024, 1024), (1284, 2778), (37, 501)]:
+        expected = scanline_gradient(size, DEEP_NAVY, NAVY_MID)
+        assert gradient.linear_gradient(size, DEEP_NAVY, NAVY_MID).tobytes() == expected.tobytes()
+
+
+def test_rows_match_full_render():
+    full = gradient.radial_gradient((300, 200), (40, 60, 90), (5, 10, 20), mode='RGBA')
+    band = gradient.radial_gradient((300, 200), (40, 60, 90), (5, 10, 20), mode='RGBA', rows=(50, 130))
+    assert band.tobytes() == full.crop((0, 50, 300, 130)).tobytes()
+
+
+def test_cached_raster_is_copied():
+    gradient.clear_cache()
+    first = gradient.linear_gradient((64, 64), DEEP_NAVY, NAVY_MID)
+    ImageDraw.Draw(first).rectangle([0, 0, 63, 63], fill=(255, 0, 0))
+    second = gradient.linear_gradient((64, 64), DEEP_NAVY, NAVY_MID)
+    assert second.tobytes() == scanline_gradient((64, 64), DEEP_NAVY, NAVY_MID).tobytes()
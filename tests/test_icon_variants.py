@@ -0,0 +1,46 @@
+"""icon_variants - 외관 레이어는 기본 아이콘 세트와 같은 마스터 축소 (크기별 SDF 재생 아님)"""
+
+import io
+
+import numpy as np
+from PIL import Image
+
+import display_list
+import icon_variants
+from generate_app_icon import ICON_REF, record_app_icon
+from resize_plan import ResizePlan, render_plan
+
+DEEP_NAVY = np.array((15, 20, 40)) / 255
+
+
+def default_icon(dl, width):
+    encoded = render_plan(display_list.replay(dl, ICON_REF), ResizePlan([(width, "icon.png")]))
+    with Image.open(io.BytesIO(encoded[(width, width)])) as img:
+        return np.asarray(img.convert('RGB'), np.float64)
+
+
+def test_layers_match_default_icon_geometry():
+    dl = record_app_icon()
+    try:
+        for width in (40, 120):
+            layers = icon_variants.icon_layers(dl, width)
+            rgb, alpha = icon_variants.composite([(px[..., :3], px[..., 3]) for _, px in layers])
+            flat = np.rint((rgb * alpha[..., None] + DEEP_NAVY * (1 - alpha[..., None])) * 255)
+            assert np.abs(flat - default_icon(dl, width)).mean() < 4
+    finally:
+        icon_variants.clear_cache()
+
+
+def test_variants_are_transparent_derivations():
+    dl = record_app_icon()
+    try:
+        layers = icon_variants.icon_layers(dl, 60)
+        dark, tinted = icon_variants.dark_icon(layers), icon_variants.tinted_icon(layers)
+    finally:
+        icon_variants.clear_cache()
+    for img in (dark, tinted):
+        assert img.mode == 'RGBA' and img.size == (60, 60)
+        # 배경은 빠짐 - 모서리 투명
+        assert img.getpixel((0, 0))[3] == 0
+    r, g, b, _ = np.asarray(tinted).transpose(2, 0, 1)
+    assert np.array_equal(r, g) and np.array_equal(g, b)
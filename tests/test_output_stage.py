@@ -0,0 +1,107 @@
+"""output_stage - 인코딩/쓰기 스레드, 오류 전파, 스레드는 프로세스 풀 fork 뒤에 시작"""
+
+import os
+import threading
+
+import pytest
+from PIL import Image
+
+import parallel_render
+from asset_build import AssetBuild
+from output_stage import OutputStage, render_to_stage
+
+
+def solid(color):
+    return Image.new('RGB', (8, 8), color)
+
+
+def render_solid(color):
+    return solid(color)
+
+
+class FailingBuild(AssetBuild):
+    """특정 색 이미지 인코딩에서 실패"""
+
+    def encode(self, img, params=None):
+        if img.getpixel((0, 0)) == (255, 0, 0):
+            raise ValueError("encode failed")
+        return super().encode(img)
+
+
+def test_writes_every_target_and_reports(tmp_path):
+    build = AssetBuild(manifest_path=str(tmp_path / "m.json"))
+    seen = []
+    a, b = str(tmp_path / "a.png"), str(tmp_path / "b.png")
+    with OutputStage(build, threads=2, report=lambda label, changed: seen.append((label, changed))) as stage:
+        stage.submit(solid((1, 2, 3)), [(a, "fp", "a"), (b, "fp", "b")])
+    assert sorted(seen) == [("a", True), ("b", True)]
+    with Image.open(a) as img:
+        assert img.getpixel((0, 0)) == (1, 2, 3)
+    assert open(a, 'rb').read() == open(b, 'rb').read()
+
+
+def test_first_error_is_raised_on_close(tmp_path):
+    build = FailingBuild(manifest_path=str(tmp_path / "m.json"))
+    stage = OutputStage(build, threads=1)
+    stage.submit(solid((255, 0, 0)), [(str(tmp_path / "bad.png"), "fp", "bad")])
+    stage.submit(solid((0, 0, 255)), [(str(tmp_path / "later.png"), "fp", "later")])
+    with pytest.raises(ValueError, match="encode failed"):
+        stage.close()
+    # 실패 뒤 작업은 버림
+    assert not os.path.exists(tmp_path / "later.png")
+
+
+def test_error_is_raised_on_next_submit(tmp_path):
+    build = FailingBuild(manifest_path=str(tmp_path / "m.json"))
+    stage = OutputStage(build, threads=1)
+    stage.submit(solid((255, 0, 0)), [(str(tmp_path / "bad.png"), "fp", "bad")])
+    stage.queue.join()
+    with pytest.raises(ValueError):
+        stage.submit(solid((0, 0, 255)), [(str(tmp_path / "x.png"), "fp", "x")])
+    stage.close(raise_error=False)
+
+
+def test_body_error_wins_but_queued_outputs_are_written(tmp_path):
+    build = AssetBuild(manifest_path=str(tmp_path / "m.json"))
+    path = str(tmp_path / "a.png")
+    with pytest.raises(KeyError):
+        with OutputStage(build, threads=1) as stage:
+            stage.submit(solid((1, 2, 3)), [(path, "fp", "a")])
+            raise KeyError("render failed")
+    assert os.path.exists(path)
+
+
+def test_threads_start_after_the_pool_forks(tmp_path, monkeypatch):
+    real = parallel_render.ProcessPoolExecutor
+    threads_at_fork = []
+
+    def pool(*args, **kwargs):
+        threads_at_fork.append(threading.active_count())
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(parallel_render, "ProcessPoolExecutor", pool)
+    build = AssetBuild(manifest_path=str(tmp_path / "m.json"))
+    stage = OutputStage(build, threads=2)
+    assert stage._workers == []
+    with stage:
+        render_to_stage(stage, render_solid, [(1, 1, 1), (2, 2, 2)],
+                        [[(str(tmp_path / f"{i}.png"), "fp", str(i))] for i in range(2)], jobs=2)
+    assert threads_at_fork == [1]
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_icon_set_forks_before_output_threads(tmp_path, monkeypatch):
+    from generate_app_icon import ICON_SIZES, record_app_icon, save_icon_set
+
+    real = parallel_render.ProcessPoolExecutor
+    threads_at_fork = []
+
+    def pool(*args, **kwargs):
+        threads_at_fork.append(threading.active_count())
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(parallel_render, "ProcessPoolExecutor", pool)
+    build = AssetBuild(manifest_path=str(tmp_path / "m.json"))
+    save_icon_set(record_app_icon(), str(tmp_path), build, jobs=2, direct_below=60)
+    assert threads_at_fork and set(threads_at_fork) == {1}
+    assert len([n for n in os.listdir(tmp_path) if n.endswith(".png")]) == len(ICON_SIZES)
@@ -0,0 +1,83 @@
+"""png_optimize - 무손실 재인코딩, 8비트가 아닌 입력은 그대로"""
+
+import io
+import struct
+import zlib
+
+import numpy as np
+from PIL import Image
+
+from png_optimize import PNG_SIGNATURE, _chunk, decoded_pixels, optimize_bytes
+
+
+def png_bytes(img, **params):
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', **params)
+    return buf.getvalue()
+
+
+def noisy(mode, size=(64, 48), seed=0):
+    rng = np.random.default_rng(seed)
+    channels = len(Image.new(mode, (1, 1)).getbands())
+    px = rng.integers(0, 256, (size[1], size[0], channels), dtype=np.uint8)
+    return Image.fromarray(px[..., 0] if channels == 1 else px, mode)
+
+
+def test_round_trip_is_lossless():
+    flat = Image.new('RGBA', (80, 60), (15, 20, 40, 255))
+    gray = Image.new('RGB', (80, 60), (90, 90, 90))
+    few = noisy('RGB').quantize(16).convert('RGB')
+    for img in [noisy('RGBA'), noisy('RGB'), noisy('L'), flat, gray, few]:
+        data = png_bytes(img, compress_level=0)
+        result = optimize_bytes(data)
+        assert result["after"] <= result["before"]
+        assert not result["mismatch"]
+        assert decoded_pixels(result["bytes"]) == decoded_pixels(data)
+    # 알파/색/팔레트 축소가 되는 입력은 실제로 줄어야 함
+    for img in [flat, gray, few]:
+        result = optimize_bytes(png_bytes(img, compress_level=0))
+        assert result["after"] < result["before"]
+
+
+def test_16_bit_rgb_passes_through():
+    px = np.random.default_rng(1).integers(0, 65536, (32, 32, 3), dtype=np.uint16)
+    # Pillow 는 16비트 RGB 를 쓰지 못해 IHDR/IDAT 를 직접 만든다
+    raw = b''.join(b'\0' + row.astype('>u2').tobytes() for row in px)
+    data = (PNG_SIGNATURE + _chunk(b'IHDR', struct.pack('>IIBBBBB', 32, 32, 16, 2, 0, 0, 0))
+            + _chunk(b'IDAT', zlib.compress(raw, 0)) + _chunk(b'IEND', b''))
+    result = optimize_bytes(data)
+    assert result["passthrough"] == "16-bit"
+    assert result["bytes"] == data
+
+
+def test_16_bit_gray_passes_through():
+    px = np.random.default_rng(2).integers(0, 65536, (40, 40), dtype=np.uint16)
+    data = png_bytes(Image.fromarray(px), compress_level=0)
+    result = optimize_bytes(data)
+    assert result["passthrough"] == "16-bit"
+    assert result["bytes"] == data
+    with Image.open(io.BytesIO(result["bytes"])) as img:
+        assert np.array_equal(np.asarray(img), px)
+
+
+def test_optimize_files_uses_cache_in_parent(tmp_path, monkeypatch):
+    import png_optimize
+    from png_optimize import OptimizeCache, optimize_files
+
+    a, b = tmp_path / "a.png", tmp_path / "b.png"
+    data = png_bytes(Image.new('RGB', (80, 60), (90, 90, 90)), compress_level=0)
+    a.write_bytes(data)
+    cache = OptimizeCache(str(tmp_path / "cache.json"))
+    first = optimize_files([str(a)], cache=cache)
+    assert not first[0]["skipped"] and not first[0]["cached"]
+
+    # a 는 이미 최적화됨 (워커로 가지 않음), 같은 원본 바이트인 b 는 캐시 파라미터로
+    b.write_bytes(data)
+    tasks = []
+    real = png_optimize.run_parallel
+    monkeypatch.setattr(png_optimize, "run_parallel", lambda fn, ts, jobs: tasks.extend(ts) or real(fn, ts, jobs))
+    second = optimize_files([str(a), str(b)], cache=cache)
+    assert [r["skipped"] for r in second] == [True, False]
+    assert second[1]["cached"]
+    assert tasks == [(str(b), cache.entries[first[0]["pixels"]])]
+    assert a.read_bytes() == b.read_bytes()
@@ -0,0 +1,43 @@
+"""resize_plan - 고유 크기별 한 번만, 피라미드 레벨은 목표의 2배 이상"""
+
+import io
+
+from PIL import Image
+
+from asset_build import encode_png
+from generate_app_icon import ICON_SIZES
+from resize_plan import Pyramid, ResizePlan, render_plan
+
+
+def test_plan_dedups_shared_pixel_sizes():
+    plan = ResizePlan([(120, "icon_60@2x.png"), (40, "icon_20@2x.png"), (120, "icon_40@3x.png"), ((60, 30), "wide.png")])
+    assert plan.sizes == [(120, 120), (60, 30), (40, 40)]
+    assert dict(plan)[(120, 120)] == ["icon_60@2x.png", "icon_40@3x.png"]
+
+
+def test_icon_table_has_fewer_renders_than_files():
+    plan = ResizePlan(ICON_SIZES)
+    assert sum(len(names) for _, names in plan) == len(ICON_SIZES)
+    assert len(plan.sizes) < len(ICON_SIZES)
+
+
+def test_pyramid_source_is_smallest_level_at_least_twice_the_target():
+    pyramid = Pyramid(Image.new('RGB', (1024, 1024)))
+    assert pyramid.source_for((1024, 1024)).size == (1024, 1024)
+    assert pyramid.source_for((400, 400)).size == (1024, 1024)
+    assert pyramid.source_for((120, 120)).size == (256, 256)
+    assert pyramid.source_for((20, 20)).size == (64, 64)
+    # 이미 만든 레벨은 다시 만들지 않음
+    levels = list(pyramid.levels)
+    pyramid.source_for((120, 120))
+    assert pyramid.levels == levels
+
+
+def test_render_plan_encodes_each_size_once():
+    master = Image.linear_gradient('L').resize((512, 512)).convert('RGB')
+    plan = ResizePlan([(512, "a.png"), (100, "b.png"), (100, "c.png")])
+    encoded = render_plan(master, plan)
+    assert set(encoded) == {(512, 512), (100, 100)}
+    assert encoded[(512, 512)] == encode_png(master)
+    with Image.open(io.BytesIO(encoded[(100, 100)])) as img:
+        assert img.size == (100, 100)
@@ -0,0 +1,41 @@
+"""스플래시 애니메이션 - 부분 갱신 프레임이 전체 렌더와 같고 마지막 프레임 = 정적 스플래시"""
+
+import numpy as np
+from PIL import Image
+
+from asset_build import AssetBuild
+from generate_splash import create_splash_image
+from splash_frames import SplashAnimator, write_apng, write_frames
+
+FRAMES = 8
+
+
+def rgba(img):
+    return np.asarray(img.convert('RGBA'))
+
+
+def test_apng_last_frame_is_static_splash(tmp_path):
+    path = str(tmp_path / "splash.apng")
+    write_apng(SplashAnimator(400, FRAMES), path)
+    with Image.open(path) as apng:
+        assert apng.n_frames == FRAMES
+        apng.seek(FRAMES - 1)
+        assert np.array_equal(rgba(apng), rgba(create_splash_image(400, 400)))
+
+
+def test_partial_updates_match_fresh_render():
+    animator = SplashAnimator(200, FRAMES)
+    for i in range(FRAMES):
+        animator.render(i)
+        fresh = SplashAnimator(200, FRAMES)
+        fresh.render(i)
+        assert np.array_equal(rgba(animator.canvas), rgba(fresh.canvas)), f"frame {i}"
+
+
+def test_write_frames_removes_stale_frames(tmp_path):
+    out = tmp_path / "frames"
+    build = AssetBuild(manifest_path=str(tmp_path / "manifest.json"))
+    assert write_frames(SplashAnimator(64, 5), str(out), build) == (5, 0)
+    written, removed = write_frames(SplashAnimator(64, 3), str(out), build)
+    assert removed == 2
+    assert sorted(p.name for p in out.iterdir()) == ["frame_0000.png", "frame_0001.png", "frame_0002.png"]
@@ -0,0 +1,15 @@
+"""띠 렌더링 - 행 띠로 나눠 그린 아이콘이 전체 렌더와 같은 픽셀"""
+
+import numpy as np
+from PIL import Image
+
+from generate_app_icon import create_app_icon
+from strip_render import render_icon_strips
+
+
+def test_strip_render_matches_full_render(tmp_path):
+    path = str(tmp_path / "icon.png")
+    stats = render_icon_strips(300, path, rows=64)
+    assert stats["strips"] == 5
+    with Image.open(path) as strips:
+        assert np.array_equal(np.asarray(strips.convert('RGB')), np.asarray(create_app_icon(300).convert('RGB')))
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Watch
+디자인 반복용 상주 렌더 데몬 - 바뀐 생성기 함수만 다시 렌더링해 로컬 미리보기 페이지로 실시간 반영
+"""
+
+import argparse
+import ast
+import hashlib
+import html
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 감시하는 저장소 모듈 - 의존 순서 (다시 불러올 때 이 순서로)
+MODULES = ["gradient", "sdf_raster", "strip_render", "fonts", "localization", "screenshot_templates",
+           "generate_app_icon", "generate_splash", "generate_screenshots"]
+
+POLL_SECONDS = 0.05
+
+# 데이터 파일 노드를 읽어 들이는 함수 (이 함수를 거치는 에셋이 데이터 변경의 영향을 받음)
+DATA_OWNERS = {
+    ("screenshot_templates", "load_spec"): [("spec", "palette")],
+    ("localization", "load_index"): [("strings", "*")],
+}
+
+# 미리보기 PNG 는 속도 우선 (결과 에셋은 각 생성기가 레벨 9 로)
+PREVIEW_PNG_PARAMS = {"compress_level": 1}
+
+
+# === 정적 의존 그래프 ===
+
+def _digest(node):
+    # ast.dump 는 위치 정보를 빼므로 주석/공백만 바뀐 저장은 변경이 아님
+    return hashlib.sha1(ast.dump(node).encode('utf-8')).hexdigest()
+
+
+def _targets(node):
+    names = []
+    for target in (node.targets if isinstance(node, ast.Assign) else [node.target]):
+        for t in ast.walk(target):
+            if isinstance(t, ast.Name):
+                names.append(t.id)
+    return names
+
+
+class ModuleGraph:
+    """모듈 한 파일의 최상위 정의별 해시와 참조 - (모듈, 이름) 노드 그래프
+
+    노드: 최상위 함수/클래스와 대입된 상수. 참조: 같은 모듈의 이름, `from X import y` 로
+    가져온 이름, `import X` 후 X.attr. 문자열 상수는 에셋 함수 자신의 스펙 화면 이름
+    (ss3 -> "calendar") 을 찾는 데만 쓴다.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.path = os.path.join(ROOT, name + ".py")
+        self.hashes = {}
+        self.refs = {}
+        self.strings = {}
+        with open(self.path, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), self.path)
+
+        aliases, modules = {}, {}
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and node.module in MODULES:
+                for a in node.names:
+                    aliases[a.asname or a.name] = (node.module, a.name)
+            elif isinstance(node, ast.Import):
+                for a in node.names:
+                    if a.name in MODULES:
+                        modules[a.asname or a.name] = a.name
+
+        defs = []
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                defs.append(([node.name], node))
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                defs.append((_targets(node), node))
+        local = {n for names, _ in defs for n in names}
+
+        for names, node in defs:
+            refs, strings = set(), set()
+            for sub in ast.walk(node):
+                if isinstance(sub, ast.Name):
+                    if sub.id in local:
+                        refs.add((name, sub.id))
+                    elif sub.id in aliases:
+                        refs.add(aliases[sub.id])
+                elif isinstance(sub, ast.Attribute) and isinstance(sub.value, ast.Name) and sub.value.id in modules:
+                    refs.add((modules[sub.value.id], sub.attr))
+                elif isinstance(sub, ast.Constant) and isinstance(sub.value, str):
+                    strings.add(sub.value)
+            digest = _digest(node)
+            for n in names:
+                self.hashes[n] = digest
+                self.refs[n] = refs
+                self.strings[n] = strings
+
+        self.imports = set(modules.values()) | {m for m, _ in aliases.values()}
+
+
+# === 데이터 파일 ===
+
+def spec_nodes():
+    """screenshots.json -> {("spec", 화면 이름 | "palette"): 해시}"""
+    from screenshot_templates import SPEC_PATH
+    with open(SPEC_PATH, encoding='utf-8') as f:
+        spec = json.load(f)
+    nodes = {("spec", name): json.dumps(s, sort_keys=True) for name, s in spec.get("screens", {}).items()}
+    nodes[("spec", "palette")] = json.dumps([spec.get("palette"), spec.get("version")], sort_keys=True)
+    return {k: hashlib.sha1(v.encode('utf-8')).hexdigest() for k, v in nodes.items()}
+
+
+def strings_node():
+    """모든 .strings 파일 -> {("strings", "*"): 해시} (load_index 가 의존)"""
+    from asset_build import sha256_file
+    from localization import load_index
+    files = sorted(load_index().files)
+    return {("strings", "*"): hashlib.sha1("".join(f + sha256_file(f) for f in files).encode()).hexdigest()}
+
+
+def data_files():
+    from localization import load_index
+    from screenshot_templates import SPEC_PATH
+    return [SPEC_PATH, *load_index().files]
+
+
+# === 데몬 ===
+
+class Watcher:
+    """임포트/폰트/컴파일된 레이어를 데운 채로 두고 저장될 때마다 영향받은 에셋만 렌더링"""
+
+    def __init__(self, device=None):
+        for name in MODULES:
+            importlib.import_module(name)
+        from screenshot_templates import DEFAULT_DEVICE
+        self.device = device or DEFAULT_DEVICE
+        self.graphs = {name: ModuleGraph(name) for name in MODULES}
+        self.data = {**spec_nodes(), **strings_node()}
+        self.mtimes = self._mtimes()
+        self.previews = {}      # 에셋 -> (PNG 바이트, 렌더 ms)
+        self.version = 0
+        self.error = None
+        self.changed = threading.Condition()
+
+    # --- 에셋 ---
+
+    def assets(self):
+        """[(에셋 이름, 모듈, 함수, 인자)] - 함수는 호출 시점에 모듈에서 찾으므로 다시 불러와도 유효"""
+        screens = sys.modules["generate_screenshots"].SCREENS
+        return [("icon", "generate_app_icon", "create_app_icon", (1024,)),
+                ("splash", "generate_splash", "create_splash_image", (400, 400))] + \
+               [(gen.__name__, "generate_screenshots", gen.__name__, (self.device,)) for _, gen in screens]
+
+    def closure(self, module, name):
+        """(모듈, 이름) 이 직간접으로 참조하는 모든 노드 (데이터 노드 포함)"""
+        graph = self.graphs[module]
+        seen = {("spec", s) for s in graph.strings.get(name, ()) if ("spec", s) in self.data}
+        stack = [(module, name)]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(DATA_OWNERS.get(node, []))
+            graph = self.graphs.get(node[0])
+            if graph is not None and node[1] in graph.refs:
+                stack.extend(graph.refs[node[1]])
+        return seen
+
+    # --- 감지 ---
+
+    def _watched(self):
+        return [g.path for g in self.graphs.values()] + data_files()
+
+    def _mtimes(self):
+        return {p: os.stat(p).st_mtime_ns for p in self._watched() if os.path.exists(p)}
+
+    def poll(self):
+        """바뀐 파일 -> (바뀐 노드 집합, 저장 시각) 또는 None"""
+        mtimes = self._mtimes()
+        touched = [p for p, m in mtimes.items() if self.mtimes.get(p) != m]
+        self.mtimes = mtimes
+        if not touched:
+            return None
+        saved_at = max(mtimes[p] for p in touched) / 1e9
+
+        changed, modules = set(), []
+        for name in MODULES:
+            if self.graphs[name].path not in touched:
+                continue
+            old = self.graphs[name]
+            new = ModuleGraph(name)
+            diff = {(name, n) for n in set(old.hashes) | set(new.hashes) if old.hashes.get(n) != new.hashes.get(n)}
+            self.graphs[name] = new
+            if diff:
+                changed |= diff
+                modules.append(name)
+
+        data = {**spec_nodes(), **strings_node()}
+        data_changed = {k for k in set(data) | set(self.data) if data.get(k) != self.data.get(k)}
+        self.data = data
+        self._reload(modules, data_changed)
+        return changed | data_changed, saved_at
+
+    def _reload(self, modules, data_changed):
+        """바뀐 모듈과 그것을 가져다 쓰는 모듈을 의존 순서대로 다시 불러오기"""
+        stale = set(modules)
+        for name in MODULES:
+            if stale & self.graphs[name].imports:
+                stale.add(name)
+        for name in MODULES:
+            if name in stale:
+                importlib.reload(sys.modules[name])
+        if data_changed:
+            templates = sys.modules["screenshot_templates"]
+            sys.modules["localization"].load_index.cache_clear()
+            templates.load_spec.cache_clear()
+            templates.compile_screen.cache_clear()
+
+    # --- 렌더링 ---
+
+    def render(self, module, func, args):
+        from asset_build import encode_png
+        start = time.perf_counter()
+        img = getattr(sys.modules[module], func)(*args)
+        data = encode_png(img, PREVIEW_PNG_PARAMS)
+        return data, (time.perf_counter() - start) * 1000
+
+    def update(self, names=None, saved_at=None):
+        """에셋 렌더링 (names=None 이면 전체) -> 미리보기 갱신 + 구독자 깨우기"""
+        self.error = None
+        for asset, module, func, args in self.assets():
+            if names is not None and asset not in names:
+                continue
+            try:
+                self.previews[asset] = self.render(module, func, args)
+            except Exception:
+                self.error = traceback.format_exc(limit=-3)
+                print(f"  ❌ {asset}: {self.error.strip().splitlines()[-1]}")
+                continue
+            # 에셋마다 바로 알림 - 여러 에셋이 바뀌어도 먼저 끝난 것부터 페이지에 반영
+            self._notify()
+            latency = f", save -> preview {(time.time() - saved_at) * 1000:.0f} ms" if saved_at else ""
+            print(f"  ✓ {asset} ({self.previews[asset][1]:.0f} ms{latency})")
+        if self.error:
+            self._notify()
+
+    def _notify(self):
+        with self.changed:
+            self.version += 1
+            self.changed.notify_all()
+
+    def step(self):
+        try:
+            result = self.poll()
+        except Exception:
+            # 저장 도중의 문법 오류 등 - 이전 렌더링을 유지하고 다음 저장을 기다림
+            self.error = traceback.format_exc(limit=-3)
+            self._notify()
+            print(f"  ❌ {self.error.strip().splitlines()[-1]}")
+            return
+        if result is None:
+            return
+        changed, saved_at = result
+        if not changed:
+            return
+        names = {asset for asset, module, func, _ in self.assets() if self.closure(module, func) & changed}
+        if names:
+            print(f"🔁 {', '.join(sorted(n for _, n in changed))} -> {', '.join(sorted(names))}")
+            self.update(names, saved_at)
+
+    def run(self):
+        while True:
+            self.step()
+            time.sleep(POLL_SECONDS)
+
+
+# === 미리보기 서버 ===
+
+PAGE = """<!doctype html>
+<meta charset="utf-8"><title>VoiceScheduler preview</title>
+<style>
+body {{ background: #0f1428; color: #dac080; font: 13px -apple-system, sans-serif; margin: 16px; }}
+main {{ display: flex; flex-wrap: wrap; gap: 16px; align-items: flex-start; }}
+figure {{ margin: 0; }} img {{ height: 420px; display: block; }}
+#error {{ white-space: pre-wrap; background: #400; color: #fcc; padding: 8px; display: none; }}
+</style>
+<pre id="error"></pre>
+<main>{figures}</main>
+<script>
+const events = new EventSource("/events");
+events.onmessage = (e) => {{
+  const msg = JSON.parse(e.data);
+  const err = document.getElementById("error");
+  err.textContent = msg.error || ""; err.style.display = msg.error ? "block" : "none";
+  for (const [name, ms] of Object.entries(msg.assets)) {{
+    const img = document.getElementById(name);
+    if (img && img.dataset.ms !== String(ms)) {{
+      img.src = "/asset/" + name + ".png?v=" + msg.version; img.dataset.ms = ms;
+      document.getElementById(name + "-ms").textContent = ms.toFixed(0) + " ms";
+    }}
+  }}
+}};
+</script>
+"""
+
+
+def make_handler(watcher):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, body, content_type):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/":
+                figures = "".join(
+                    f'<figure><img id="{html.escape(name)}" src="/asset/{html.escape(name)}.png">'
+                    f'<figcaption>{html.escape(name)} · <span id="{html.escape(name)}-ms"></span></figcaption></figure>'
+                    for name, *_ in watcher.assets())
+                self._send(PAGE.format(figures=figures).encode('utf-8'), "text/html; charset=utf-8")
+            elif path.startswith("/asset/") and path.endswith(".png"):
+                preview = watcher.previews.get(path[len("/asset/"):-4])
+                if preview is None:
+                    self.send_error(404)
+                else:
+                    self._send(preview[0], "image/png")
+            elif path == "/events":
+                self._events()
+            else:
+                self.send_error(404)
+
+        def _events(self):
+            """Server-Sent Events - 렌더링될 때마다 에셋별 렌더 시간(= 캐시 무효화 키) 전송"""
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            seen = -1
+            try:
+                while True:
+                    with watcher.changed:
+                        watcher.changed.wait_for(lambda: watcher.version != seen, timeout=15)
+                        seen = watcher.version
+                    msg = {"version": seen, "error": watcher.error,
+                           "assets": {name: round(ms, 1) for name, (_, ms) in watcher.previews.items()}}
+                    self.wfile.write(f"data: {json.dumps(msg)}\n\n".encode('utf-8'))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return Handler
+
+
+def serve(watcher, port):
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(watcher))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VoiceScheduler 에셋 감시 + 실시간 미리보기")
+    parser.add_argument("--port", type=int, default=8765, help="미리보기 서버 포트 (127.0.0.1)")
+    parser.add_argument("--device", help="스크린샷 기기 클래스 (기본 6.5)")
+    args = parser.parse_args()
+
+    print("🔥 데몬 준비 중 (임포트, 폰트, 첫 렌더링)...")
+    watcher = Watcher(args.device)
+    watcher.update()
+    serve(watcher, args.port)
+    print(f"👀 감시 중 - http://127.0.0.1:{args.port}/ (Ctrl+C 종료)")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print()
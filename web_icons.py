@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+VoiceScheduler Web Icons
+문서 사이트 아이콘 - 캐시된 1024 아이콘 마스터 하나에서 파비콘/애플 터치/PWA/OG 카드를 한 번에
+"""
+
+import io
+import os
+import struct
+
+from PIL import Image, ImageDraw
+
+import fonts
+import resize_plan
+import sdf_raster
+from asset_build import AssetBuild, FileInput, PNG_PARAMS, encode_json, fingerprint
+from gradient import linear_gradient
+from resize_plan import ResizePlan, render_plan
+
+DOCS_DIR = "docs"
+
+# 사이트 이름 / 색 (docs/index.html 과 같은 값)
+SITE_NAME = "VoiceScheduler"
+SITE_TAGLINE = "Speak & Schedule with AI"
+SITE_NAVY = (15, 20, 40)
+SITE_NAVY_LIGHT = (25, 32, 65)
+SITE_GOLD = (212, 175, 55)
+
+# (픽셀 크기, docs 상대 경로) - 같은 크기는 리사이즈 계획에서 한 번만 인코딩
+WEB_ICON_SIZES = [
+    (32, "favicon.png"),
+    (512, "icon.png"),
+    (180, "apple-touch-icon.png"),
+    (167, "apple-touch-icon-167x167.png"),
+    (152, "apple-touch-icon-152x152.png"),
+    (120, "apple-touch-icon-120x120.png"),
+    (192, "icon-192.png"),
+    (512, "icon-512.png"),
+]
+
+# favicon.ico 안의 PNG 항목 크기
+FAVICON_ICO_SIZES = [16, 32, 48]
+
+# PWA 매니페스트 아이콘
+MANIFEST_ICONS = ["icon-192.png", "icon-512.png"]
+
+# Open Graph 카드 (1200x630) - 왼쪽에 아이콘, 오른쪽에 이름/태그라인
+OG_SIZE = (1200, 630)
+OG_ICON = 360
+OG_GAP = 72
+OG_PATH = "og-card.png"
+
+# 아이콘 둥근 모서리 (generate_app_icon 의 corner_radius 비율)
+CORNER_RATIO = 0.22
+
+
+# === 출력 형식 ===
+
+def ico_bytes(pngs):
+    """[(크기, PNG 바이트)] -> PNG 압축 항목 ICO (모든 현행 브라우저 지원, 256px 은 0 으로 표기)"""
+    out = [struct.pack('<HHH', 0, 1, len(pngs))]
+    offset = 6 + 16 * len(pngs)
+    for size, png in pngs:
+        out.append(struct.pack('<BBBBHHII', size % 256, size % 256, 0, 0, 1, 32, len(png), offset))
+        offset += len(png)
+    out += [png for _, png in pngs]
+    return b''.join(out)
+
+
+def rounded(icon):
+    """정사각 아이콘 -> 둥근 모서리 밖이 투명한 RGBA (안티앨리어싱 마스크)"""
+    w, h = icon.size
+    mask = Image.new('L', icon.size, 0)
+    sdf_raster.Draw(mask).rounded_rectangle([0, 0, w - 1, h - 1], radius=w * CORNER_RATIO, fill=255)
+    out = icon.convert('RGBA')
+    out.putalpha(mask)
+    return out
+
+
+def fit(text, size, width, family="sans"):
+    """width 안에 들어갈 때까지 글자 크기를 줄인 레이아웃 (폰트마다 글자 폭이 달라서)"""
+    run = fonts.layout(text, size, family)
+    while run.width > width and size > 12:
+        size -= 2
+        run = fonts.layout(text, size, family)
+    return run
+
+
+def og_card(icon):
+    """OG 카드 - 사이트 네이비 그라데이션 + 둥근 아이콘 + 이름/태그라인"""
+    card = linear_gradient(OG_SIZE, SITE_NAVY, SITE_NAVY_LIGHT, mode='RGBA')
+    margin = (OG_SIZE[1] - OG_ICON) // 2
+    card.alpha_composite(rounded(icon), (margin, margin))
+
+    draw = ImageDraw.Draw(card)
+    x = margin + OG_ICON + OG_GAP
+    room = OG_SIZE[0] - x - OG_GAP
+    title = fit(SITE_NAME, 84, room, "sans-bold")
+    tagline = fit(SITE_TAGLINE, 40, room)
+    top = (OG_SIZE[1] - title.height - 36 - tagline.height) // 2
+    title.draw(draw, (x, top - title.bbox[1]), (255, 255, 255))
+    tagline.draw(draw, (x, top + title.height + 36 - tagline.bbox[1]), SITE_GOLD)
+    return card.convert('RGB')
+
+
+def manifest():
+    return {
+        "name": SITE_NAME,
+        "short_name": SITE_NAME,
+        "icons": [
+            {"src": name, "sizes": f"{size}x{size}", "type": "image/png"}
+            for size, name in WEB_ICON_SIZES if name in MANIFEST_ICONS
+        ],
+        "theme_color": "#%02x%02x%02x" % SITE_NAVY,
+        "background_color": "#%02x%02x%02x" % SITE_NAVY,
+        "display": "standalone",
+    }
+
+
+# === 빌드 ===
+
+def web_plan():
+    """아이콘 + ICO 항목 + OG 아이콘을 한 리사이즈 계획으로"""
+    return ResizePlan(WEB_ICON_SIZES
+                      + [(size, f"favicon.ico#{size}") for size in FAVICON_ICO_SIZES]
+                      + [(OG_ICON, OG_PATH)])
+
+
+def web_fingerprint(master_path):
+    """마스터 파일 내용 + 계획 + 출력 코드 + 폰트 - 파일별 지문은 여기에 이름을 더함"""
+    return fingerprint(FileInput(master_path), web_plan().targets, ico_bytes, rounded, fit, og_card, manifest,
+                       resize_plan, sdf_raster, fonts, *[FileInput(p) for p in fonts.font_files()], PNG_PARAMS)
+
+
+def save_web_icons(master_path, docs_dir=DOCS_DIR, build=None, jobs=1):
+    """docs/ 웹 아이콘 - 마스터 PNG 를 한 번 읽어 리사이즈 계획 한 번으로 전부, 내용이 바뀐 파일만 기록"""
+    build = build or AssetBuild()
+    names = [name for _, name in WEB_ICON_SIZES] + ["favicon.ico", OG_PATH, "site.webmanifest"]
+    base_fp = web_fingerprint(master_path)
+    fps = {name: fingerprint(base_fp, name) for name in names}
+    paths = {name: os.path.join(docs_dir, name) for name in names}
+    if build.all_fresh((paths[name], fps[name]) for name in names):
+        print("  ⏭ 웹 아이콘 변경 없음")
+        return
+
+    with Image.open(master_path) as im:
+        master = im.convert('RGB')
+    encoded = render_plan(master, web_plan(), jobs)
+
+    outputs = [(name, encoded[(size, size)]) for size, name in WEB_ICON_SIZES]
+    outputs.append(("favicon.ico", ico_bytes([(size, encoded[(size, size)]) for size in FAVICON_ICO_SIZES])))
+    og_icon = Image.open(io.BytesIO(encoded[(OG_ICON, OG_ICON)]))
+    outputs.append((OG_PATH, build.encode(og_card(og_icon))))
+    outputs.append(("site.webmanifest", encode_json(manifest())))
+
+    for name, data in outputs:
+        if build.write_bytes(paths[name], data, fps[name]):
+            print(f"  ✓ {docs_dir}/{name}")
+        else:
+            print(f"  = {docs_dir}/{name} (변경 없음)")